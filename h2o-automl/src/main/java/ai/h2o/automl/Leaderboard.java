@@ -5,6 +5,7 @@ import water.*;
 import water.api.schemas3.KeyV3;
 import water.exceptions.H2OIllegalArgumentException;
 import water.fvec.Frame;
+import water.fvec.Vec;
 import water.util.ArrayUtils;
 import water.util.IcedHashMap;
 import water.util.Log;
@@ -667,6 +668,42 @@ public class Leaderboard extends Keyed<Leaderboard> {
     return table;
   }
 
+  /**
+   * Materialize the leaderboard as a Frame, with the same columns as {@link #toTwoDimTable()}: the model ids
+   * (as strings) followed by the metrics (as numbers, not rounded).  The Frame is stored in the DKV under
+   * the given key; it is a snapshot and will not be updated as models are added to the leaderboard.
+   */
+  public Frame toFrame(Key<Frame> frameKey) {
+    String[] modelIds = new String[models.length];
+    for (int i = 0; i < models.length; i++)
+      modelIds[i] = models[i].toString();
+
+    String[] names;
+    double[][] metrics;
+    if (sort_metric == null) { // no models yet
+      names = new String[] {"model_id"};
+      metrics = new double[0][];
+    } else if (sort_metric.equals("mean_per_class_error")) { //Multinomial case
+      names = colHeadersMult(sort_metric);
+      metrics = new double[][] {sort_metrics};
+    } else if (sort_metric.equals("auc")) { //Binomial case
+      names = colHeaders(sort_metric, other_metrics);
+      metrics = new double[][] {sort_metrics, logloss};
+    } else { //Regression
+      names = colHeaders(sort_metric, other_metrics);
+      metrics = new double[][] {sort_metrics, rmse, mae, rmsle};
+    }
+
+    Key<Vec>[] vecKeys = Vec.VectorGroup.VG_LEN1.addVecs(metrics.length + 1);
+    Vec[] vecs = new Vec[metrics.length + 1];
+    vecs[0] = Vec.makeVec(modelIds, vecKeys[0]);
+    for (int i = 0; i < metrics.length; i++)
+      vecs[i + 1] = Vec.makeVec(metrics[i], vecKeys[i + 1]);
+    Frame fr = new Frame(frameKey, names, vecs);
+    DKV.put(fr);
+    return fr;
+  }
+
   //private static final SimpleDateFormat timestampFormat = new SimpleDateFormat("HH:mm:ss.SSS");
 
   //public static String toString(String project_name, Model[] models, String fieldSeparator, String lineSeparator, boolean includeTitle, boolean includeHeader, boolean includeTimestamp) {
@@ -29,6 +29,10 @@ public class RegisterRestApi extends AbstractRegister {
     context.registerEndpoint("leaderboard",
             "GET /99/Leaderboards/{project_name}", LeaderboardsHandler.class, "fetch",
             "Return the AutoML leaderboard for the given project.");
+
+    context.registerEndpoint("leaderboard_frame",
+            "POST /99/Leaderboards/{project_name}/frame", LeaderboardsHandler.class, "toFrame",
+            "Save the AutoML leaderboard for the given project as a new frame.");
   }
 
   @Override
@@ -3,11 +3,13 @@ package water.automl.api;
 import ai.h2o.automl.Leaderboard;
 import water.*;
 import water.api.Handler;
+import water.api.schemas3.KeyV3;
 import water.automl.api.schemas3.LeaderboardV99;
 import water.automl.api.schemas3.LeaderboardsV99;
 import water.exceptions.H2OIllegalArgumentException;
 import water.exceptions.H2OKeyNotFoundArgumentException;
 import water.exceptions.H2OKeyWrongTypeArgumentException;
+import water.fvec.Frame;
 
 public class LeaderboardsHandler extends Handler {
   /** Class which contains the internal representation of the leaderboards list and params. */
@@ -49,6 +51,19 @@ public class LeaderboardsHandler extends Handler {
       return new LeaderboardV99().fillFromImpl(getFromDKV("project_name", Leaderboard.idForProject(s.project_name)));
   }
 
+  /** Return the Leaderboard for the given project, along with a new Frame holding its contents. */
+  @SuppressWarnings("unused") // called through reflection by RequestServer
+  public LeaderboardV99 toFrame(int version, LeaderboardsV99 s) {
+    if (null == s.project_name)
+      throw new H2OKeyNotFoundArgumentException("Client must specify a project_name.");
+
+    Leaderboard leaderboard = getFromDKV("project_name", Leaderboard.idForProject(s.project_name));
+    LeaderboardV99 schema = new LeaderboardV99().fillFromImpl(leaderboard);
+    Frame fr = leaderboard.toFrame(Key.<Frame>make(leaderboard._key + "_frame_" + Key.rand()));
+    schema.table_frame = new KeyV3.FrameKeyV3(fr._key);
+    return schema;
+  }
+
   // TODO: almost identical to ModelsHandler; refactor
   public static Leaderboard getFromDKV(String param_name, String key_str) {
     return getFromDKV(param_name, Key.make(key_str));
@@ -49,5 +49,11 @@ public class LeaderboardV99 extends Schema<Leaderboard, LeaderboardV99> {
    */
   @API(help="Metric direction used in the sort", direction=API.Direction.INOUT)
   public boolean sort_decreasing;
+
+  /**
+   * Snapshot of this leaderboard as a Frame; only filled in by POST /99/Leaderboards/{project_name}/frame.
+   */
+  @API(help="Snapshot of this leaderboard as a Frame (only returned when the Frame is requested)", direction=API.Direction.OUTPUT)
+  public KeyV3.FrameKeyV3 table_frame;
 }
 
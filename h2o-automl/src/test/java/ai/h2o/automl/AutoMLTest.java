@@ -7,6 +7,9 @@ import water.fvec.Frame;
 
 import java.util.Date;
 
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+
 public class AutoMLTest extends TestUtil {
 
   @BeforeClass public static void setup() { stall_till_cloudsize(1); }
@@ -32,4 +35,35 @@ public class AutoMLTest extends TestUtil {
       if(fr != null) fr.remove();
     }
   }
+
+  @Test public void LeaderboardFrameTest() {
+    AutoML aml=null;
+    Frame fr=null;
+    Frame lbFrame=null;
+    try {
+      AutoMLBuildSpec autoMLBuildSpec = new AutoMLBuildSpec();
+      fr = parse_test_file("./smalldata/logreg/prostate_train.csv");
+      autoMLBuildSpec.input_spec.training_frame = fr._key;
+      autoMLBuildSpec.input_spec.response_column = "AGE";
+      autoMLBuildSpec.build_control.stopping_criteria.set_max_runtime_secs(5);
+
+      aml = AutoML.makeAutoML(Key.<AutoML>make(), new Date(), autoMLBuildSpec);
+      AutoML.startAutoML(aml);
+      aml.get();
+
+      Leaderboard lb = aml.leaderboard();
+      lbFrame = lb.toFrame(Key.<Frame>make());
+      assertArrayEquals(new String[]{"model_id", "mean_residual_deviance", "rmse", "mae", "rmsle"}, lbFrame.names());
+      assertEquals(lb.sort_metrics.length, lbFrame.numRows());
+      for (int i = 0; i < lbFrame.numRows(); i++) {
+        assertEquals(lb.getModelKeys()[i].toString(), lbFrame.vec(0).stringAt(i));
+        assertEquals(lb.sort_metrics[i], lbFrame.vec(1).at(i), 0);
+        assertEquals(lb.rmse[i], lbFrame.vec(2).at(i), 0);
+      }
+    } finally {
+      if(lbFrame != null) lbFrame.delete();
+      if(aml!=null) aml.deleteWithChildren();
+      if(fr != null) fr.remove();
+    }
+  }
 }
@@ -466,13 +466,22 @@ def gen_init(modules):
     yield "# This file is auto-generated by h2o-3/h2o-bindings/bin/gen_python.py"
     yield "# Copyright 2016 H2O.ai;  Apache License Version 2.0 (see LICENSE for details)"
     yield "#"
+    yield "from h2o.utils.shared_utils import lazy_attributes"
+    yield ""
+    yield "# The estimator modules are imported on first use"
+    yield "__getattr__ = lazy_attributes(__name__, {"
     module_strs = []
+    submodules = []
     for module, clz, category in sorted(modules):
         if clz == "H2OGridSearch": continue
         module_strs.append('"%s"' % clz)
         if clz == "H2OAutoML": continue
         module_strs.append('"%s"' % clz)
-        yield "from .%s import %s" % (module, clz)
+        yield '    "%s": ".%s",' % (clz, module)
+        if module not in submodules: submodules.append(module)
+    yield "}, submodules=("
+    yield bi.wrap(", ".join('"%s"' % m for m in submodules), indent="    ")
+    yield "))"
     yield ""
     yield "__all__ = ("
     yield bi.wrap(", ".join(module_strs), indent="    ")
@@ -0,0 +1,251 @@
+package hex;
+
+import jsr166y.CountedCompleter;
+import water.*;
+import water.H2O.H2OCountedCompleter;
+import water.fvec.*;
+import water.util.ArrayUtils;
+import water.util.RandomUtils;
+
+/**
+ * Frame splitter assigning each row of the dataset at random to one of the output frames.
+ *
+ * <p>All the output frames are written by a single pass over the dataset, and the rows keep their original order
+ * inside each output frame. Depending on the split method, rows are assigned as follows:</p>
+ * <ul>
+ * <li><code>random</code>: a row goes to the i-th split if its uniform random number (the number that
+ * <code>h2o.runif(dataset, seed)</code> gives for the row) falls between the (i-1)-th and i-th cumulative ratios.
+ * The sizes of the splits are only approximately proportional to the ratios.</li>
+ * <li><code>exact</code>: each chunk of the dataset contributes a fixed number of its rows, picked at random, to each
+ * split, such that the sizes of the splits are exactly the ratios times the number of rows (rounded).</li>
+ * <li><code>stratified</code>: as <code>exact</code>, but separately for each level of a categorical column (missing
+ * values form a level of their own), so that every split has the same distribution of the column.</li>
+ * </ul>
+ */
+public class RandomFrameSplitter extends H2OCountedCompleter<RandomFrameSplitter> {
+  /** Dataset to split */
+  final Frame dataset;
+  /** Split ratios - resulting number of split is ratios.length+1 */
+  final double[] ratios;
+  /** Destination keys for each output frame split. */
+  final Key<Frame>[] destKeys;
+  /** How rows are assigned to the splits */
+  final SplitFrame.SplitMethod method;
+  /** Seed of the random assignment */
+  final long seed;
+  /** Index of the column to stratify by, or -1 */
+  final int stratifyCol;
+  /** Optional job key */
+  final Key<Job> jobKey;
+
+  /** Output frames for each output split part */
+  private Frame[] splits;
+
+  public RandomFrameSplitter(Frame dataset, double[] ratios, Key<Frame>[] destKeys, SplitFrame.SplitMethod method,
+                             long seed, int stratifyCol, Key<Job> jobKey) {
+    assert ratios.length > 0 : "No ratio specified!";
+    assert destKeys != null && destKeys.length == ratios.length+1 : "Unexpected number of destination keys.";
+    assert method != SplitFrame.SplitMethod.contiguous : "Contiguous splits are made by FrameSplitter.";
+    assert (method == SplitFrame.SplitMethod.stratified) == (stratifyCol >= 0) : "Stratified split needs a column.";
+    this.dataset = dataset;
+    this.ratios = ratios;
+    this.destKeys = destKeys;
+    this.method = method;
+    this.seed = seed;
+    this.stratifyCol = stratifyCol;
+    this.jobKey = jobKey;
+  }
+
+  @Override public void compute2() {
+    dataset.read_lock(jobKey);
+
+    final int ncols = dataset.numCols();
+    final int nsplits = ratios.length + 1;
+    final double[] bounds = new double[ratios.length];
+    double last = 0;
+    for (int i = 0; i < ratios.length; i++) bounds[i] = last = last + ratios[i];
+
+    int[][][] quotas = method == SplitFrame.SplitMethod.random ? null : computeQuotas(bounds);
+    byte[] types = new byte[ncols * nsplits];
+    for (int s = 0; s < nsplits; s++)
+      for (int j = 0; j < ncols; j++)
+        types[s * ncols + j] = dataset.vec(j).get_type();
+    SplitTask task = new SplitTask(bounds, seed, quotas, stratifyCol, ncols, jobKey).doAll(types, dataset);
+
+    // Every split gets its own row layout, so the split frames are assembled here rather than by outputFrame()
+    AppendableVec[] avs = task.appendables();
+    String[][] domains = dataset.domains();
+    Futures fs = new Futures();
+    splits = new Frame[nsplits];
+    for (int s = 0; s < nsplits; s++) {
+      Vec[] vecs = new Vec[ncols];
+      int rowLayout = avs[s * ncols].compute_rowLayout();
+      for (int j = 0; j < ncols; j++) {
+        avs[s * ncols + j].setDomain(domains[j]);
+        vecs[j] = avs[s * ncols + j].close(rowLayout, fs);
+      }
+      splits[s] = new Frame(destKeys[s], dataset.names(), vecs);
+    }
+    fs.blockForPending();
+    for (Frame split : splits)
+      split.delete_and_lock(jobKey);
+    tryComplete();
+  }
+
+  /** Blocking call to obtain a result of computation. */
+  public Frame[] getResult() {
+    join();
+    return splits;
+  }
+
+  @Override public void onCompletion(CountedCompleter caller) {
+    dataset.unlock(jobKey);
+    if (splits != null)
+      for (Frame s : splits)
+        if (s != null)
+          s.update(jobKey).unlock(jobKey);
+  }
+  @Override public boolean onExceptionalCompletion(Throwable ex, CountedCompleter caller) {
+    dataset.unlock(jobKey);
+    Futures fs = new Futures();
+    if (splits != null)
+      for (Frame s : splits)
+        if (s != null)
+          s.unlock(jobKey).delete(jobKey, fs);
+    fs.blockForPending();
+    return true;
+  }
+
+  /**
+   * Number of rows of each level that each chunk gives to each split: <code>quotas[chunk][level][split]</code>.
+   *
+   * <p>For every level, the splits take consecutive ranges of the level's rows (counted over the chunks in order),
+   * with the range boundaries rounded to whole rows. This makes the total size of each split exact, and the
+   * contribution of each chunk proportional to its size.</p>
+   */
+  private int[][][] computeQuotas(double[] bounds) {
+    long[] espc = dataset.anyVec().espc();
+    int nchunks = espc.length - 1;
+    long[][] counts;
+    if (stratifyCol >= 0) {
+      counts = new CountLevelsTask(dataset.vec(stratifyCol).cardinality() + 1).doAll(dataset.vec(stratifyCol))._counts;
+    } else {
+      counts = new long[nchunks][1];
+      for (int c = 0; c < nchunks; c++) counts[c][0] = espc[c + 1] - espc[c];
+    }
+    int nlevels = counts.length == 0 ? 0 : counts[0].length;
+    int[][][] quotas = new int[nchunks][nlevels][bounds.length + 1];
+    for (int k = 0; k < nlevels; k++) {
+      long start = 0;
+      for (int c = 0; c < nchunks; c++) {
+        long end = start + counts[c][k];
+        long prev = 0;
+        for (int s = 0; s < bounds.length; s++) {
+          long taken = Math.round(end * bounds[s]) - Math.round(start * bounds[s]);
+          quotas[c][k][s] = (int) (taken - prev);
+          prev = taken;
+        }
+        quotas[c][k][bounds.length] = (int) (end - start - prev);
+        start = end;
+      }
+    }
+    return quotas;
+  }
+
+  /** Counts the rows of each level of a categorical column in each chunk; missing values are the last level. */
+  private static class CountLevelsTask extends MRTask<CountLevelsTask> {
+    final int _nlevels;
+    long[][] _counts; // [chunk][level], each chunk's row is filled by the node holding the chunk
+    CountLevelsTask(int nlevels) { _nlevels = nlevels; }
+    @Override protected void setupLocal() { _counts = new long[_fr.anyVec().nChunks()][_nlevels]; }
+    @Override public void map(Chunk c) {
+      long[] counts = _counts[c.cidx()];
+      for (int i = 0; i < c._len; i++)
+        counts[c.isNA(i) ? _nlevels - 1 : (int) c.at8(i)]++;
+    }
+    @Override public void reduce(CountLevelsTask t) {
+      if (_counts != t._counts) ArrayUtils.add(_counts, t._counts);
+    }
+  }
+
+  /** Assigns every row to a split, and copies it to that split's output columns. */
+  private static class SplitTask extends MRTask<SplitTask> {
+    final double[] _bounds;
+    final long _seed;
+    final int[][][] _quotas;
+    final int _stratifyCol;
+    final int _ncols;
+    final Key<Job> _jobKey;
+
+    SplitTask(double[] bounds, long seed, int[][][] quotas, int stratifyCol, int ncols, Key<Job> jobKey) {
+      _bounds = bounds;
+      _seed = seed;
+      _quotas = quotas;
+      _stratifyCol = stratifyCol;
+      _ncols = ncols;
+      _jobKey = jobKey;
+    }
+
+    @Override public void map(Chunk[] cs, NewChunk[] ncs) {
+      int len = cs[0]._len;
+      int[] split = _quotas == null ? splitByBounds(cs[0].start(), len) : splitByQuotas(cs);
+      int nsplits = _bounds.length + 1;
+      int[] sizes = new int[nsplits];
+      for (int s : split) sizes[s]++;
+      int[][] rows = new int[nsplits][];
+      for (int s = 0; s < nsplits; s++) rows[s] = new int[sizes[s]];
+      int[] filled = new int[nsplits];
+      for (int i = 0; i < len; i++)
+        rows[split[i]][filled[split[i]]++] = i;
+      for (int s = 0; s < nsplits; s++)
+        for (int j = 0; j < _ncols; j++)
+          cs[j].extractRows(ncs[s * _ncols + j], rows[s]);
+      if (_jobKey != null) Job.update(1, _jobKey);  // one unit of work per chunk
+    }
+
+    /** Same random numbers as {@link Vec#makeRand(long)}: deterministic per row, whatever the chunk layout. */
+    private int[] splitByBounds(long start, int len) {
+      int[] split = new int[len];
+      RandomUtils.PCGRNG rng = new RandomUtils.PCGRNG(start, 1);
+      for (int i = 0; i < len; i++) {
+        rng.setSeed(_seed + start + i);
+        double r = rng.nextFloat();
+        int s = 0;
+        while (s < _bounds.length && r > _bounds[s]) s++;
+        split[i] = s;
+      }
+      return split;
+    }
+
+    /** Shuffle the rows of each level, and deal them out to the splits according to the chunk's quotas. */
+    private int[] splitByQuotas(Chunk[] cs) {
+      int len = cs[0]._len;
+      int[][] quotas = _quotas[cs[0].cidx()];
+      int nlevels = quotas.length;
+      int[] levels = new int[len];
+      int[] sizes = new int[nlevels];
+      if (_stratifyCol >= 0) {
+        Chunk c = cs[_stratifyCol];
+        for (int i = 0; i < len; i++) sizes[levels[i] = c.isNA(i) ? nlevels - 1 : (int) c.at8(i)]++;
+      } else {
+        sizes[0] = len;
+      }
+      int[][] rows = new int[nlevels][];
+      for (int k = 0; k < nlevels; k++) rows[k] = new int[sizes[k]];
+      int[] filled = new int[nlevels];
+      for (int i = 0; i < len; i++)
+        rows[levels[i]][filled[levels[i]]++] = i;
+
+      int[] split = new int[len];
+      RandomUtils.PCGRNG rng = new RandomUtils.PCGRNG(_seed, cs[0].cidx());
+      for (int k = 0; k < nlevels; k++) {
+        ArrayUtils.shuffleArray(rows[k], rng);
+        int i = 0;
+        for (int s = 0; s < quotas[k].length; s++)
+          for (int q = 0; q < quotas[k][s]; q++)
+            split[rows[k][i++]] = s;
+      }
+      return split;
+    }
+  }
+}
@@ -4,6 +4,8 @@ import water.*;
 import water.fvec.*;
 import water.util.ArrayUtils;
 
+import java.util.Random;
+
 import static water.util.FrameUtils.generateNumKeys;
 
 /**
@@ -19,6 +21,14 @@ public class SplitFrame extends Transformer<SplitFrame.Frames> {
   public double[] _ratios;
   /** Output destination keys. */
   public Key<Frame>[] _destination_frames;
+  /** How the rows are assigned to the splits (see {@link RandomFrameSplitter} for the random methods). */
+  public SplitMethod _method = SplitMethod.contiguous;
+  /** Seed for the random split methods; -1 to pick a random seed. */
+  public long _seed = -1;
+  /** Categorical column to stratify by, for the stratified method. */
+  public String _stratify_by;
+
+  public enum SplitMethod { contiguous, random, exact, stratified }
 
   public SplitFrame(Frame dataset, double[] ratios, Key<Frame>[] destination_frames) {
     this();
@@ -36,9 +46,6 @@ public class SplitFrame extends Transformer<SplitFrame.Frames> {
       if (r <= 0.0) new IllegalArgumentException("Ratio must be > 0!");
     if (_ratios.length == 1)
       if( _ratios[0] < 0.0 || _ratios[0] > 1.0 )  throw new IllegalArgumentException("Ratio must be between 0 and 1!");
-    if (_destination_frames != null &&
-            !((_ratios.length == 1 && _destination_frames.length == 2) || (_ratios.length == _destination_frames.length)))
-                                throw new IllegalArgumentException("Number of destination keys has to match to a number of split ratios!");
     // If array of ratios is given scale them and take first n-1 and pass them to FrameSplitter
     final double[] computedRatios;
     if (_ratios.length > 1) {
@@ -53,9 +60,25 @@ public class SplitFrame extends Transformer<SplitFrame.Frames> {
       computedRatios = _ratios;
     }
 
+    if (_destination_frames != null && _destination_frames.length != computedRatios.length + 1)
+                                throw new IllegalArgumentException("Number of destination keys has to match to a number of split ratios!");
     // Create destination keys if not specified
     if (_destination_frames == null) _destination_frames = generateNumKeys(_dataset._key, computedRatios.length+1);
 
+    if (_method != SplitMethod.contiguous) {
+      int stratifyCol = -1;
+      if (_method == SplitMethod.stratified) {
+        stratifyCol = _dataset.find(_stratify_by);
+        if (stratifyCol < 0) throw new IllegalArgumentException("Column to stratify by not found: " + _stratify_by);
+        if (!_dataset.vec(stratifyCol).isCategorical())
+          throw new IllegalArgumentException("Column to stratify by has to be categorical: " + _stratify_by);
+      }
+      long seed = _seed == -1 ? new Random().nextLong() : _seed;
+      RandomFrameSplitter rfs = new RandomFrameSplitter(_dataset, computedRatios, _destination_frames, _method, seed,
+                                                        stratifyCol, _job._key);
+      return _job.start(rfs, _dataset.anyVec().nChunks());  // progress is updated for each chunk split
+    }
+
     FrameSplitter fs = new FrameSplitter(_dataset, computedRatios, _destination_frames, _job._key);
     return _job.start(fs, computedRatios.length + 1);
   }
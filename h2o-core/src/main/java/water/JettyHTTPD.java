@@ -8,6 +8,7 @@ import org.eclipse.jetty.server.handler.HandlerWrapper;
 import org.eclipse.jetty.servlet.ServletContextHandler;
 import water.api.DatasetServlet;
 import water.api.NpsBinServlet;
+import water.api.PostFilePartServlet;
 import water.api.PostFileServlet;
 import water.api.PutKeyServlet;
 import water.api.RequestServer;
@@ -111,6 +112,7 @@ public class JettyHTTPD extends AbstractHTTPD {
     context.addServlet(NpsBinServlet.class,   "/3/NodePersistentStorage.bin/*");
     context.addServlet(PostFileServlet.class, "/3/PostFile.bin");
     context.addServlet(PostFileServlet.class, "/3/PostFile");
+    context.addServlet(PostFilePartServlet.class, "/3/PostFilePart");
     context.addServlet(DatasetServlet.class,  "/3/DownloadDataset");
     context.addServlet(DatasetServlet.class,  "/3/DownloadDataset.bin");
     context.addServlet(PutKeyServlet.class,   "/3/PutKey.bin");
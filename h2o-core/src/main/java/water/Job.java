@@ -356,6 +356,26 @@ public final class Job<T extends Keyed> extends Keyed<Job> {
     return _result==null ? null : _result.get(); 
   }
 
+  /** Blocks until the Job stops, but for at most {@code timeout_ms} milliseconds.  Unlike {@link #get()} this also
+   *  works on a copy of the Job fetched from the DKV (e.g. by the REST API), as it watches the Job's state in the DKV.
+   *  @return true if the Job has stopped */
+  public boolean waitForStop(long timeout_ms) {
+    long deadline = System.currentTimeMillis() + timeout_ms;
+    long sleep = 1;
+    while (!isStopped()) {
+      long left = deadline - System.currentTimeMillis();
+      if (left <= 0) return false;
+      try {
+        Thread.sleep(Math.min(sleep, left));
+      } catch (InterruptedException e) {
+        Thread.currentThread().interrupt();
+        return isStopped();
+      }
+      sleep = Math.min(2 * sleep, 20); // Checking the local copy of the Job is cheap, keep the latency low
+    }
+    return true;
+  }
+
   // --------------
   // Atomic State Updaters.  Atomically change state on the home node.  They
   // also update the *this* object from the freshest remote state, meaning the
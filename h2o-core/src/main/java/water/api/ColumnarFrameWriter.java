@@ -0,0 +1,193 @@
+package water.api;
+
+import com.google.gson.Gson;
+import water.H2O;
+import water.Key;
+import water.fvec.Chunk;
+import water.fvec.Frame;
+import water.fvec.Vec;
+import water.parser.BufferedString;
+import water.util.PrettyPrint;
+import water.util.StringUtils;
+
+import java.io.IOException;
+import java.io.OutputStream;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.ArrayList;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Writes a frame in a typed, column-major binary layout, so that clients can load it without any text parsing.
+ *
+ * The layout is (all numbers are little-endian):
+ * <pre>
+ *   "H2OC"                          magic
+ *   int32                           length of the header
+ *   UTF-8 JSON header               {"nrows": N, "columns": [{"name": ..., "type": ..., "domain": [...]}, ...]}
+ *   column data, for each column:
+ *     real                          N float64 values (NaN for NA)
+ *     int / time                    N int64 values (0 for NA; time is in milliseconds since the epoch), followed by
+ *                                   an NA bitmap of ceil(N / 8) bytes (bit i % 8 of byte i / 8 is set if row i is NA)
+ *     enum                          N int32 category codes (-1 for NA)
+ *     string / uuid                 N int32 byte lengths (-1 for NA), followed by the concatenated UTF-8 bytes
+ * </pre>
+ */
+public class ColumnarFrameWriter {
+
+  public static final String CONTENT_TYPE = "application/x-h2o-columnar";
+  private static final byte[] MAGIC = StringUtils.bytesOf("H2OC");
+
+  private final Frame _fr;
+  private final long _rowOffset;
+  private final long _rowCount;
+
+  /**
+   * @param fr frame to write
+   * @param rowOffset first row to write
+   * @param rowCount number of rows to write, or -1 for all rows following rowOffset
+   */
+  public ColumnarFrameWriter(Frame fr, long rowOffset, long rowCount) {
+    long nrows = fr.numRows();
+    if (rowOffset < 0 || rowOffset > nrows)
+      throw new IllegalArgumentException("Row offset " + rowOffset + " is out of range [0, " + nrows + "]");
+    _fr = fr;
+    _rowOffset = rowOffset;
+    _rowCount = rowCount < 0 ? nrows - rowOffset : Math.min(rowCount, nrows - rowOffset);
+  }
+
+  public void writeTo(OutputStream os) throws IOException {
+    byte[] header = StringUtils.bytesOf(new Gson().toJson(header()));
+    os.write(MAGIC);
+    os.write(le(4).putInt(header.length).array());
+    os.write(header);
+    for (Vec v : _fr.vecs()) {
+      if (v.isCategorical()) writeCategorical(v, os);
+      else if (v.isString() || v.isUUID()) writeStrings(v, os);
+      else if (v.isInt() || v.isTime()) writeIntegers(v, os);
+      else writeNumeric(v, os);
+    }
+    os.flush();
+  }
+
+  private Map<String, Object> header() {
+    List<Map<String, Object>> columns = new ArrayList<>();
+    for (int i = 0; i < _fr.numCols(); i++) {
+      Vec v = _fr.vec(i);
+      Map<String, Object> col = new LinkedHashMap<>();
+      col.put("name", _fr.name(i));
+      col.put("type", v.isCategorical() ? "enum" : v.isUUID() ? "uuid" : v.isString() ? "string" :
+                      v.isTime() ? "time" : v.isInt() ? "int" : "real");
+      if (v.isCategorical()) col.put("domain", v.domain());
+      columns.add(col);
+    }
+    Map<String, Object> header = new LinkedHashMap<>();
+    header.put("nrows", _rowCount);
+    header.put("columns", columns);
+    return header;
+  }
+
+  private void writeNumeric(Vec v, OutputStream os) throws IOException {
+    for (int cidx = firstChunk(v); cidx <= lastChunk(v); cidx++) {
+      Chunk c = v.chunkForChunkIdx(cidx);
+      int from = fromRow(c), to = toRow(c);
+      ByteBuffer bb = le(8 * (to - from));
+      for (int row = from; row < to; row++)
+        bb.putDouble(c.atd(row));
+      os.write(bb.array());
+      release(v, cidx);
+    }
+  }
+
+  /** Integers are written as longs (doubles would round the values above 2^53), with the NAs in a bitmap. */
+  private void writeIntegers(Vec v, OutputStream os) throws IOException {
+    byte[] nas = new byte[(int) ((_rowCount + 7) / 8)];
+    int i = 0;
+    for (int cidx = firstChunk(v); cidx <= lastChunk(v); cidx++) {
+      Chunk c = v.chunkForChunkIdx(cidx);
+      int from = fromRow(c), to = toRow(c);
+      ByteBuffer bb = le(8 * (to - from));
+      for (int row = from; row < to; row++, i++) {
+        if (c.isNA(row)) {
+          nas[i >> 3] |= 1 << (i & 7);
+          bb.putLong(0);
+        } else {
+          bb.putLong(c.at8(row));
+        }
+      }
+      os.write(bb.array());
+      release(v, cidx);
+    }
+    os.write(nas);
+  }
+
+  private void writeCategorical(Vec v, OutputStream os) throws IOException {
+    for (int cidx = firstChunk(v); cidx <= lastChunk(v); cidx++) {
+      Chunk c = v.chunkForChunkIdx(cidx);
+      int from = fromRow(c), to = toRow(c);
+      ByteBuffer bb = le(4 * (to - from));
+      for (int row = from; row < to; row++)
+        bb.putInt(c.isNA(row) ? -1 : (int) c.at8(row));
+      os.write(bb.array());
+      release(v, cidx);
+    }
+  }
+
+  private void writeStrings(Vec v, OutputStream os) throws IOException {
+    // First pass writes the lengths of all values, second pass the values themselves. This lets the client slice
+    // the values without scanning them.
+    BufferedString tmpStr = new BufferedString();
+    for (int pass = 0; pass < 2; pass++) {
+      for (int cidx = firstChunk(v); cidx <= lastChunk(v); cidx++) {
+        Chunk c = v.chunkForChunkIdx(cidx);
+        int from = fromRow(c), to = toRow(c);
+        ByteBuffer bb = pass == 0 ? le(4 * (to - from)) : null;
+        for (int row = from; row < to; row++) {
+          byte[] value = stringBytes(v, c, row, tmpStr);
+          if (pass == 0) bb.putInt(value == null ? -1 : value.length);
+          else if (value != null) os.write(value);
+        }
+        if (pass == 0) os.write(bb.array());
+        if (pass == 1) release(v, cidx);
+      }
+    }
+  }
+
+  private static byte[] stringBytes(Vec v, Chunk c, int row, BufferedString tmpStr) {
+    if (c.isNA(row)) return null;
+    if (v.isUUID()) return StringUtils.bytesOf(PrettyPrint.UUID(c.at16l(row), c.at16h(row)));
+    BufferedString bs = c.atStr(tmpStr, row);
+    byte[] value = new byte[bs.length()];
+    System.arraycopy(bs.getBuffer(), bs.getOffset(), value, 0, value.length);
+    return value;
+  }
+
+  private int firstChunk(Vec v) {
+    return _rowCount == 0 ? 0 : v.elem2ChunkIdx(_rowOffset);
+  }
+
+  private int lastChunk(Vec v) {
+    return _rowCount == 0 ? -1 : v.elem2ChunkIdx(_rowOffset + _rowCount - 1);
+  }
+
+  private int fromRow(Chunk c) {
+    return (int) Math.max(_rowOffset - c.start(), 0);
+  }
+
+  private int toRow(Chunk c) {
+    return (int) Math.min(_rowOffset + _rowCount - c.start(), c._len);
+  }
+
+  /** Drop the local copy of a remote chunk once it was written out (same as Frame.CSVStream). */
+  private static void release(Vec v, int cidx) {
+    Key k = v.chunkKey(cidx);
+    if (!k.home()) H2O.raw_remove(k);
+  }
+
+  private static ByteBuffer le(int size) {
+    return ByteBuffer.allocate(size).order(ByteOrder.LITTLE_ENDIAN);
+  }
+
+}
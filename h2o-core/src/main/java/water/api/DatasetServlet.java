@@ -11,6 +11,7 @@ import javax.servlet.http.HttpServletResponse;
 import java.io.IOException;
 import java.io.InputStream;
 import java.io.OutputStream;
+import java.util.zip.GZIPOutputStream;
 
 /**
  */
@@ -31,8 +32,20 @@ public class DatasetServlet extends HttpServlet {
       }
 
       Frame dataset = DKV.getGet(f_name);
+      String rowOffsetParam = request.getParameter("row_offset");
+      String rowCountParam = request.getParameter("row_count");
+      long rowOffset = rowOffsetParam == null ? 0 : Long.parseLong(rowOffsetParam);
+      long rowCount = rowCountParam == null ? -1 : Long.parseLong(rowCountParam);
+      if ("columnar".equals(request.getParameter("format"))) {
+        ColumnarFrameWriter writer = new ColumnarFrameWriter(dataset, rowOffset, rowCount);
+        response.setContentType(ColumnarFrameWriter.CONTENT_TYPE);
+        JettyHTTPD.setResponseStatus(response, HttpServletResponse.SC_OK);
+        writer.writeTo(response.getOutputStream());
+        return;
+      }
       // TODO: Find a way to determing the hex_string parameter. It should not always be false
-      InputStream is = dataset.toCSV(true, use_hex);
+      boolean header = !"false".equalsIgnoreCase(request.getParameter("header"));
+      InputStream is = dataset.toCSV(header, use_hex, rowOffset, rowCount);
       response.setContentType("application/octet-stream");
       // Clean up the file name
       int x = f_name.length() - 1;
@@ -46,9 +59,17 @@ public class DatasetServlet extends HttpServlet {
         suggested_fname = suggested_fname + ".csv";
       f_name = suggested_fname;
       response.addHeader("Content-Disposition", "attachment; filename=" + f_name);
+      boolean gzip = "gzip".equals(request.getParameter("compression"));
+      if (gzip) response.addHeader("Content-Encoding", "gzip");
       JettyHTTPD.setResponseStatus(response, HttpServletResponse.SC_OK);
       OutputStream os = response.getOutputStream();
-      water.util.FileUtils.copyStream(is, os, 2048);
+      if (gzip) {
+        GZIPOutputStream gzos = new GZIPOutputStream(os, 1 << 16);
+        water.util.FileUtils.copyStream(is, gzos, 1 << 16);
+        gzos.finish();
+      } else {
+        water.util.FileUtils.copyStream(is, os, 2048);
+      }
     } catch (Exception e) {
       JettyHTTPD.sendErrorResponse(response, e, uri);
     } finally {
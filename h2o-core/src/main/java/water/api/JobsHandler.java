@@ -8,6 +8,9 @@ import water.api.schemas4.output.JobV4;
 import water.exceptions.H2ONotFoundArgumentException;
 
 public class JobsHandler extends Handler {
+  /** Upper bound on how long a request for a job's status may block, so that it doesn't hold a REST thread forever. */
+  static final int MAX_WAIT_MS = 60000;
+
   /** Impl class for a collection of jobs; only used in the API to make it easier to cons up the jobs array via the magic of PojoUtils.copyProperties.  */
 
   @SuppressWarnings("unused") // called through reflection by RequestServer
@@ -37,6 +40,8 @@ public class JobsHandler extends Handler {
     if( !(ice instanceof Job) ) throw new IllegalArgumentException("Must be a Job not a "+ice.getClass());
 
     Job j = (Job) ice;
+    if (s.wait_ms > 0)
+      j.waitForStop(Math.min(s.wait_ms, MAX_WAIT_MS));
     s.jobs = new JobV3[1];
     // s.fillFromImpl(jobs);
     try { s.jobs[0] = (JobV3) SchemaServer.schema(version, j).fillFromImpl(j); }
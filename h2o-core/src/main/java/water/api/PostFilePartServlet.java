@@ -0,0 +1,173 @@
+package water.api;
+
+import water.DKV;
+import water.JettyHTTPD;
+import water.Key;
+import water.Lockable;
+import water.exceptions.H2OIllegalArgumentException;
+import water.fvec.ByteVec;
+import water.fvec.Frame;
+import water.fvec.UploadFileVec;
+
+import javax.servlet.http.HttpServlet;
+import javax.servlet.http.HttpServletRequest;
+import javax.servlet.http.HttpServletResponse;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.SequenceInputStream;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.zip.CRC32;
+import java.util.zip.CheckedInputStream;
+import java.util.zip.GZIPInputStream;
+
+/**
+ * Upload of a file in parts, which can be sent in parallel and resumed after a failure.
+ *
+ * Each part is posted separately (in any order, optionally gzip-compressed), together with the CRC32 checksum of its
+ * uncompressed content; a part which doesn't match its checksum is rejected:
+ *
+ *   curl -F "file=@part0.gz" "http://localhost:54321/3/PostFilePart?upload_id=u1&part=0&checksum=3610a686&encoding=gzip"
+ *
+ * The parts received so far are listed (with their sizes and checksums) by
+ *
+ *   curl "http://localhost:54321/3/PostFilePart?upload_id=u1&parts=12"
+ *
+ * so that an interrupted upload can be resumed by sending only the missing parts. Finally, a POST without the "part"
+ * parameter concatenates all the parts into a single raw frame (and removes the parts):
+ *
+ *   curl -X POST "http://localhost:54321/3/PostFilePart?upload_id=u1&parts=12&destination_frame=a.csv"
+ *
+ * JSON Payload returned is the same as for PostFile:
+ *     { "destination_frame": "key_name", "total_bytes": nnn }
+ */
+public class PostFilePartServlet extends HttpServlet {
+
+  @Override
+  protected void doGet(HttpServletRequest request, HttpServletResponse response) {
+    String uri = JettyHTTPD.getDecodedUri(request);
+
+    try {
+      String upload_id = getRequiredParameter(request, "upload_id");
+      int nparts = Integer.parseInt(getRequiredParameter(request, "parts"));
+      StringBuilder sb = new StringBuilder();
+      sb.append("{ \"upload_id\": \"").append(upload_id).append("\", \"parts\": [");
+      String sep = "";
+      for (int i = 0; i < nparts; i++) {
+        ByteVec vec = partVec(partKey(upload_id, i));
+        if (vec == null) continue;
+        sb.append(sep)
+          .append("{ \"part\": ").append(i).append(", ")
+          .append("\"total_bytes\": ").append(vec.length()).append(", ")
+          .append("\"checksum\": \"").append(checksum(vec)).append("\" }");
+        sep = ", ";
+      }
+      sb.append("] }\n");
+      response.setContentType("application/json");
+      response.getWriter().write(sb.toString());
+    } catch (Exception e) {
+      JettyHTTPD.sendErrorResponse(response, e, uri);
+    } finally {
+      JettyHTTPD.logRequest("GET", request, response);
+    }
+  }
+
+  @Override
+  protected void doPost(HttpServletRequest request, HttpServletResponse response) {
+    String uri = JettyHTTPD.getDecodedUri(request);
+
+    try {
+      String upload_id = getRequiredParameter(request, "upload_id");
+      String part = request.getParameter("part");
+      UploadFileVec.ReadPutStats stats = new UploadFileVec.ReadPutStats();
+      String destination_frame;
+      if (part != null) {
+        InputStream is = JettyHTTPD.extractPartInputStream(request, response);
+        if (is == null) {
+          return;
+        }
+        if ("gzip".equals(request.getParameter("encoding"))) {
+          is = new GZIPInputStream(is);
+        }
+        Key key = partKey(upload_id, Integer.parseInt(part));
+        readPart(key, is, request.getParameter("checksum"), stats);
+        destination_frame = key.toString();
+      } else {
+        destination_frame = request.getParameter("destination_frame");
+        if (destination_frame == null) {
+          destination_frame = "upload" + Key.rand();
+        }
+        int nparts = Integer.parseInt(getRequiredParameter(request, "parts"));
+        assemble(upload_id, nparts, Key.make(destination_frame), stats);
+      }
+      String responsePayload = "{ " +
+          "\"destination_frame\": \"" + destination_frame + "\", " +
+          "\"total_bytes\": " + stats.total_bytes + " " +
+          "}\n";
+      response.setContentType("application/json");
+      response.getWriter().write(responsePayload);
+    } catch (Exception e) {
+      JettyHTTPD.sendErrorResponse(response, e, uri);
+    } finally {
+      JettyHTTPD.logRequest("POST", request, response);
+    }
+  }
+
+  static Key partKey(String upload_id, int part) {
+    return Key.make(upload_id + "_part" + part);
+  }
+
+  /** Store the content of a single part, verifying its checksum (if given) against the data received. */
+  static void readPart(Key key, InputStream is, String checksum, UploadFileVec.ReadPutStats stats) throws Exception {
+    CheckedInputStream cis = new CheckedInputStream(is, new CRC32());
+    UploadFileVec.readPut(key, cis, stats);
+    String actual = Long.toHexString(cis.getChecksum().getValue());
+    if (checksum != null && !Long.toHexString(Long.parseLong(checksum, 16)).equals(actual)) {
+      Lockable.delete(key);
+      throw new H2OIllegalArgumentException("Checksum mismatch for " + key + ": expected " + checksum +
+          ", received data has " + actual);
+    }
+  }
+
+  /** Concatenate the parts of an upload (in order) into a single raw frame, then remove the parts. */
+  static void assemble(String upload_id, int nparts, Key destination_frame, UploadFileVec.ReadPutStats stats)
+      throws Exception {
+    List<InputStream> streams = new ArrayList<>(nparts);
+    for (int i = 0; i < nparts; i++) {
+      ByteVec vec = partVec(partKey(upload_id, i));
+      if (vec == null)
+        throw new H2OIllegalArgumentException("Part " + i + " of upload " + upload_id + " is missing");
+      streams.add(vec.openStream(null));
+    }
+    UploadFileVec.readPut(destination_frame, new SequenceInputStream(Collections.enumeration(streams)), stats);
+    for (int i = 0; i < nparts; i++) {
+      Lockable.delete(partKey(upload_id, i));
+    }
+  }
+
+  /** The data of a part which was received completely, or null. */
+  private static ByteVec partVec(Key key) {
+    Frame fr = DKV.getGet(key);
+    return fr == null || fr.numCols() == 0 ? null : (ByteVec) fr.anyVec();
+  }
+
+  static String checksum(ByteVec vec) throws IOException {
+    CRC32 crc = new CRC32();
+    byte[] buf = new byte[1 << 16];
+    try (InputStream is = vec.openStream(null)) {
+      for (int n; (n = is.read(buf, 0, buf.length)) >= 0; ) {
+        crc.update(buf, 0, n);
+      }
+    }
+    return Long.toHexString(crc.getValue());
+  }
+
+  private static String getRequiredParameter(HttpServletRequest request, String name) {
+    String value = request.getParameter(name);
+    if (value == null) {
+      throw new H2OIllegalArgumentException("Missing required parameter " + name);
+    }
+    return value;
+  }
+}
@@ -130,7 +130,7 @@ public class RegisterV3Api extends AbstractRegister {
 
     context.registerEndpoint("job",
             "GET /3/Jobs/{job_id}", JobsHandler.class, "fetch",
-            "Get the status of the given H2O Job (long-running action).");
+            "Get the status of the given H2O Job (long-running action), optionally waiting for it to finish.");
 
     context.registerEndpoint("cancelJob",
             "POST /3/Jobs/{job_id}/cancel", JobsHandler.class, "cancel",
@@ -8,6 +8,9 @@ public class JobsV3 extends RequestSchemaV3<Iced,JobsV3> {
   @API(help="Optional Job identifier")
   public KeyV3.JobKeyV3 job_id;
 
+  @API(help="Wait up to this many milliseconds for the job to finish before responding (0 to respond immediately)")
+  public int wait_ms;
+
   // Output fields
   @API(help="jobs", direction=API.Direction.OUTPUT)
   public JobV3[] jobs;
@@ -17,6 +17,16 @@ public class SplitFrameV3 extends SchemaV3<SplitFrame, SplitFrameV3> {
   @API(help="Destination keys for each output frame split.", direction = API.Direction.INOUT)
   public FrameKeyV3[] destination_frames;
 
+  @API(help="How rows are assigned to the splits: contiguous ranges of rows, or at random (approximate sizes), or at random with exact sizes, or at random with exact sizes for each level of the stratify_by column",
+       values = {"contiguous", "random", "exact", "stratified"})
+  public SplitFrame.SplitMethod method;
+
+  @API(help="Seed for the random split methods (-1 to pick a random seed)")
+  public long seed;
+
+  @API(help="Categorical column to stratify by (stratified method only)")
+  public String stratify_by;
+
   public SplitFrameV3() {}
   public SplitFrameV3(SplitFrame impl) { super(impl); }
 
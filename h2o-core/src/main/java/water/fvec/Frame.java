@@ -1461,8 +1461,18 @@ public class Frame extends Lockable<Frame> {
     return new CSVStream(this, headers, hex_string);
   }
 
+  /** Convert a range of rows of this Frame to a CSV (in an {@link InputStream}).
+   *
+   *  @param rowOffset first row to write
+   *  @param rowCount number of rows to write, or -1 for all rows following rowOffset
+   *  @return An InputStream containing the rows as a CSV */
+  public InputStream toCSV(boolean headers, boolean hex_string, long rowOffset, long rowCount) {
+    return new CSVStream(this, headers, hex_string, rowOffset, rowCount);
+  }
+
   public static class CSVStream extends InputStream {
     private final boolean _hex_string;
+    private final long _endRow;
     byte[] _line;
     int _position;
     int _chkRow;
@@ -1471,25 +1481,43 @@ public class Frame extends Lockable<Frame> {
     public volatile int _curChkIdx; // used only for progress reporting
 
     public CSVStream(Frame fr, boolean headers, boolean hex_string) {
-      this(firstChunks(fr), headers ? fr.names() : null, fr.anyVec().nChunks(), hex_string);
+      this(fr, headers, hex_string, 0, -1);
+    }
+
+    public CSVStream(Frame fr, boolean headers, boolean hex_string, long rowOffset, long rowCount) {
+      this(chunksForRow(fr, rowOffset), headers ? fr.names() : null, fr.anyVec() == null ? 0 : fr.anyVec().nChunks(),
+          hex_string, rowOffset, endRow(fr, rowOffset, rowCount));
     }
 
-    private static Chunk[] firstChunks(Frame fr) {
+    private static Chunk[] chunksForRow(Frame fr, long row) {
       Vec anyvec = fr.anyVec();
-      if (anyvec == null || anyvec.nChunks() == 0 || anyvec.length() == 0) {
+      if (anyvec == null || anyvec.nChunks() == 0 || row < 0 || row >= anyvec.length()) {
         return null;
       }
       Chunk[] chks = new Chunk[fr.vecs().length];
       for (int i = 0; i < fr.vecs().length; i++) {
-        chks[i] = fr.vec(i).chunkForRow(0);
+        chks[i] = fr.vec(i).chunkForRow(row);
       }
       return chks;
     }
 
+    private static long endRow(Frame fr, long rowOffset, long rowCount) {
+      long nrows = fr.numRows();
+      if (rowOffset < 0 || rowOffset > nrows)
+        throw new IllegalArgumentException("Row offset " + rowOffset + " is out of range [0, " + nrows + "]");
+      return rowCount < 0 ? nrows : Math.min(rowOffset + rowCount, nrows);
+    }
+
     public CSVStream(Chunk[] chks, String[] names, int nChunks, boolean hex_string) {
+      this(chks, names, nChunks, hex_string, chks == null ? 0 : chks[0].start(),
+          chks == null ? 0 : chks[0]._vec.length());
+    }
+
+    private CSVStream(Chunk[] chks, String[] names, int nChunks, boolean hex_string, long firstRow, long endRow) {
       if (chks == null) nChunks = 0;
       _lastChkIdx = (chks != null) ? chks[0].cidx() + nChunks - 1 : -1;
       _hex_string = hex_string;
+      _endRow = endRow;
       StringBuilder sb = new StringBuilder();
       if (names != null) {
         sb.append('"').append(names[0]).append('"');
@@ -1498,7 +1526,8 @@ public class Frame extends Lockable<Frame> {
         sb.append('\n');
       }
       _line = StringUtils.bytesOf(sb);
-      _chkRow = -1; // first process the header line
+      // first process the header line, then continue with firstRow
+      _chkRow = chks == null ? -1 : (int) (firstRow - chks[0].start()) - 1;
       _curChks = chks;
     }
 
@@ -1554,7 +1583,7 @@ public class Frame extends Lockable<Frame> {
       Chunk anyChunk = _curChks[0];
 
       // Case 3:  Out of data.
-      if (anyChunk._start + _chkRow == anyChunk._vec.length()) {
+      if (anyChunk._start + _chkRow >= _endRow) {
         return 0;
       }
 
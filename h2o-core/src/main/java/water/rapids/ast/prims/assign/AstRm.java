@@ -11,18 +11,19 @@ import water.rapids.ast.AstPrimitive;
 import water.rapids.ast.AstRoot;
 
 /**
- * Remove by ID.  Removing a Frame updates refcnts.  Returns 1 for removing, 0 if id does not exist.
+ * Remove by ID.  Removing a Frame updates refcnts.  Any number of IDs can be given at once, e.g. (rm id1 id2 id3);
+ * returns the number of IDs that were actually removed (those that do not exist are skipped).
  */
 public class AstRm extends AstPrimitive {
   @Override
   public String[] args() {
-    return new String[]{"id"};
+    return new String[]{"id", "..."};
   }
 
   @Override
   public int nargs() {
-    return 1 + 1;
-  } // (rm id)
+    return -1;
+  } // (rm id ...)
 
   @Override
   public String str() {
@@ -31,14 +32,19 @@ public class AstRm extends AstPrimitive {
 
   @Override
   public ValNum apply(Env env, Env.StackHelp stk, AstRoot[] asts) {
-    Key id = Key.make(env.expand(asts[1].str()));
-    Value val = DKV.get(id);
-    if (val == null) return new ValNum(0);
-    if (val.isFrame())
-      env._ses.remove(val.<Frame>get()); // Remove unshared Vecs
-    else
-      Keyed.remove(id);           // Normal (e.g. Model) remove
-
-    return new ValNum(1);
+    if (asts.length < 2)
+      throw new IllegalArgumentException("rm expects at least one id");
+    int removed = 0;
+    for (int i = 1; i < asts.length; i++) {
+      Key id = Key.make(env.expand(asts[i].str()));
+      Value val = DKV.get(id);
+      if (val == null) continue;
+      if (val.isFrame())
+        env._ses.remove(val.<Frame>get()); // Remove unshared Vecs
+      else
+        Keyed.remove(id);           // Normal (e.g. Model) remove
+      removed++;
+    }
+    return new ValNum(removed);
   }
 }
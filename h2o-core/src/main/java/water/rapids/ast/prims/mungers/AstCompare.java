@@ -0,0 +1,179 @@
+package water.rapids.ast.prims.mungers;
+
+import water.MRTask;
+import water.Scope;
+import water.fvec.Chunk;
+import water.fvec.Frame;
+import water.fvec.Vec;
+import water.parser.BufferedString;
+import water.rapids.Env;
+import water.rapids.ast.AstPrimitive;
+import water.rapids.ast.AstRoot;
+import water.rapids.vals.ValStrs;
+import water.util.ArrayUtils;
+
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Compare two frames of the same shape cell by cell: (compare fr1 fr2 tol).
+ *
+ * Numeric (and time) columns are compared with the relative tolerance tol, the difference of two values being
+ * |a - b| / max(1, |a|, |b|); categorical and string columns are compared by their string values (so categorical
+ * columns with different domains can still be equal), and a numeric column is compared to a string or categorical
+ * column by parsing the strings as numbers. Two missing values are equal, a missing value is different from any
+ * other value.
+ *
+ * Returns a flat array of strings with 7 entries per column: the number of mismatching rows, how many of these
+ * mismatches are between a missing and a non-missing value, the maximum absolute and relative differences between
+ * the (non-missing) numeric values, the index of the first mismatching row (or -1), and the values of both frames in
+ * that row (or empty strings). This lets the clients check the equality of two whole frames with a single Rapids call.
+ */
+public class AstCompare extends AstPrimitive {
+  static final int NUM = 0, STR = 1, NUM_STR = 2, STR_NUM = 3, UUID = 4;
+
+  @Override
+  public String[] args() {
+    return new String[]{"frame1", "frame2", "tol"};
+  }
+
+  @Override
+  public int nargs() {
+    return 1 + 3;
+  } // (compare frame1 frame2 tol)
+
+  @Override
+  public String str() {
+    return "compare";
+  }
+
+  @Override
+  public ValStrs apply(Env env, Env.StackHelp stk, AstRoot asts[]) {
+    Frame fr1 = stk.track(asts[1].exec(env)).getFrame();
+    Frame fr2 = stk.track(asts[2].exec(env)).getFrame();
+    double tol = asts[3].exec(env).getNum();
+    if (fr1.numCols() != fr2.numCols() || fr1.numRows() != fr2.numRows())
+      throw new IllegalArgumentException("Frames of different shapes cannot be compared: " + fr1.numRows() + "x" +
+          fr1.numCols() + " vs " + fr2.numRows() + "x" + fr2.numCols());
+    int ncols = fr1.numCols();
+    List<String> res = new ArrayList<>(7 * ncols);
+    if (ncols == 0) return new ValStrs(new String[0]);
+    Scope.enter();
+    try {
+      Vec[] vecs = ArrayUtils.append(fr1.vecs(), fr1.makeCompatible(fr2));
+      int[] modes = new int[ncols];
+      for (int i = 0; i < ncols; i++)
+        modes[i] = mode(fr1.vec(i), fr2.vec(i));
+      CompareTask t = new CompareTask(modes, tol).doAll(vecs);
+      for (int i = 0; i < ncols; i++) {
+        long row = t._first[i] == Long.MAX_VALUE ? -1 : t._first[i];
+        res.add(Long.toString(t._nmismatches[i]));
+        res.add(Long.toString(t._nna[i]));
+        res.add(Double.toString(t._maxAbs[i]));
+        res.add(Double.toString(t._maxRel[i]));
+        res.add(Long.toString(row));
+        res.add(row < 0 ? "" : value(vecs[i], row));
+        res.add(row < 0 ? "" : value(vecs[ncols + i], row));
+      }
+    } finally {
+      Scope.exit();
+    }
+    return new ValStrs(res.toArray(new String[res.size()]));
+  }
+
+  private static boolean isStr(Vec v) {
+    return v.isString() || v.isCategorical();
+  }
+
+  private static int mode(Vec v1, Vec v2) {
+    if (v1.isUUID() || v2.isUUID()) return UUID;
+    if (isStr(v1)) return isStr(v2) ? STR : STR_NUM;
+    return isStr(v2) ? NUM_STR : NUM;
+  }
+
+  private static String value(Vec v, long row) {
+    if (v.isNA(row)) return "NA";
+    if (v.isCategorical()) return v.domain()[(int) v.at8(row)];
+    if (v.isString()) return v.atStr(new BufferedString(), row).toString();
+    if (v.isUUID()) return Long.toHexString(v.at16h(row)) + Long.toHexString(v.at16l(row));
+    return Double.toString(v.at(row));
+  }
+
+  private static class CompareTask extends MRTask<CompareTask> {
+    private final int[] _modes;
+    private final double _tol;
+    long[] _nmismatches, _nna, _first;
+    double[] _maxAbs, _maxRel;
+
+    CompareTask(int[] modes, double tol) {
+      _modes = modes;
+      _tol = tol;
+    }
+
+    @Override
+    public void map(Chunk[] cs) {
+      int ncols = _modes.length;
+      _nmismatches = new long[ncols];
+      _nna = new long[ncols];
+      _first = new long[ncols];
+      _maxAbs = new double[ncols];
+      _maxRel = new double[ncols];
+      BufferedString tmp = new BufferedString();
+      for (int c = 0; c < ncols; c++) {
+        Chunk c1 = cs[c], c2 = cs[ncols + c];
+        String[] dom1 = c1.vec().domain(), dom2 = c2.vec().domain();
+        _first[c] = Long.MAX_VALUE;
+        for (int r = 0; r < c1._len; r++) {
+          boolean na1 = c1.isNA(r), na2 = c2.isNA(r);
+          boolean equal;
+          if (na1 || na2) {
+            equal = na1 && na2;
+            if (!equal) _nna[c]++;
+          } else if (_modes[c] == STR) {
+            equal = str(c1, dom1, r, tmp).equals(str(c2, dom2, r, tmp));
+          } else if (_modes[c] == UUID) {
+            equal = c1.at16l(r) == c2.at16l(r) && c1.at16h(r) == c2.at16h(r);
+          } else {
+            double d1 = _modes[c] == STR_NUM ? num(c1, dom1, r, tmp) : c1.atd(r);
+            double d2 = _modes[c] == NUM_STR ? num(c2, dom2, r, tmp) : c2.atd(r);
+            if (d1 == d2) continue;  // also for equal infinities
+            double abs = Math.abs(d1 - d2);
+            double rel = abs / Math.max(1, Math.max(Math.abs(d1), Math.abs(d2)));
+            if (!Double.isNaN(abs)) {
+              _maxAbs[c] = Math.max(_maxAbs[c], abs);
+              _maxRel[c] = Math.max(_maxRel[c], rel);
+            }
+            equal = rel <= _tol;
+          }
+          if (!equal) {
+            _nmismatches[c]++;
+            _first[c] = Math.min(_first[c], c1.start() + r);
+          }
+        }
+      }
+    }
+
+    @Override
+    public void reduce(CompareTask t) {
+      for (int c = 0; c < _modes.length; c++) {
+        _nmismatches[c] += t._nmismatches[c];
+        _nna[c] += t._nna[c];
+        _first[c] = Math.min(_first[c], t._first[c]);
+        _maxAbs[c] = Math.max(_maxAbs[c], t._maxAbs[c]);
+        _maxRel[c] = Math.max(_maxRel[c], t._maxRel[c]);
+      }
+    }
+
+    private static String str(Chunk c, String[] domain, int row, BufferedString tmp) {
+      return domain != null ? domain[(int) c.at8(row)] : c.atStr(tmp, row).toString();
+    }
+
+    private static double num(Chunk c, String[] domain, int row, BufferedString tmp) {
+      try {
+        return Double.parseDouble(str(c, domain, row, tmp));
+      } catch (NumberFormatException e) {
+        return Double.NaN;
+      }
+    }
+  }
+}
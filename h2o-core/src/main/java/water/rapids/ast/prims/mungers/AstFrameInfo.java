@@ -0,0 +1,50 @@
+package water.rapids.ast.prims.mungers;
+
+import water.fvec.Frame;
+import water.fvec.Vec;
+import water.rapids.Env;
+import water.rapids.ast.AstPrimitive;
+import water.rapids.ast.AstRoot;
+import water.rapids.vals.ValStrs;
+
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Describe any number of frames at once: (frameInfo fr1 fr2 ...) returns a flat array of strings holding, for each
+ * frame in turn, its number of rows, its number of columns, the column names and the column types (the types are
+ * named as in the /3/Frames endpoint). This lets the clients evaluate several frames and learn their shapes with a
+ * single Rapids call.
+ */
+public class AstFrameInfo extends AstPrimitive {
+  @Override
+  public String[] args() {
+    return new String[]{"frame", "..."};
+  }
+
+  @Override
+  public int nargs() {
+    return -1;
+  } // (frameInfo frame ...)
+
+  @Override
+  public String str() {
+    return "frameInfo";
+  }
+
+  @Override
+  public ValStrs apply(Env env, Env.StackHelp stk, AstRoot asts[]) {
+    List<String> info = new ArrayList<>();
+    for (int i = 1; i < asts.length; i++) {
+      Frame fr = stk.track(asts[i].exec(env)).getFrame();
+      info.add(Long.toString(fr.numRows()));
+      info.add(Integer.toString(fr.numCols()));
+      for (String name : fr.names())
+        info.add(name);
+      for (Vec v : fr.vecs())
+        info.add(v.isUUID() ? "uuid" : v.isString() ? "string" : v.isCategorical() ? "enum" :
+                 v.isTime() ? "time" : v.isInt() ? "int" : "real");
+    }
+    return new ValStrs(info.toArray(new String[info.size()]));
+  }
+}
@@ -0,0 +1,142 @@
+package hex;
+
+import org.junit.Assert;
+import org.junit.BeforeClass;
+import org.junit.Test;
+import water.DKV;
+import water.H2O;
+import water.Job;
+import water.Scope;
+import water.TestUtil;
+import water.fvec.Frame;
+import water.fvec.TestFrameBuilder;
+import water.fvec.Vec;
+
+import java.util.Arrays;
+
+import static water.util.FrameUtils.generateNumKeys;
+
+public class RandomFrameSplitterTest extends TestUtil {
+  @BeforeClass() public static void setup() { stall_till_cloudsize(1); }
+
+  /** 100 rows: the row number, a categorical column with level "a" for every 4th row, and a string column. */
+  private static Frame makeDataset() {
+    double[] ids = new double[100];
+    String[] cats = new String[100];
+    String[] strs = new String[100];
+    for (int i = 0; i < 100; i++) {
+      ids[i] = i;
+      cats[i] = i % 4 == 0 ? "a" : "b";
+      strs[i] = "s" + i;
+    }
+    return new TestFrameBuilder()
+        .withColNames("id", "cat", "str")
+        .withVecTypes(Vec.T_NUM, Vec.T_CAT, Vec.T_STR)
+        .withDataForCol(0, ids)
+        .withDataForCol(1, cats)
+        .withDataForCol(2, strs)
+        .withChunkLayout(30, 30, 40)
+        .build();
+  }
+
+  private static Frame[] split(Frame dataset, double[] ratios, SplitFrame.SplitMethod method, int stratifyCol) {
+    RandomFrameSplitter rfs = new RandomFrameSplitter(dataset, ratios, generateNumKeys(dataset._key, ratios.length+1),
+                                                      method, 42, stratifyCol, null);
+    H2O.submitTask(rfs).join();
+    Frame[] splits = rfs.getResult();
+    for (Frame f : splits) Scope.track(f);
+    return splits;
+  }
+
+  /** Checks that every row went to exactly one split, in the original order, and returns the split of each row. */
+  private static int[] assertPartition(Frame[] splits) {
+    int[] splitOf = new int[100];
+    Arrays.fill(splitOf, -1);
+    for (int s = 0; s < splits.length; s++) {
+      Assert.assertArrayEquals(new String[]{"id", "cat", "str"}, splits[s].names());
+      Assert.assertArrayEquals(new String[]{"a", "b"}, splits[s].vec("cat").domain());
+      int prev = -1;
+      for (long r = 0; r < splits[s].numRows(); r++) {
+        int id = (int) splits[s].vec("id").at(r);
+        Assert.assertTrue("Rows keep their order", id > prev);
+        Assert.assertEquals("Row " + id + " is in one split only", -1, splitOf[id]);
+        Assert.assertEquals(id % 4 == 0 ? 0 : 1, splits[s].vec("cat").at8(r));
+        Assert.assertEquals("s" + id, splits[s].vec("str").stringAt(r));
+        splitOf[id] = s;
+        prev = id;
+      }
+    }
+    for (int id = 0; id < 100; id++)
+      Assert.assertNotEquals("Row " + id + " is in a split", -1, splitOf[id]);
+    return splitOf;
+  }
+
+  @Test public void testRandomSplitMatchesRunif() {
+    Scope.enter();
+    try {
+      Frame dataset = makeDataset();
+      Frame[] splits = split(dataset, ard(0.3, 0.5), SplitFrame.SplitMethod.random, -1);
+      Assert.assertEquals(3, splits.length);
+      int[] splitOf = assertPartition(splits);
+      Vec rnd = dataset.anyVec().makeRand(42);
+      try {
+        for (int id = 0; id < 100; id++) {
+          double r = rnd.at(id);
+          Assert.assertEquals(r <= 0.3 ? 0 : r <= 0.8 ? 1 : 2, splitOf[id]);
+        }
+      } finally {
+        rnd.remove();
+      }
+    } finally {
+      Scope.exit();
+    }
+  }
+
+  @Test public void testExactSplitSizes() {
+    Scope.enter();
+    try {
+      Frame[] splits = split(makeDataset(), ard(0.3, 0.5), SplitFrame.SplitMethod.exact, -1);
+      assertPartition(splits);
+      Assert.assertEquals(30, splits[0].numRows());
+      Assert.assertEquals(50, splits[1].numRows());
+      Assert.assertEquals(20, splits[2].numRows());
+    } finally {
+      Scope.exit();
+    }
+  }
+
+  @Test public void testProgressPerChunk() {
+    Scope.enter();
+    Job<Frame> job = new Job<>(null, null, "Split");
+    try {
+      Frame dataset = Scope.track(makeDataset());
+      job._work = dataset.anyVec().nChunks();
+      DKV.put(job);
+      RandomFrameSplitter rfs = new RandomFrameSplitter(dataset, ard(0.5), generateNumKeys(dataset._key, 2),
+                                                        SplitFrame.SplitMethod.random, 42, -1, job._key);
+      H2O.submitTask(rfs).join();
+      for (Frame f : rfs.getResult()) Scope.track(f);
+      // The job is not finished by Job.start() here, so all the progress comes from the updates of the chunks
+      Assert.assertEquals(1f, ((Job) DKV.getGet(job._key)).progress(), 0);
+    } finally {
+      DKV.remove(job._key);
+      Scope.exit();
+    }
+  }
+
+  @Test public void testStratifiedSplit() {
+    Scope.enter();
+    try {
+      Frame[] splits = split(makeDataset(), ard(0.2), SplitFrame.SplitMethod.stratified, 1);
+      int[] splitOf = assertPartition(splits);
+      // 25 rows of level "a" and 75 rows of level "b"
+      int[][] counts = new int[2][2];
+      for (int id = 0; id < 100; id++)
+        counts[splitOf[id]][id % 4 == 0 ? 0 : 1]++;
+      Assert.assertArrayEquals(new int[]{5, 15}, counts[0]);
+      Assert.assertArrayEquals(new int[]{20, 60}, counts[1]);
+    } finally {
+      Scope.exit();
+    }
+  }
+}
@@ -0,0 +1,47 @@
+package water;
+
+import org.junit.BeforeClass;
+import org.junit.Test;
+import water.api.JobsHandler;
+import water.api.schemas3.JobsV3;
+import water.api.schemas3.KeyV3;
+
+import static org.junit.Assert.*;
+
+public class JobTest extends TestUtil {
+  @BeforeClass
+  public static void setup() { stall_till_cloudsize(1); }
+
+  private static class SleepingTask extends H2O.H2OCountedCompleter<SleepingTask> {
+    private final long _sleep_ms;
+    private SleepingTask(long sleep_ms) { _sleep_ms = sleep_ms; }
+    @Override public void compute2() {
+      try { Thread.sleep(_sleep_ms); } catch (InterruptedException ignored) {}
+      tryComplete();
+    }
+  }
+
+  @Test
+  public void testWaitForStop() {
+    Job j = new Job(null, null, "Sleeping");
+    j.start(new SleepingTask(500), 1);
+    Job copy = DKV.getGet(j._key);
+    assertFalse(copy.waitForStop(10));
+    assertTrue(copy.waitForStop(10000));
+    assertTrue(copy.isDone());
+    assertTrue(j.waitForStop(0));
+  }
+
+  @Test
+  public void testFetchWaitsForJob() {
+    Job j = new Job(null, null, "Sleeping");
+    j.start(new SleepingTask(300), 1);
+    JobsV3 s = new JobsV3();
+    s.job_id = new KeyV3.JobKeyV3(j._key);
+    s.wait_ms = 10000;
+    long start = System.currentTimeMillis();
+    s = new JobsHandler().fetch(3, s);
+    assertEquals("DONE", s.jobs[0].status);
+    assertTrue(System.currentTimeMillis() - start < 10000);
+  }
+}
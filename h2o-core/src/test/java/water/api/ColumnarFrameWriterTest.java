@@ -0,0 +1,119 @@
+package water.api;
+
+import org.junit.BeforeClass;
+import org.junit.Test;
+import water.Scope;
+import water.TestUtil;
+import water.fvec.Frame;
+import water.fvec.TestFrameBuilder;
+import water.fvec.Vec;
+
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+
+import static org.junit.Assert.*;
+
+public class ColumnarFrameWriterTest extends TestUtil {
+  @BeforeClass
+  public static void setup() { stall_till_cloudsize(1); }
+
+  @Test
+  public void testWriteAllRows() throws IOException {
+    Scope.enter();
+    try {
+      Frame fr = Scope.track(new TestFrameBuilder()
+              .withColNames("num", "cat", "str")
+              .withVecTypes(Vec.T_NUM, Vec.T_CAT, Vec.T_STR)
+              .withDataForCol(0, ard(1.5, Double.NaN, 3))
+              .withDataForCol(1, ar("b", null, "a"))
+              .withDataForCol(2, ar("x", "yz", null))
+              .withChunkLayout(2, 1)
+              .build());
+
+      ByteBuffer bb = write(fr, 0, -1);
+      assertEquals(1.5, bb.getDouble(), 0);
+      assertTrue(Double.isNaN(bb.getDouble()));
+      assertEquals(3, bb.getDouble(), 0);
+      // domain is in the order of appearance: [b, a]
+      assertEquals(0, bb.getInt());
+      assertEquals(-1, bb.getInt());
+      assertEquals(1, bb.getInt());
+      assertEquals(1, bb.getInt());
+      assertEquals(2, bb.getInt());
+      assertEquals(-1, bb.getInt());
+      byte[] strs = new byte[3];
+      bb.get(strs);
+      assertEquals("xyz", new String(strs, StandardCharsets.UTF_8));
+      assertFalse(bb.hasRemaining());
+    } finally {
+      Scope.exit();
+    }
+  }
+
+  @Test
+  public void testWriteRowRange() throws IOException {
+    Scope.enter();
+    try {
+      Frame fr = Scope.track(new TestFrameBuilder()
+              .withColNames("num")
+              .withVecTypes(Vec.T_NUM)
+              .withDataForCol(0, ard(0, 1, 2, 3, 4, 5, 6))
+              .withChunkLayout(2, 2, 2, 1)
+              .build());
+
+      ByteBuffer bb = write(fr, 1, 4);
+      for (int i = 1; i <= 4; i++)
+        assertEquals(i, bb.getLong());
+      assertEquals(0, bb.get());  // no NAs
+      assertFalse(bb.hasRemaining());
+
+      assertFalse(write(fr, 7, -1).hasRemaining());
+    } finally {
+      Scope.exit();
+    }
+  }
+
+  @Test
+  public void testWriteLongs() throws IOException {
+    Scope.enter();
+    try {
+      long big = (1L << 53) + 1;  // not representable as a double
+      Frame fr = Scope.track(new TestFrameBuilder()
+              .withColNames("id")
+              .withVecTypes(Vec.T_NUM)
+              .withDataForCol(0, new long[]{big, -big, 0, 0, 0, 0, 0, 0, 7})
+              .withChunkLayout(3, 6)
+              .build());
+      fr.vec(0).set(2, Double.NaN);
+      fr.vec(0).set(8, Double.NaN);
+
+      ByteBuffer bb = write(fr, 0, -1);
+      assertEquals(big, bb.getLong());
+      assertEquals(-big, bb.getLong());
+      for (int i = 2; i < 9; i++)
+        assertEquals(0, bb.getLong());
+      assertEquals(1 << 2, bb.get());  // rows 2 and 8 are NA
+      assertEquals(1, bb.get());
+      assertFalse(bb.hasRemaining());
+    } finally {
+      Scope.exit();
+    }
+  }
+
+  /** Writes the frame and returns a buffer positioned right after the header. */
+  private static ByteBuffer write(Frame fr, long rowOffset, long rowCount) throws IOException {
+    ByteArrayOutputStream os = new ByteArrayOutputStream();
+    new ColumnarFrameWriter(fr, rowOffset, rowCount).writeTo(os);
+    ByteBuffer bb = ByteBuffer.wrap(os.toByteArray()).order(ByteOrder.LITTLE_ENDIAN);
+    byte[] magic = new byte[4];
+    bb.get(magic);
+    assertEquals("H2OC", new String(magic, StandardCharsets.UTF_8));
+    int headerLength = bb.getInt();
+    bb.position(bb.position() + headerLength);
+    return bb;
+  }
+
+}
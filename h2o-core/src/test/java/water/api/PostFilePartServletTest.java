@@ -0,0 +1,85 @@
+package water.api;
+
+import org.junit.BeforeClass;
+import org.junit.Test;
+import water.DKV;
+import water.Key;
+import water.TestUtil;
+import water.exceptions.H2OIllegalArgumentException;
+import water.fvec.ByteVec;
+import water.fvec.Frame;
+import water.fvec.UploadFileVec;
+
+import java.io.ByteArrayInputStream;
+import java.io.InputStream;
+import java.nio.charset.StandardCharsets;
+import java.util.zip.CRC32;
+
+import static org.junit.Assert.*;
+
+public class PostFilePartServletTest extends TestUtil {
+  @BeforeClass
+  public static void setup() { stall_till_cloudsize(1); }
+
+  private static String crc(byte[] data) {
+    CRC32 crc = new CRC32();
+    crc.update(data);
+    return Long.toHexString(crc.getValue());
+  }
+
+  private static void upload(String upload_id, int part, byte[] data, String checksum) throws Exception {
+    InputStream is = new ByteArrayInputStream(data);
+    PostFilePartServlet.readPart(PostFilePartServlet.partKey(upload_id, part), is, checksum,
+        new UploadFileVec.ReadPutStats());
+  }
+
+  @Test
+  public void testAssembleParts() throws Exception {
+    String upload_id = "upload_" + Key.rand();
+    byte[][] parts = {
+        "a,b\n1,2\n3,".getBytes(StandardCharsets.UTF_8),
+        "4\n5,6\n".getBytes(StandardCharsets.UTF_8),
+        "7,8\n".getBytes(StandardCharsets.UTF_8)
+    };
+    Key dest = Key.make();
+    try {
+      // parts may arrive in any order
+      for (int i = parts.length - 1; i >= 0; i--)
+        upload(upload_id, i, parts[i], crc(parts[i]));
+      Frame part1 = DKV.getGet(PostFilePartServlet.partKey(upload_id, 1));
+      assertEquals(crc(parts[1]), PostFilePartServlet.checksum((ByteVec) part1.anyVec()));
+
+      UploadFileVec.ReadPutStats stats = new UploadFileVec.ReadPutStats();
+      PostFilePartServlet.assemble(upload_id, parts.length, dest, stats);
+      assertEquals(20, stats.total_bytes);
+      Frame fr = DKV.getGet(dest);
+      assertEquals(crc("a,b\n1,2\n3,4\n5,6\n7,8\n".getBytes(StandardCharsets.UTF_8)),
+          PostFilePartServlet.checksum((ByteVec) fr.anyVec()));
+      for (int i = 0; i < parts.length; i++)
+        assertNull(DKV.get(PostFilePartServlet.partKey(upload_id, i)));
+    } finally {
+      Frame fr = DKV.getGet(dest);
+      if (fr != null) fr.delete();
+    }
+  }
+
+  @Test
+  public void testChecksumMismatch() throws Exception {
+    String upload_id = "upload_" + Key.rand();
+    byte[] data = "1,2\n".getBytes(StandardCharsets.UTF_8);
+    try {
+      upload(upload_id, 0, data, "deadbeef");
+      fail("Expected a checksum mismatch");
+    } catch (H2OIllegalArgumentException e) {
+      assertTrue(e.getMessage().contains("Checksum mismatch"));
+    }
+    assertNull(DKV.get(PostFilePartServlet.partKey(upload_id, 0)));
+
+    try {
+      PostFilePartServlet.assemble(upload_id, 1, Key.make(), new UploadFileVec.ReadPutStats());
+      fail("Expected a missing part");
+    } catch (H2OIllegalArgumentException e) {
+      assertTrue(e.getMessage().contains("is missing"));
+    }
+  }
+}
@@ -6,6 +6,8 @@ import org.junit.Test;
 import water.*;
 import water.util.FrameUtils;
 
+import java.io.IOException;
+import java.io.InputStream;
 import java.util.Arrays;
 import java.util.HashSet;
 import java.util.Set;
@@ -150,4 +152,42 @@ public class FrameTest extends TestUtil {
     }
   }
 
+  @Test
+  public void testToCSVRowRange() throws IOException {
+    Scope.enter();
+    try {
+      Frame fr = new TestFrameBuilder()
+              .withName("testFrame")
+              .withColNames("x")
+              .withVecTypes(Vec.T_NUM)
+              .withDataForCol(0, new double[]{0, 1, 2, 3, 4, 5, 6, 7, 8, 9})
+              .withChunkLayout(3, 3, 4)
+              .build();
+      Scope.track(fr);
+      assertEquals("\"x\"\n0\n1\n2\n3\n4\n5\n6\n7\n8\n9\n", readCSV(fr.toCSV(true, false)));
+      assertEquals("\"x\"\n2\n3\n4\n5\n6\n", readCSV(fr.toCSV(true, false, 2, 5)));
+      assertEquals("5\n6\n7\n8\n9\n", readCSV(fr.toCSV(false, false, 5, -1)));
+      assertEquals("9\n", readCSV(fr.toCSV(false, false, 9, 100)));
+      assertEquals("\"x\"\n", readCSV(fr.toCSV(true, false, 3, 0)));
+      assertEquals("", readCSV(fr.toCSV(false, false, 10, -1)));
+      try {
+        fr.toCSV(true, false, 11, -1);
+        fail("Expected an IllegalArgumentException");
+      } catch (IllegalArgumentException e) {
+        // expected
+      }
+    } finally {
+      Scope.exit();
+    }
+  }
+
+  private static String readCSV(InputStream is) throws IOException {
+    StringBuilder sb = new StringBuilder();
+    byte[] buf = new byte[16];
+    int n;
+    while ((n = is.read(buf, 0, buf.length)) > 0)
+      sb.append(new String(buf, 0, n));
+    return sb.toString();
+  }
+
 }
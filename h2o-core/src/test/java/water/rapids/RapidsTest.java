@@ -6,6 +6,7 @@ import org.junit.Test;
 import water.*;
 import water.fvec.Frame;
 import water.fvec.NFSFileVec;
+import water.fvec.TestFrameBuilder;
 import water.fvec.Vec;
 import water.parser.ParseDataset;
 import water.parser.ParseSetup;
@@ -483,6 +484,83 @@ public class RapidsTest extends TestUtil {
     }
   }
 
+  @Test public void testRmMultipleIds() {
+    Session ses = new Session();
+    Frame fr = null;
+    try {
+      fr = parse_test_file(Key.make("a.hex"),"smalldata/iris/iris_wheader.csv");
+      Rapids.exec("(tmp= py_1 (cols_py a.hex 0))",ses);
+      Rapids.exec("(tmp= py_2 (cols_py a.hex 1))",ses);
+      Val val = Rapids.exec("(rm py_1 py_2 py_3)",ses);
+      assertEquals(2, val.getNum(), 0);
+      assertNull(DKV.get("py_1"));
+      assertNull(DKV.get("py_2"));
+      assertNotNull(DKV.get("a.hex"));
+      ses.end(null);
+    } catch( Throwable ex ) {
+      throw ses.endQuietly(ex);
+    } finally {
+      if (fr != null) fr.delete();
+    }
+  }
+
+  @Test public void testFrameInfoInBlock() {
+    Session ses = new Session();
+    Frame fr = null;
+    try {
+      fr = parse_test_file(Key.make("a.hex"),"smalldata/iris/iris_wheader.csv");
+      Val val = Rapids.exec("(, (tmp= py_1 (cols_py a.hex [0 4])) (tmp= py_2 (rows a.hex [0:10])) " +
+                            "(frameInfo py_1 py_2))",ses);
+      String[] info = val.getStrs();
+      String[] expected1 = {"150", "2", "sepal_len", "class", "real", "enum"};
+      assertArrayEquals(expected1, Arrays.copyOfRange(info, 0, 6));
+      assertEquals("10", info[6]);
+      assertEquals("5", info[7]);
+      assertEquals(6 + 2 + 2 * 5, info.length);
+      assertNotNull(DKV.get("py_1"));
+      assertNotNull(DKV.get("py_2"));
+      ses.end(null);
+    } catch( Throwable ex ) {
+      throw ses.endQuietly(ex);
+    } finally {
+      if (fr != null) fr.delete();
+    }
+  }
+
+  @Test public void testCompare() {
+    Frame a = null, b = null;
+    try {
+      a = new TestFrameBuilder()
+          .withName("cmp_a")
+          .withColNames("n", "c", "s")
+          .withVecTypes(Vec.T_NUM, Vec.T_CAT, Vec.T_STR)
+          .withDataForCol(0, ard(1, 2, Double.NaN, 4, 5))
+          .withDataForCol(1, ar("A", "B", "C", "A", "B"))
+          .withDataForCol(2, ar("x", "y", null, "z", "w"))
+          .withChunkLayout(2, 2, 1)
+          .build();
+      b = new TestFrameBuilder()
+          .withName("cmp_b")
+          .withColNames("n", "c", "s")
+          .withVecTypes(Vec.T_NUM, Vec.T_CAT, Vec.T_CAT)
+          .withDataForCol(0, ard(1, 2.0000001, Double.NaN, Double.NaN, 5.5))
+          .withDataForCol(1, ar("A", "B", "C", "A", "C"))
+          .withDataForCol(2, ar("x", "y", null, "z", "w"))
+          .withChunkLayout(3, 2)
+          .build();
+      String[] res = Rapids.exec("(compare cmp_a cmp_b 1e-6)").getStrs();
+      assertEquals(3 * 7, res.length);
+      assertArrayEquals(new String[]{"2", "1", "0.5"}, Arrays.copyOfRange(res, 0, 3));
+      assertEquals(0.5 / 5.5, Double.parseDouble(res[3]), 1e-12);
+      assertArrayEquals(new String[]{"3", "4.0", "NA"}, Arrays.copyOfRange(res, 4, 7));
+      assertArrayEquals(new String[]{"1", "0", "0.0", "0.0", "4", "B", "C"}, Arrays.copyOfRange(res, 7, 14));
+      assertArrayEquals(new String[]{"0", "0", "0.0", "0.0", "-1", "", ""}, Arrays.copyOfRange(res, 14, 21));
+    } finally {
+      if (a != null) a.delete();
+      if (b != null) b.delete();
+    }
+  }
+
   @Test public void testChicago() {
     String oldtz = Rapids.exec("(getTimeZone)").getStr();
     Session ses = new Session();
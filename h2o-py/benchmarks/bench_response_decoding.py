@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+Benchmark the decoding of large JSON responses into H2OResponse objects.
+
+A synthetic ``GET /3/Models/{id}`` response is generated (a GBM-like model with scoring history, variable importances
+and training / validation / cross-validation metrics), and decoded with the standard json module as well as with each
+of the faster JSON decoders that are installed, each eagerly and lazily (``lazy_responses``: schema objects are built
+on first access). Reading a table of the decoded model is timed separately, since tables are only parsed when first
+accessed.
+
+Usage: python bench_response_decoding.py [--history-rows N] [--repeat N]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from h2o.backend.connection import H2OLazyResponse, H2OResponse  # NOQA
+
+
+def make_table(name, nrows, ncols):
+    types = ["string"] + ["double"] * (ncols - 2) + ["integer"]
+    columns = [{"__meta": {"schema_version": 3, "schema_name": "ColumnSpecsBase", "schema_type": "Iced"},
+                "name": "c%d" % i if i else "", "type": t, "format": "%.5f", "description": ""}
+               for i, t in enumerate(types)]
+    data = [["r%d" % r for r in range(nrows)]] + \
+           [[random.random() for _ in range(nrows)] for _ in range(ncols - 2)] + [list(range(nrows))]
+    return {"__meta": {"schema_version": 3, "schema_name": "TwoDimTableV3", "schema_type": "TwoDimTable"},
+            "name": name, "description": "", "columns": columns, "rowcount": nrows, "data": data}
+
+
+def make_metrics():
+    return {"__meta": {"schema_version": 3, "schema_name": "ModelMetricsBinomialV3", "schema_type": "ModelMetrics"},
+            "model": {"name": "model"}, "frame": {"name": "frame"}, "MSE": 0.1, "RMSE": 0.3, "nobs": 1000,
+            "AUC": 0.8, "logloss": 0.4, "domain": ["0", "1"], "model_category": "Binomial",
+            "thresholds_and_metric_scores": make_table("Metrics for Thresholds", 400, 20),
+            "max_criteria_and_metric_scores": make_table("Maximum Metrics", 10, 4),
+            "gains_lift_table": make_table("Gains/Lift Table", 16, 13)}
+
+
+def make_model_json(history_rows):
+    params = [{"__meta": {"schema_version": 3, "schema_name": "ModelParameterSchemaV3", "schema_type": "Iced"},
+               "name": "p%d" % i, "label": "p%d" % i, "help": "Help text of parameter %d" % i, "required": False,
+               "type": "double", "default_value": 0.1, "actual_value": 0.2, "level": "critical", "values": [],
+               "gridable": True} for i in range(80)]
+    output = {"__meta": {"schema_version": 3, "schema_name": "GBMModelOutputV3", "schema_type": "GBMOutput"},
+              "names": ["c%d" % i for i in range(500)], "domains": [None] * 500,
+              "model_summary": make_table("Model Summary", 1, 10),
+              "scoring_history": make_table("Scoring History", history_rows, 15),
+              "variable_importances": make_table("Variable Importances", 500, 4),
+              "training_metrics": make_metrics(), "validation_metrics": make_metrics(),
+              "cross_validation_metrics": make_metrics(),
+              "cross_validation_metrics_summary": make_table("Cross-Validation Metrics Summary", 20, 8)}
+    model = {"__meta": {"schema_version": 3, "schema_name": "GBMModelV3", "schema_type": "GBMModel"},
+             "model_id": {"name": "model"}, "algo": "gbm", "parameters": params, "output": output}
+    return json.dumps({"__meta": {"schema_version": 3, "schema_name": "ModelsV3", "schema_type": "Models"},
+                       "models": [model]}).encode("utf-8")
+
+
+def decoders():
+    yield "json (object_pairs_hook)", lambda b: json.loads(b.decode("utf-8"), object_pairs_hook=H2OResponse)
+    yield "json, lazy", lambda b: H2OLazyResponse.wrap(json.loads(b.decode("utf-8")))
+    for module in ("orjson", "ujson", "simplejson"):
+        try:
+            loads = __import__(module).loads
+        except ImportError:
+            continue
+        yield module, lambda b, loads=loads: H2OResponse.convert(loads(b))
+        yield module + ", lazy", lambda b, loads=loads: H2OLazyResponse.wrap(loads(b))
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter() if hasattr(time, "perf_counter") else time.time()
+        fn()
+        best = min(best, (time.perf_counter() if hasattr(time, "perf_counter") else time.time()) - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--history-rows", type=int, default=5000, help="rows of the scoring history table")
+    parser.add_argument("--repeat", type=int, default=10, help="number of repetitions (the best time is reported)")
+    args = parser.parse_args()
+    random.seed(42)
+    body = make_model_json(args.history_rows)
+    print("Model JSON: %.2f MB" % (len(body) / 1e6))
+    print("%-26s %12s %16s" % ("decoder", "decode (ms)", "+ 1 table (ms)"))
+    for name, decode in decoders():
+        def decode_and_read():
+            decode(body)["models"][0]["output"]["scoring_history"].cell_values
+        print("%-26s %12.1f %16.1f" % (name, best_time(lambda: decode(body), args.repeat),
+                                       best_time(decode_and_read, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+Benchmark the per-call cost of assert_is_type() and is_type() on the type specs that are common in h2o-py.
+
+Each check is written the way it appears in the library (e.g. list literals are re-created on every call), and is run
+on a value that passes the check. The cost of a check in the trusted mode (when type checks are skipped) is reported
+as well.
+
+Usage: python bench_typechecks.py [--number N] [--repeat N]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from h2o.utils import typechecks  # NOQA
+from h2o.utils.typechecks import assert_is_type, is_type, numeric, Enum, I, U  # NOQA
+
+
+class Frame(object):
+    """Stand-in for H2OFrame."""
+
+
+CHECKS = [
+    ("int", "assert_is_type(n, int)"),
+    ("None | int", "assert_is_type(n, None, int)"),
+    ("None | class", "assert_is_type(fr, None, Frame)"),
+    ("None | Enum", "assert_is_type(dist, None, Enum('auto', 'bernoulli', 'multinomial', 'gaussian'))"),
+    ("str | [str] | None", "assert_is_type(cols, str, [str], None)"),
+    ("(numeric, numeric) | numeric", "assert_is_type(progress, (numeric, numeric), numeric)"),
+    ("I(int, lambda)", "assert_is_type(n, I(int, lambda port: 1 <= port <= 65535))"),
+    ("[numeric], 1000 items", "assert_is_type(values, [numeric])"),
+    ("{str: U(int, None, [int])}", "assert_is_type(parms, {str: U(int, None, [int])})"),
+    ("is_type str", "is_type(name, str)"),
+]
+
+VALUES = {"n": 5, "fr": Frame(), "dist": "bernoulli", "cols": ["c%d" % i for i in range(10)], "progress": (0.5, 1),
+          "values": [i * 0.5 for i in range(1000)], "parms": {"p%d" % i: [i] if i % 2 else i for i in range(20)},
+          "name": "spam"}
+
+
+def per_call_ns(stmt, number, repeat):
+    namespace = dict(globals(), **VALUES)
+    return min(timeit.repeat(stmt, number=number, repeat=repeat, globals=namespace)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements (the best one is reported)")
+    args = parser.parse_args()
+    print("%-30s %14s %14s" % ("spec", "checked (ns)", "trusted (ns)"))
+    for name, stmt in CHECKS:
+        checked = per_call_ns(stmt, args.number, args.repeat)
+        trusted = float("nan")
+        if hasattr(typechecks, "trusted") and stmt.startswith("assert"):
+            with typechecks.trusted():
+                trusted = per_call_ns(stmt, args.number, args.repeat)
+        print("%-30s %14.0f %14.0f" % (name, checked, trusted))
+
+
+if __name__ == "__main__":
+    main()
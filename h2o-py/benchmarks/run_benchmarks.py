@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+Run the client benchmark scenarios against the stand-in REST server or a local H2O server.
+
+For every scenario the wall time and the CPU time of the client process are measured (the best of ``--repeat`` runs,
+after a warm-up run), together with the number of requests and the bytes received (from the connection's request
+tracer), and the peak memory allocated by Python during one more run (with tracemalloc, which slows the code down, so
+it is not timed).
+
+By default the scenarios run against ``stub_server.py``, started in a separate process, so that the numbers only
+reflect the client. With ``--jar`` an H2O server is launched from the given h2o.jar, and ``--url`` connects to an
+already running server.
+
+The results can be saved with ``--json``, and compared against saved results with ``--compare``: the exit status is
+1 if any scenario got slower (or used more requests or memory) by more than ``--threshold``.
+
+Usage: python run_benchmarks.py [--jar PATH | --url URL] [--scale N] [--repeat N] [--scenario NAME ...]
+                                [--json FILE] [--compare FILE] [--threshold X]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, BENCH_DIR)
+import h2o  # NOQA
+from scenarios import SCENARIOS  # NOQA
+
+# Measures compared by --compare (a higher value is worse for all of them)
+MEASURES = ["wall_ms", "cpu_ms", "requests", "peak_mb"]
+
+
+class StubProcess(object):
+    """The stand-in server of stub_server.py, running in a child process."""
+
+    def __init__(self):
+        self.process = subprocess.Popen([sys.executable, os.path.join(BENCH_DIR, "stub_server.py")],
+                                        stdout=subprocess.PIPE)
+        self.port = int(self.process.stdout.readline().decode().split()[1])
+
+    def shutdown(self):
+        self.process.kill()
+        self.process.wait()
+
+
+def connect(args):
+    """Connect to the server selected by the arguments; returns the object to shut down at the end (or None)."""
+    if args.url:
+        h2o.connect(url=args.url, verbose=False)
+        return None
+    if args.jar:
+        from h2o.backend import H2OLocalServer
+        server = H2OLocalServer.start(jar_path=args.jar, verbose=False)
+        h2o.connect(server=server, verbose=False)
+        return server
+    stub = StubProcess()
+    h2o.connect(ip="127.0.0.1", port=stub.port, verbose=False)
+    return stub
+
+
+def measure(scenario, repeat):
+    """Run the scenario ``repeat`` times (plus once for the peak memory); returns a dict of measures."""
+    tracer = h2o.connection().tracer
+    scenario.run()  # warm-up: lazy imports, compiled type checks, connection pool
+    wall = cpu = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        tracer.reset()
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        scenario.run()
+        cpu = min(cpu, time.process_time() - cpu0)
+        wall = min(wall, time.perf_counter() - wall0)
+    stats = tracer.stats()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        scenario.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"wall_ms": wall * 1000, "cpu_ms": cpu * 1000, "requests": sum(s["calls"] for s in stats),
+            "received_kb": sum(s["bytes_received"] for s in stats) / 1024, "peak_mb": peak / 2.0**20,
+            "endpoints": {s["endpoint"]: s["calls"] for s in stats}}
+
+
+def compare(results, baseline, threshold):
+    """Print the changes relative to the baseline; returns the names of the regressed scenarios."""
+    regressed = []
+    print("\nChanges relative to the baseline (regressions over %d%% are marked with *):" % (threshold * 100))
+    for name, res in results.items():
+        base = baseline.get(name)
+        if base is None: continue
+        changes = []
+        for m in MEASURES:
+            if not base.get(m): continue
+            ratio = res[m] / base[m]
+            flag = "*" if ratio > 1 + threshold else ""
+            changes.append("%s %+.0f%%%s" % (m, (ratio - 1) * 100, flag))
+            if flag and name not in regressed: regressed.append(name)
+        print("  %-22s %s" % (name, ", ".join(changes)))
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument("--jar", help="launch an H2O server from this h2o.jar (instead of the stand-in server)")
+    backend.add_argument("--url", help="use the H2O server running at this URL (instead of the stand-in server)")
+    parser.add_argument("--scale", type=int, default=10000, help="number of rows of the frames used")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs (the best one is reported)")
+    parser.add_argument("--scenario", nargs="+", choices=[s.name for s in SCENARIOS], help="scenarios to run")
+    parser.add_argument("--json", help="save the results to this file")
+    parser.add_argument("--compare", help="compare the results with the ones saved in this file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change reported as a regression")
+    args = parser.parse_args()
+
+    server = connect(args)
+    h2o.no_progress()
+    results = {}
+    try:
+        print("%-22s %10s %10s %9s %12s %9s" % ("scenario", "wall (ms)", "cpu (ms)", "requests", "recv (kB)",
+                                               "peak (MB)"))
+        for cls in SCENARIOS:
+            if args.scenario and cls.name not in args.scenario or not cls.available(): continue
+            scenario = cls(args.scale)
+            scenario.setup()
+            try:
+                res = results[cls.name] = measure(scenario, args.repeat)
+            finally:
+                scenario.teardown()
+            print("%-22s %10.1f %10.1f %9d %12.1f %9.2f" % (cls.name, res["wall_ms"], res["cpu_ms"], res["requests"],
+                                                           res["received_kb"], res["peak_mb"]))
+    finally:
+        h2o.connection().close()
+        if server is not None: server.shutdown()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"backend": "url" if args.url else "jar" if args.jar else "stub", "scale": args.scale,
+                       "results": results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
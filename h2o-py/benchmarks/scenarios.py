@@ -0,0 +1,145 @@
+# -*- encoding: utf-8 -*-
+"""
+Scenarios of the client benchmark suite (see ``run_benchmarks.py``).
+
+Each scenario is a class in the style of asv benchmarks: ``setup()`` creates the data on the server, ``run()`` is the
+measured part and may be called several times, and ``teardown()`` removes whatever was created. The ``scale``
+parameter is the number of rows of the frames used; the scenarios work both with the stand-in server of
+``stub_server.py`` and with a real H2O server.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import random
+
+import h2o
+from h2o.utils.shared_utils import can_use_pandas
+
+
+def make_rows(nrows, ncols=10, seed=42):
+    """Rows of mixed data: numbers (with some missing values), a categorical and a binary response column."""
+    rnd = random.Random(seed)
+    levels = ["level%d" % i for i in range(20)]
+    return [[rnd.random() if rnd.random() > 0.01 else None for _ in range(ncols - 2)] +
+            [rnd.choice(levels), rnd.choice(["yes", "no"])]
+            for _ in range(nrows)]
+
+
+def column_names(ncols=10):
+    return ["x%d" % i for i in range(ncols - 2)] + ["category", "response"]
+
+
+class Scenario(object):
+    """Base class of the benchmark scenarios."""
+
+    name = None
+    description = None
+
+    def __init__(self, scale):
+        self.scale = scale
+        self._frames = []
+
+    def upload(self, rows, names):
+        frame = h2o.H2OFrame(rows, column_names=names)
+        self._frames.append(frame)
+        return frame
+
+    @staticmethod
+    def available():
+        """Whether the scenario can run in this environment."""
+        return True
+
+    def setup(self):
+        pass
+
+    def run(self):
+        raise NotImplementedError
+
+    def teardown(self):
+        if self._frames:
+            h2o.remove(self._frames)
+        self._frames = []
+
+
+class UploadPythonList(Scenario):
+    name = "upload_list"
+    description = "H2OFrame(list of rows): CSV writing, upload, parse setup and parse"
+
+    def setup(self):
+        self.rows = make_rows(self.scale)
+
+    def run(self):
+        self.upload(self.rows, column_names())
+
+
+class ExprChain(Scenario):
+    name = "expr_chain"
+    description = "Build and evaluate a long chain of lazy frame operations (ExprNode serialization)"
+
+    def setup(self):
+        self.frame = self.upload(make_rows(self.scale), column_names())
+
+    def run(self):
+        fr = self.frame[:, :8]
+        for i in range(40):  # deeper expressions hit the recursion limit of _get_ast_str()
+            fr = (fr * 2 + i).abs() / 3
+        res = [fr.sum(axis=1, return_frame=True), fr.cbind(fr), fr.rbind(fr)]
+        h2o.evaluate_all(res)
+        res[0].nrow
+
+
+class FrameFill(Scenario):
+    name = "frame_fill"
+    description = "Fetch all rows of a frame into the client cache (H2OCache.fill)"
+
+    def setup(self):
+        self.frame = self.upload(make_rows(self.scale), column_names())
+
+    def run(self):
+        h2o.H2OFrame.get_frame(self.frame.frame_id, rows=self.scale)
+
+
+class ModelTables(Scenario):
+    name = "model_tables"
+    description = "Load a model and read its tables (H2OTwoDimTable parsing)"
+
+    def setup(self):
+        from h2o.estimators import H2OGradientBoostingEstimator
+        self.frame = self.upload(make_rows(self.scale), column_names())
+        self.model = H2OGradientBoostingEstimator(ntrees=50, max_depth=3, seed=42)
+        self.model.train(y="response", training_frame=self.frame)
+
+    def run(self):
+        model = h2o.get_model(self.model.model_id)
+        model._model_json["output"]["scoring_history"].cell_values
+        model.varimp()
+        model.model_performance(train=True).gains_lift()
+
+    def teardown(self):
+        h2o.remove(self.model)
+        Scenario.teardown(self)
+
+
+class AsDataFrameLists(Scenario):
+    name = "as_data_frame_lists"
+    description = "Download a frame as lists of rows: as_data_frame(use_pandas=False)"
+
+    def setup(self):
+        self.frame = self.upload(make_rows(self.scale), column_names())
+
+    def run(self):
+        self.frame.as_data_frame(use_pandas=False)
+
+
+class AsDataFramePandas(AsDataFrameLists):
+    name = "as_data_frame_pandas"
+    description = "Download a frame as a pandas DataFrame: as_data_frame()"
+
+    @staticmethod
+    def available():
+        return can_use_pandas()
+
+    def run(self):
+        self.frame.as_data_frame(use_pandas=True)
+
+
+SCENARIOS = [UploadPythonList, ExprChain, FrameFill, ModelTables, AsDataFrameLists, AsDataFramePandas]
@@ -0,0 +1,399 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+A stand-in for the H2O REST server, serving the endpoints used by the client benchmarks.
+
+The server keeps the uploaded frames in memory and answers the requests with responses in the same schemas as the
+real backend: ``/3/Cloud``, ``/4/sessions``, ``/3/PostFile``, ``/3/ParseSetup``, ``/3/Parse``, ``/3/Jobs``,
+``/3/Frames``, ``/3/DownloadDataset`` (CSV and columnar), ``/99/Rapids``, ``/3/ModelBuilders`` and ``/3/Models``.
+Nothing is computed: jobs finish immediately, Rapids expressions are not evaluated (the result of an assignment is a
+copy of the largest frame referenced by the expression), and every model is the synthetic GBM model of
+``bench_response_decoding.py``. This is enough to measure the client side of the requests without a JVM, with
+responses that are fast and reproducible.
+
+The server is meant to be run in its own process, so that it doesn't count towards the CPU time of the client. It
+prints the port it is listening on, and then serves until it is killed.
+
+Usage: python stub_server.py [--port N] [--history-rows N]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import random
+import re
+import struct
+import sys
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qsl, urlsplit
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_response_decoding import make_model_json  # NOQA
+
+_KEY_TOKEN = re.compile(r"[^\s()\[\]{}'\"]+")
+
+
+def meta(schema_name, schema_type="Iced"):
+    return {"schema_version": 3, "schema_name": schema_name, "schema_type": schema_type}
+
+
+def key(name, schema_name="FrameKeyV3"):
+    return {"__meta": meta(schema_name), "name": name, "type": "Key", "URL": None}
+
+
+def parse_list(value):
+    """Decode a list parameter, such as ``["a","b"]``, sent by the client."""
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+    return [item.strip().strip("\"'") for item in value.split(",") if item.strip()]
+
+
+class StubFrame(object):
+    """An in-memory frame: a list of columns, each of them a dict with name, type, domain and data."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.nrows = len(columns[0]["data"]) if columns else 0
+
+    @staticmethod
+    def from_csv(text, header=True):
+        rows = list(csv.reader(io.StringIO(text)))
+        if header:
+            names, rows = rows[0], rows[1:]
+        else:
+            names = ["C%d" % (i + 1) for i in range(len(rows[0]) if rows else 0)]
+        columns = []
+        for i, name in enumerate(names):
+            values = [row[i] if i < len(row) else "" for row in rows]
+            columns.append(StubFrame._column(name, values))
+        return StubFrame(columns)
+
+    @staticmethod
+    def _column(name, values):
+        try:
+            numbers = [float(v) if v != "" else None for v in values]
+            is_int = all(x is None or x.is_integer() for x in numbers)
+            return {"name": name, "type": "int" if is_int else "real", "domain": None, "data": numbers}
+        except ValueError:
+            pass
+        levels = sorted(set(v for v in values if v != ""))
+        if len(levels) > 1000:
+            return {"name": name, "type": "string", "domain": None, "data": [v if v != "" else None for v in values]}
+        codes = {level: i for i, level in enumerate(levels)}
+        return {"name": name, "type": "enum", "domain": levels, "data": [codes.get(v) for v in values]}
+
+    def copy(self):
+        return StubFrame([dict(col) for col in self.columns])
+
+    def parse_types(self):
+        return [{"int": "Numeric", "real": "Numeric", "enum": "Enum", "string": "String"}[col["type"]]
+                for col in self.columns]
+
+    def column_json(self, col, row_offset, row_count):
+        data = col["data"][row_offset:row_offset + row_count]
+        present = [x for x in col["data"] if x is not None]
+        numeric = col["type"] in {"int", "real"}
+        res = {"__meta": meta("ColV3", "Vec"), "label": col["name"], "type": col["type"],
+               "missing_count": len(col["data"]) - len(present), "zero_count": 0,
+               "positive_infinity_count": 0, "negative_infinity_count": 0,
+               "mins": [min(present)] if numeric and present else [], "maxs": [max(present)] if numeric and present else [],
+               "mean": sum(present) / len(present) if numeric and present else "NaN", "sigma": "NaN",
+               "domain": col["domain"], "domain_cardinality": len(col["domain"]) if col["domain"] else 0,
+               "precision": -1, "histogram_bins": None, "histogram_base": 0, "histogram_stride": 0,
+               "percentiles": None}
+        if col["type"] == "string":
+            res["data"] = None
+            res["string_data"] = data
+        else:
+            res["data"] = ["NaN" if x is None else x for x in data]
+            res["string_data"] = None
+        return res
+
+    def frame_json(self, frame_id, row_offset=0, row_count=10, column_offset=0, column_count=-1):
+        if row_count < 0: row_count = self.nrows
+        columns = self.columns[column_offset:] if column_count < 0 else \
+            self.columns[column_offset:column_offset + column_count]
+        return {"__meta": meta("FrameV3", "Frame"), "frame_id": key(frame_id), "byte_size": 8 * self.nrows,
+                "is_text": False, "row_offset": row_offset, "row_count": row_count, "column_offset": column_offset,
+                "column_count": len(columns), "total_column_count": len(self.columns), "checksum": 0,
+                "rows": self.nrows, "num_columns": len(self.columns), "default_percentiles": [],
+                "columns": [self.column_json(col, row_offset, row_count) for col in columns],
+                "compatible_models": None, "chunk_summary": None, "distribution_summary": None}
+
+    def to_csv(self):
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow([col["name"] for col in self.columns])
+        for i in range(self.nrows):
+            writer.writerow([self._cell(col, i) for col in self.columns])
+        return out.getvalue()
+
+    @staticmethod
+    def _cell(col, i):
+        x = col["data"][i]
+        if x is None: return ""
+        if col["type"] == "enum": return col["domain"][x]
+        if col["type"] == "int": return int(x)
+        return x
+
+    def to_columnar(self):
+        """Encode the frame in the columnar binary format of ``GET /3/DownloadDataset?format=columnar``."""
+        header = json.dumps({"nrows": self.nrows, "columns": [{"name": col["name"], "type": col["type"],
+                                                               "domain": col["domain"]} for col in self.columns]})
+        header = header.encode("utf-8")
+        parts = [b"H2OC", struct.pack("<i", len(header)), header]
+        for col in self.columns:
+            data = col["data"]
+            if col["type"] == "enum":
+                parts.append(struct.pack("<%di" % self.nrows, *[-1 if x is None else x for x in data]))
+            elif col["type"] == "string":
+                encoded = [None if x is None else x.encode("utf-8") for x in data]
+                parts.append(struct.pack("<%di" % self.nrows, *[-1 if x is None else len(x) for x in encoded]))
+                parts.extend(x for x in encoded if x is not None)
+            elif col["type"] == "int":
+                parts.append(struct.pack("<%dq" % self.nrows, *[0 if x is None else int(x) for x in data]))
+                nas = bytearray((self.nrows + 7) // 8)
+                for i, x in enumerate(data):
+                    if x is None: nas[i >> 3] |= 1 << (i & 7)
+                parts.append(bytes(nas))
+            else:
+                parts.append(struct.pack("<%dd" % self.nrows, *[float("nan") if x is None else x for x in data]))
+        return b"".join(parts)
+
+
+class StubState(object):
+    """Everything the server knows about: raw uploads, parse setups, frames, jobs and models."""
+
+    def __init__(self, history_rows):
+        self.lock = threading.Lock()
+        self.counter = itertools.count(1)
+        self.raw = {}
+        self.frames = {}
+        self.jobs = {}
+        self.models = {}
+        random.seed(42)
+        self.model_template = json.loads(make_model_json(history_rows).decode("utf-8"))
+        output = self.model_template["models"][0]["output"]
+        output["model_category"] = "Binomial"
+        output["cross_validation_models"] = None
+
+    def new_id(self, prefix):
+        return "%s_%d" % (prefix, next(self.counter))
+
+    def new_job(self, dest, description):
+        job_id = self.new_id("$03017f00000132d4ffffffff$_job")
+        job = {"__meta": meta("JobV3", "Job"), "key": key(job_id, "JobKeyV3"), "description": description,
+               "status": "DONE", "progress": 1.0, "progress_msg": "Done.", "start_time": 0, "msec": 1,
+               "dest": key(dest), "warnings": None, "exception": None, "stacktrace": None, "ready_for_view": True}
+        self.jobs[job_id] = job
+        return job
+
+    def model_json(self, model_id):
+        model = self.models.get(model_id)
+        if model is None:
+            template = self.model_template
+            template["models"][0]["model_id"] = key(model_id, "ModelKeyV3")
+            model = self.models[model_id] = json.dumps(template).encode("utf-8")
+        return model
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Dispatch the requests to the ``route_*`` methods, by the resource name in the URL."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # the headers and the body are sent separately
+    state = None
+
+    def log_message(self, *args):
+        pass
+
+    def handle_request(self):
+        url = urlsplit(self.path)
+        self.params = dict(parse_qsl(url.query, keep_blank_values=True))
+        self.body = self.read_body()
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            self.params.update(parse_qsl(self.body.decode("utf-8"), keep_blank_values=True))
+        parts = url.path.strip("/").split("/")
+        route = getattr(self, "route_%s" % parts[1].lower(), None) if len(parts) > 1 else None
+        if route is None:
+            return self.send_error_json(404, "Resource %s not found" % url.path)
+        with self.state.lock:
+            route(parts[2:])
+
+    do_GET = do_POST = do_DELETE = handle_request
+
+    def read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def send(self, body, content_type="application/json", code=200):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8") if content_type == "application/json" else body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, code, msg):
+        self.send({"__meta": meta("H2OErrorV3", "H2OError"), "msg": msg, "dev_msg": msg, "http_status": code,
+                   "values": {}, "exception_type": "", "exception_msg": msg, "stacktrace": []}, code=code)
+
+    def multipart_file(self):
+        """Content of the (only) file in a multipart/form-data request body."""
+        boundary = self.headers.get("Content-Type").split("boundary=")[-1].strip("\"").encode("ascii")
+        part = self.body.split(b"--" + boundary)[1]
+        return part[part.index(b"\r\n\r\n") + 4:-2]
+
+    # ---- Endpoints ----
+
+    def route_cloud(self, args):
+        self.send({"__meta": meta("CloudV3"), "version": "3.99.0.99999", "branch_name": "stub", "build_number": "0",
+                   "build_age": "0 days", "build_too_old": False, "node_idx": 0, "cloud_name": "stub",
+                   "cloud_size": 1, "cloud_uptime_millis": 0, "cloud_healthy": True, "bad_nodes": 0,
+                   "consensus": True, "locked": True, "is_client": False, "nodes": [], "internal_security_enabled":
+                   False})
+
+    def route_sessions(self, args):
+        self.send({"__meta": meta("InitIDV3"), "session_key": "_sid_stub"})
+
+    def route_postfile(self, args):
+        raw_id = self.params.get("destination_frame") or self.state.new_id("upload")
+        self.state.raw[raw_id] = self.multipart_file()
+        self.send({"__meta": meta("PostFileV3"), "destination_frame": raw_id, "total_bytes": len(self.body)})
+
+    def route_parsesetup(self, args):
+        source = parse_list(self.params["source_frames"])[0]
+        frame = StubFrame.from_csv(self.state.raw[source].decode("utf-8"), self.params.get("check_header") != "-1")
+        self.state.raw[source] = frame
+        self.send({"__meta": meta("ParseSetupV3"), "source_frames": [key(source)], "parse_type": "CSV",
+                   "separator": 44, "single_quotes": False, "check_header": 1, "number_columns": len(frame.columns),
+                   "column_names": [col["name"] for col in frame.columns], "column_types": frame.parse_types(),
+                   "na_strings": None, "chunk_size": 4194304, "destination_frame": source + ".hex",
+                   "header_lines": 0, "warnings": None})
+
+    def route_parse(self, args):
+        dest = self.params["destination_frame"].strip("\"")
+        self.state.frames[dest] = self.state.raw.pop(parse_list(self.params["source_frames"])[0])
+        self.send({"__meta": meta("ParseV3"), "destination_frame": key(dest), "job": self.state.new_job(dest, "Parse")})
+
+    def route_jobs(self, args):
+        job = self.state.jobs.get(args[0]) if args else None
+        if job is None:
+            return self.send_error_json(404, "Job not found")
+        self.send({"__meta": meta("JobsV3"), "jobs": [job]})
+
+    def route_frames(self, args):
+        frame = self.state.frames.get(args[0]) if args else None
+        if frame is None:
+            return self.send_error_json(404, "Object not found")
+        p = self.params
+        self.send({"__meta": meta("FramesV3"), "frames": [
+            frame.frame_json(args[0], int(p.get("row_offset", 0)), int(p.get("row_count", 10)),
+                             int(p.get("column_offset", 0)), int(p.get("column_count", -1)))]})
+
+    def route_downloaddataset(self, args):
+        frame = self.state.frames.get(self.params.get("frame_id"))
+        if frame is None:
+            return self.send_error_json(404, "Object not found")
+        if self.params.get("format") == "columnar":
+            self.send(frame.to_columnar(), "application/x-h2o-columnar")
+        else:
+            self.send(frame.to_csv(), "text/plain")
+
+    def route_rapids(self, args):
+        ast = self.params["ast"]
+        if ast.startswith("(rm "):
+            for frame_id in _KEY_TOKEN.findall(ast[4:]):
+                self.state.frames.pop(frame_id, None)
+            return self.send({"__meta": meta("RapidsSchemaV3")})
+        # Nothing is evaluated: the results are copies of the largest frame that the expression refers to
+        referenced = [self.state.frames[t] for t in _KEY_TOKEN.findall(ast) if t in self.state.frames]
+        source = max(referenced, key=lambda fr: (fr.nrows, len(fr.columns))) if referenced else StubFrame([])
+        assigned = re.findall(r"\(tmp= ([^\s()]+)", ast) + re.findall(r"\(assign ([^\s()]+)", ast)
+        for frame_id in assigned:
+            self.state.frames[frame_id] = source.copy()
+        info = re.search(r"\(frameInfo ([^()]*)\)", ast)
+        if info:
+            strings = []
+            for frame_id in info.group(1).split():
+                frame = self.state.frames[frame_id]
+                strings += [str(frame.nrows), str(len(frame.columns))] + [col["name"] for col in frame.columns] + \
+                    [col["type"] for col in frame.columns]
+            self.send({"__meta": meta("RapidsStringsV3"), "string": strings})
+        elif assigned:
+            self.send({"__meta": meta("RapidsFrameV3"), "key": key(assigned[-1]), "num_rows": source.nrows,
+                       "num_cols": len(source.columns)})
+        else:
+            self.send({"__meta": meta("RapidsNumberV3"), "scalar": 0.0})
+
+    def route_modelbuilders(self, args):
+        model_id = self.params.get("model_id") or self.state.new_id("%s_model_stub" % args[0].upper())
+        self.send({"__meta": meta("ModelBuilderV3"), "algo": args[0], "messages": [], "error_count": 0,
+                   "job": self.state.new_job(model_id, "%s model build" % args[0])})
+
+    def route_models(self, args):
+        if not args:
+            return self.send_error_json(404, "Model not found")
+        self.send(self.state.model_json(args[0]))
+
+    def route_dkv(self, args):
+        if args:
+            self.state.frames.pop(args[0], None)
+            self.state.models.pop(args[0], None)
+        else:
+            self.state.frames.clear()
+            self.state.models.clear()
+        self.send({"__meta": meta("RemoveV3")})
+
+
+class StubH2OServer(ThreadingMixIn, HTTPServer):
+    """The stand-in H2O server; ``serve_forever()`` runs it."""
+
+    daemon_threads = True
+
+    def __init__(self, port=0, history_rows=2000):
+        handler = type(str("Handler"), (StubHandler,), {"state": StubState(history_rows)})
+        HTTPServer.__init__(self, ("127.0.0.1", port), handler)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--port", type=int, default=0, help="port to listen on (by default any free port)")
+    parser.add_argument("--history-rows", type=int, default=2000, help="rows of the models' scoring history table")
+    args = parser.parse_args()
+    server = StubH2OServer(args.port, args.history_rows)
+    print("port %d" % server.port)
+    sys.stdout.flush()
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ from h2o.h2o import (connect, init, api, connection,
                      lazy_import, upload_file, import_file, import_sql_table, import_sql_select,
                      parse_setup, parse_raw, assign, deep_copy, get_model, get_grid, get_frame,
                      show_progress, no_progress, enable_expr_optimizations, is_expr_optimizations_enabled,
-                     log_and_echo, remove, remove_all, rapids,
+                     evaluate_all, batch, flush_temps, set_temps_gc, log_and_echo, remove, remove_all, rapids,
                      ls, frame, frames, create_frame,
                      download_pojo, download_csv, download_all_logs, save_model, load_model, export_file,
                      cluster_status, cluster_info, shutdown, network_test, cluster,
@@ -23,6 +23,10 @@ from h2o.h2o import (connect, init, api, connection,
 # root h2o module, without exporting it explicitly. In the future this import may be removed entirely, so that
 # one would have to import it from h2o.frames.
 from h2o.frame import H2OFrame  # NOQA
+from h2o.utils.shared_utils import lazy_attributes
+
+# The subpackages with the model builders are only imported on first use, such as `h2o.estimators.H2OKMeansEstimator`.
+__getattr__ = lazy_attributes(__name__, {}, submodules=("estimators", "grid", "transforms"))
 
 import os
 from codecs import open
@@ -40,7 +44,8 @@ if (__version__.endswith("99999")):
 
 __all__ = ("connect", "init", "api", "connection", "upload_file", "lazy_import", "import_file", "import_sql_table",
            "import_sql_select", "parse_setup", "parse_raw", "assign", "deep_copy", "get_model", "get_grid", "get_frame",
-           "show_progress", "no_progress", "enable_expr_optimizations", "is_expr_optimizations_enabled", "log_and_echo",
+           "show_progress", "no_progress", "enable_expr_optimizations", "is_expr_optimizations_enabled", "evaluate_all",
+           "batch", "flush_temps", "set_temps_gc", "log_and_echo",
            "remove", "remove_all", "rapids", "ls", "frame",
            "frames", "download_pojo", "download_csv", "download_all_logs", "save_model", "load_model", "export_file",
            "cluster_status", "cluster_info", "shutdown", "create_frame", "interaction", "as_list", "network_test",
@@ -132,9 +132,13 @@ class H2OAutoML(object):
     
 
         self._job = None
+        self._future = False  # if True, .train() only starts the AutoML job (see .train_async())
         self._automl_key = None
         self._leader_id = None
-        self._leaderboard = None
+        self._leader = None            # leader model, fetched on first access
+        self._model_ids = None         # models in the leaderboard (best first), as of the last fetch
+        self._leaderboard = None       # leaderboard frame, created on the server on first access
+        self._leaderboard_project = None
 
     #---------------------------------------------------------------------------
     # Basic properties
@@ -154,13 +158,20 @@ class H2OAutoML(object):
         >>> # Get the best model in the AutoML Leaderboard
         >>> aml.leader
         """
-        return h2o.get_model(self._leader_id)
+        if self._leader_id is None:
+            return None
+        if self._leader is None:
+            self._leader = h2o.get_model(self._leader_id)
+        return self._leader
 
     @property
     def leaderboard(self):
         """
         Retrieve the leaderboard from an H2OAutoML object
 
+        The leaderboard is created as a frame on the server the first time it is requested, and then kept until the
+        set of models changes (see :meth:`refresh`).
+
         :return: an H2OFrame with model ids in the first column and evaluation metric in the second column sorted
                  by the evaluation metric
 
@@ -172,8 +183,27 @@ class H2OAutoML(object):
         >>> # Get the AutoML Leaderboard
         >>> aml.leaderboard
         """
+        if self._leaderboard is None and self._leaderboard_project is not None:
+            res = h2o.api("POST /99/Leaderboards/%s/frame" % self._leaderboard_project)
+            # The run may have progressed since the last fetch: keep the leader consistent with the frame
+            self._update_models([key["name"] for key in res["models"]])
+            # A new snapshot is created whenever the models change: it is removed from the server once it is
+            # garbage-collected
+            self._leaderboard = H2OFrame._temp_frame(res["table_frame"]["name"])
         return self._leaderboard
 
+    def refresh(self):
+        """
+        Fetch the current state of the AutoML run.
+
+        This can be called while the run is in progress (see :meth:`train_async`) to follow the leaderboard as models
+        are being added: the :attr:`leaderboard` and :attr:`leader` are only fetched again if the models in the
+        leaderboard have changed.
+
+        :returns: True if the leaderboard has changed since it was last fetched.
+        """
+        return self._fetch()
+
     #---------------------------------------------------------------------------
     # Training AutoML
     #---------------------------------------------------------------------------
@@ -278,9 +308,42 @@ class H2OAutoML(object):
 
         self._job = H2OJob(resp['job'], "AutoML")
         self._automl_key = self._job.dest_key
+        # The run adds models to the leaderboard: the cached leader and leaderboard are fetched again when requested
+        self._model_ids = self._leader_id = self._leader = self._leaderboard = None
+        if self._future:
+            return
         self._job.poll()
         self._fetch()
 
+    def train_async(self, x=None, y=None, training_frame=None, fold_column=None, weights_column=None,
+                    validation_frame=None, leaderboard_frame=None, conn=None):
+        """
+        Run AutoML from an asyncio event loop: ``await aml.train_async(...)`` (requires Python 3.5+).
+
+        The parameters are the same as for :meth:`train`; the AutoML job is started and waited for without
+        blocking the event loop.
+
+        :param conn: the :class:`AsyncH2OConnection` to use (by default a shared one).
+        :returns: an awaitable which resolves to this H2OAutoML object once the run is finished.
+        """
+        from h2o.backend.async_connection import AsyncH2OConnection
+
+        def start():
+            self._future = True
+            try:
+                self.train(x=x, y=y, training_frame=training_frame, fold_column=fold_column,
+                           weights_column=weights_column, validation_frame=validation_frame,
+                           leaderboard_frame=leaderboard_frame)
+            finally:
+                self._future = False
+            return self._job
+
+        def finish(job):
+            self._fetch()
+            return self
+
+        return (conn or AsyncH2OConnection.default()).build(start, finish)
+
     #---------------------------------------------------------------------------
     # Predict with AutoML
     #---------------------------------------------------------------------------
@@ -301,9 +364,10 @@ class H2OAutoML(object):
         >>> aml.predict(test_data)
 
         """
-        if self._fetch():
-            self._model = h2o.get_model(self._leader_id)
-            return self._model.predict(test_data)
+        if self._model_ids is None and self._automl_key is not None:
+            self._fetch()
+        if self._leader_id is not None:
+            return self.leader.predict(test_data)
         print("No model built yet...")
 
     #-------------------------------------------------------------------------------------------------------------------
@@ -311,14 +375,20 @@ class H2OAutoML(object):
     #-------------------------------------------------------------------------------------------------------------------
     def _fetch(self):
         res = h2o.api("GET /99/AutoML/" + self._automl_key)
-        leaderboard_list = [key["name"] for key in res['leaderboard']['models']]
-
-        if leaderboard_list is not None and len(leaderboard_list) > 0:
-            self._leader_id = leaderboard_list[0]
-        else:
-            self._leader_id = None
-        self._leaderboard = h2o.H2OFrame(res["leaderboard_table"].as_data_frame())[1:]
-        return self._leader_id is not None
+        self._leaderboard_project = res["leaderboard"]["project_name"]
+        return self._update_models([key["name"] for key in res["leaderboard"]["models"]])
+
+    def _update_models(self, model_ids):
+        """Record the models currently in the leaderboard, and drop the cached leaderboard and leader if they changed."""
+        if model_ids == self._model_ids:
+            return False
+        self._model_ids = model_ids
+        self._leaderboard = None
+        new_leader_id = model_ids[0] if model_ids else None
+        if new_leader_id != self._leader_id:
+            self._leader_id = new_leader_id
+            self._leader = None
+        return True
 
     def _get_params(self):
         res = h2o.api("GET /99/AutoML/" + self._automl_key)
@@ -13,6 +13,9 @@ Classes for communication with backend H2O servers.
 :class:`H2OCluster`
     Handle to the remote H2O cluster -- used mainly to retrieve information about it.
 
+:class:`AsyncH2OConnection` (in :mod:`h2o.backend.async_connection`, Python 3.5+)
+    Drive many server jobs concurrently from an asyncio event loop.
+
 The :mod:`h2o` module has convenience functions for accessing these classes, and those are the ones that are
 recommended for everyday use. The following are the common use cases:
 
@@ -45,10 +48,11 @@ from .connection import H2OConnection
 from .connection import H2OConnectionConf
 
 import colorama
-from distutils.version import StrictVersion
+import re
 import sys
 
-if StrictVersion(colorama.__version__) < StrictVersion("0.3.8"):
+# Compare the numeric parts of the version (distutils is slow to import, and not available in recent Pythons)
+if tuple(int(x) for x in re.findall(r"\d+", colorama.__version__)[:3]) < (0, 3, 8):
     print("[WARNING] H2O requires colorama module of version 0.3.8 or newer. You have version %s.\n"
           "You can upgrade to the newest version of the module running from the command line\n"
           "    $ pip%s install --upgrade colorama" % (colorama.__version__, sys.version_info[0]))
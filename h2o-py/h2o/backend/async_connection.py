@@ -0,0 +1,119 @@
+# -*- encoding: utf-8 -*-
+"""
+Asynchronous access to an H2O server, for applications built on :mod:`asyncio` (requires Python 3.5+).
+
+`AsyncH2OConnection` lets one event loop drive many server jobs at the same time::
+
+    conn = AsyncH2OConnection(max_jobs=10)
+    models = [H2OGradientBoostingEstimator(ntrees=n) for n in range(10, 200, 10)]
+    await asyncio.gather(*[m.train_async(y="y", training_frame=fr, conn=conn) for m in models])
+
+The same is available as ``await job.wait()``, ``await frame.collect()``, ``await grid.train_async(...)`` and
+``await automl.train_async(...)``; without the ``conn`` argument these use a shared default instance.
+
+:copyright: (c) 2016 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import h2o
+
+__all__ = ("AsyncH2OConnection", )
+
+# asyncio.get_running_loop() exists since Python 3.7; before that, get_event_loop() called from a coroutine returns
+# the running loop too
+_get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class AsyncH2OConnection(object):
+    """
+    Asynchronous front-end to the current H2O connection.
+
+    Requests are sent by the regular (blocking) connection on a pool of at most ``max_requests`` threads, so the event
+    loop itself never blocks. Jobs are waited for by long-polling their status (see :class:`H2OJob`), which holds a
+    pool thread only for the duration of one request -- not for the whole job. If ``max_jobs`` is given, then at most
+    that many jobs started through this object run on the cluster at the same time, the others wait for a free slot
+    before being started (the limit applies to each event loop separately).
+    """
+
+    _default = None
+
+    def __init__(self, max_requests=16, max_jobs=None):
+        self._executor = ThreadPoolExecutor(max_workers=max_requests)
+        self._max_jobs = max_jobs
+        # Semaphores are bound to the event loop they are first used in, so each loop gets its own
+        self._job_slots = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def default(cls):
+        """The shared instance used when no explicit ``conn`` is given to the ``*_async`` methods."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    async def run(self, fn, *args, **kwargs):
+        """Call the (blocking) function ``fn(*args, **kwargs)`` on the thread pool, and return its result."""
+        loop = _get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def request(self, endpoint, data=None, json=None, filename=None, save_to=None):
+        """Make a REST API request to the server, see :meth:`H2OConnection.request`."""
+        return await self.run(h2o.api, endpoint, data=data, json=json, filename=filename, save_to=save_to)
+
+    async def wait_job(self, job):
+        """
+        Wait until the job finishes.
+
+        :param H2OJob job: the job to wait for.
+        :returns: the job, if it finished successfully.
+        :raises H2OJobCancelled: if the job was cancelled, and ``EnvironmentError`` if it failed (same as
+            :meth:`H2OJob.poll`). If the waiting task itself is cancelled, then the job is cancelled on the server.
+        """
+        try:
+            while True:
+                res = await self.run(_refresh_job_status, job)
+                if res is None or job.status not in {"CREATED", "RUNNING"}:
+                    break
+                if res[1] > 0:
+                    await asyncio.sleep(res[1])
+        except asyncio.CancelledError:
+            await self.request("POST /3/Jobs/%s/cancel" % job.job_key)
+            raise
+        return job._check_status()
+
+    async def build(self, start, finish):
+        """
+        Run a server job that computes something, such as a model build.
+
+        :param start: blocking function which starts the job and returns its :class:`H2OJob`.
+        :param finish: blocking function which is called with the finished job, and retrieves its results.
+        :returns: the return value of ``finish``.
+        """
+        if not self._max_jobs:
+            job = await self.run(start)
+            await self.wait_job(job)
+        else:
+            loop = _get_running_loop()
+            if loop not in self._job_slots:
+                self._job_slots[loop] = asyncio.Semaphore(self._max_jobs)
+            async with self._job_slots[loop]:
+                job = await self.run(start)
+                await self.wait_job(job)
+        return await self.run(finish, job)
+
+    def close(self):
+        """Release the thread pool; requests that are already running will be completed."""
+        self._executor.shutdown(wait=False)
+
+
+def _refresh_job_status(job):
+    # StopIteration cannot be passed through an asyncio future
+    try:
+        return job._refresh_job_status()
+    except StopIteration:
+        return None
@@ -20,12 +20,17 @@ import re
 import sys
 import tempfile
 import time
+import types
+import uuid
 from warnings import warn
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from requests.packages.urllib3.util.retry import Retry
 
 from h2o.backend import H2OCluster, H2OLocalServer
+from h2o.backend.tracing import H2ORequestTracer
 from h2o.exceptions import H2OConnectionError, H2OServerError, H2OResponseError, H2OValueError
 from h2o.schemas.error import H2OErrorV3, H2OModelBuilderErrorV3
 from h2o.two_dim_table import H2OTwoDimTable
@@ -210,12 +215,14 @@ class H2OConnection(backwards_compatible()):
 
     @staticmethod
     def open(server=None, url=None, ip=None, port=None, https=None, auth=None, verify_ssl_certificates=True,
-             proxy=None, cookies=None, verbose=True, _msgs=None):
+             proxy=None, cookies=None, verbose=True, pool_size=10, max_retries=3, json_decoder=None,
+             lazy_responses=False, _msgs=None):
         r"""
         Establish connection to an existing H2O server.
 
-        The connection is not kept alive, so what this method actually does is it attempts to connect to the
-        specified server, and checks that the server is healthy and responds to REST API requests. If the H2O server
+        What this method actually does is it attempts to connect to the specified server, and checks that the server
+        is healthy and responds to REST API requests. Sockets to the server are pooled and kept alive between
+        requests, until the connection is closed. If the H2O server
         cannot be reached, an :class:`H2OConnectionError` will be raised. On success this method returns a new
         :class:`H2OConnection` object, and it is the only "official" way to create instances of this class.
 
@@ -246,6 +253,15 @@ class H2OConnection(backwards_compatible()):
             that warning and use proxy from the environment, pass ``proxy="(default)"``.
         :param cookies: Cookie (or list of) to add to requests
         :param verbose: if True, then connection progress info will be printed to the stdout.
+        :param pool_size: maximum number of keep-alive sockets held open to the server (default 10). Requests made
+            through this connection reuse these sockets instead of performing a new TCP/TLS handshake each time.
+        :param max_retries: how many times an idempotent (GET) request will be retried, with exponential backoff, if
+            the server cannot be reached or responds with a "bad gateway / unavailable" status (default 3).
+        :param json_decoder: a function decoding JSON documents (given as bytes) into python dicts and lists, to use
+            instead of the standard ``json`` module -- for example ``orjson.loads`` or ``ujson.loads``. Large
+            responses such as models are decoded several times faster this way. See :attr:`json_decoder`.
+        :param lazy_responses: if True, the schema objects in the responses (tables, model metrics...) are built only
+            when they are first accessed. See :attr:`lazy_responses`.
         :param _msgs: custom messages to display during connection. This is a tuple (initial message, success message,
             failure message).
 
@@ -291,6 +307,12 @@ class H2OConnection(backwards_compatible()):
         assert_is_type(proxy, str, None)
         assert_is_type(auth, AuthBase, (str, str), None)
         assert_is_type(cookies, str, [str], None)
+        assert_is_type(pool_size, int)
+        assert_is_type(max_retries, int)
+        assert_satisfies(pool_size, pool_size >= 1)
+        assert_satisfies(max_retries, max_retries >= 0)
+        assert_satisfies(json_decoder, json_decoder is None or callable(json_decoder))
+        assert_is_type(lazy_responses, bool)
         assert_is_type(_msgs, None, (str, str, str))
 
         conn = H2OConnection()
@@ -300,6 +322,9 @@ class H2OConnection(backwards_compatible()):
         conn._verify_ssl_cert = bool(verify_ssl_certificates)
         conn._auth = auth
         conn._cookies = cookies
+        conn._requests_session = H2OConnection._make_requests_session(pool_size)
+        conn._json_decoder = json_decoder
+        conn._lazy_responses = lazy_responses
         conn._proxies = None
         if proxy and proxy != "(default)":
             conn._proxies = {scheme: proxy}
@@ -319,6 +344,8 @@ class H2OConnection(backwards_compatible()):
             # If a server is unable to respond within 1s, it should be considered a bug. However we disable this
             # setting for now, for no good reason other than to ignore all those bugs :(
             conn._timeout = None
+            # Retries are enabled only now, since _test_connection() already retries while the server is starting up
+            conn._set_max_retries(max_retries)
             # This is a good one! On the surface it registers a callback to be invoked when the script is about
             # to finish, but it also has a side effect in that the reference to current connection will be held
             # by the ``atexit`` service till the end -- which means it will never be garbage-collected.
@@ -338,13 +365,16 @@ class H2OConnection(backwards_compatible()):
         :param data: data payload for POST (and sometimes GET) requests. This should be a dictionary of simple
             key/value pairs (values can also be arrays), which will be sent over in x-www-form-encoded format.
         :param json: also data payload, but it will be sent as a JSON body. Cannot be used together with `data`.
-        :param filename: file to upload to the server. Cannot be used with `data` or `json`.
+        :param filename: file to upload to the server. Cannot be used with `data` or `json`. This can also be a
+            generator of the file's content (as chunks of bytes), in which case the content is streamed to the server
+            as it is being generated, without holding all of it in memory.
         :param save_to: if provided, will write the response to that file (additionally, the response will be
             streamed, so large files can be downloaded seamlessly). This parameter can be either a file name,
-            or a folder name. If the folder doesn't exist, it will be created automatically.
+            or a folder name. If the folder doesn't exist, it will be created automatically. It can also be an open
+            file object (anything with a ``write`` method), to which the response is written.
 
         :returns: an H2OResponse object representing the server's response (unless ``save_to`` parameter is
-            provided, in which case the output file's name will be returned).
+            provided, in which case the output file's name -- or the file object -- will be returned).
         :raises H2OConnectionError: if the H2O server cannot be reached (or connection is not initialized)
         :raises H2OServerError: if there was a server error (http 500), or server returned malformed JSON
         :raises H2OResponseError: if the server returned an H2OErrorV3 response (e.g. if the parameters were invalid)
@@ -361,7 +391,7 @@ class H2OConnection(backwards_compatible()):
 
         # Prepare data
         if filename is not None:
-            assert_is_type(filename, str)
+            assert_is_type(filename, str, types.GeneratorType)
             assert_is_type(json, None, "Argument `json` should be None when `filename` is used.")
             assert_is_type(data, None, "Argument `data` should be None when `filename` is used.")
             assert_satisfies(method, method == "POST",
@@ -373,7 +403,14 @@ class H2OConnection(backwards_compatible()):
             assert_is_type(json, dict)
 
         data = self._prepare_data_payload(data)
-        files = self._prepare_file_payload(filename)
+        files = None
+        content_type = None
+        upload_size = [0]  # size of a streamed request body, counted as it is being sent
+        if is_type(filename, str):
+            files = self._prepare_file_payload(filename)
+        elif filename is not None:
+            data, content_type = self._prepare_stream_payload(filename)
+            data = self._count_bytes(data, upload_size)
         params = None
         if method == "GET" and data:
             params = data
@@ -381,7 +418,7 @@ class H2OConnection(backwards_compatible()):
 
         stream = False
         if save_to is not None:
-            assert_is_type(save_to, str)
+            assert_satisfies(save_to, is_type(save_to, str) or hasattr(save_to, "write"))
             stream = True
 
         if self._cookies is not None and isinstance(self._cookies, list):
@@ -389,17 +426,23 @@ class H2OConnection(backwards_compatible()):
 
         # Make the request
         start_time = time.time()
+        resp = None
+        status = None
         try:
             self._log_start_transaction(endpoint, data, json, files, params)
 
             headers = {"User-Agent": "H2O Python client/" + sys.version.replace("\n", ""),
                        "X-Cluster": self._cluster_id,
                        "Cookie": self._cookies}
-            resp = requests.request(method=method, url=url, data=data, json=json, files=files, params=params,
-                                    headers=headers, timeout=self._timeout, stream=stream,
-                                    auth=self._auth, verify=self._verify_ssl_cert, proxies=self._proxies)
+            if content_type:
+                headers["Content-Type"] = content_type
+            resp = self._requests_session.request(method=method, url=url, data=data, json=json, files=files,
+                                                  params=params, headers=headers, timeout=self._timeout,
+                                                  stream=stream, auth=self._auth, verify=self._verify_ssl_cert,
+                                                  proxies=self._proxies)
+            status = resp.status_code
             self._log_end_transaction(start_time, resp)
-            return self._process_response(resp, save_to)
+            return self._process_response(resp, save_to, self._json_decoder, self._lazy_responses)
 
         except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
             if self._local_server and not self._local_server.is_running():
@@ -417,6 +460,11 @@ class H2OConnection(backwards_compatible()):
             err.endpoint = endpoint
             err.payload = (data, json, files, params)
             raise
+        finally:
+            if self._tracer.enabled:
+                if status is None: status = type(sys.exc_info()[1]).__name__
+                self._tracer.record(endpoint, start_time, time.time() - start_time, status,
+                                    self._request_size(resp, upload_size[0]), self._response_size(resp))
 
 
     def close(self):
@@ -436,6 +484,11 @@ class H2OConnection(backwards_compatible()):
             except Exception:
                 pass
             self._session_id = None
+        self.stop_logging(quiet=True)
+        if self._requests_session is not None:
+            self._sockets_counter = self.sockets_count
+            self._requests_session.close()
+            self._requests_session = None
         self._stage = -1
 
 
@@ -480,6 +533,46 @@ class H2OConnection(backwards_compatible()):
         """Total number of request requests made since the connection was opened (used for debug purposes)."""
         return self._requests_counter
 
+    @property
+    def sockets_count(self):
+        """
+        Number of sockets opened, and of requests that reused an already open keep-alive socket (debug purposes).
+
+        :returns: a dictionary ``{"new": <sockets opened>, "reused": <requests served by an existing socket>}``.
+        """
+        if self._requests_session is None:
+            return dict(self._sockets_counter)
+        opened = requested = 0
+        for adapter in set(viewvalues(self._requests_session.adapters)):  # same adapter serves http and https
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                try:
+                    pool = pools[key]
+                except KeyError:  # pool was evicted in the meantime
+                    continue
+                opened += pool.num_connections
+                requested += pool.num_requests
+        return {"new": opened, "reused": max(requested - opened, 0)}
+
+    @property
+    def tracer(self):
+        """The :class:`H2ORequestTracer` recording the latency and size of all requests made over this connection."""
+        return self._tracer
+
+    def stats(self):
+        """
+        Summary of the requests made over this connection, grouped by endpoint.
+
+        For each endpoint the table shows the number of calls and errors, the total time, the mean, median, 95th
+        percentile and maximum latency, the bytes sent and received, and the line of code that made the most calls.
+        Use :attr:`tracer` to get the raw statistics, or to export them as JSON or as a Chrome trace.
+
+        :examples:
+            >>> h2o.connection().stats()
+            >>> h2o.connection().tracer.to_chrome_trace("h2o-requests.json")
+        """
+        return self._tracer.summary()
+
     @property
     def timeout_interval(self):
         """Timeout length for each request, in seconds."""
@@ -490,6 +583,45 @@ class H2OConnection(backwards_compatible()):
         assert_is_type(v, numeric, None)
         self._timeout = v
 
+    @property
+    def json_decoder(self):
+        """
+        Function used to decode the JSON responses of the server, or None to use the standard ``json`` module.
+
+        Any function that takes a JSON document as bytes and returns python dicts and lists can be used. The schema
+        objects in the document (tables, model metrics, errors...) are converted after decoding.
+
+        :examples:
+            >>> import orjson
+            >>> h2o.connection().json_decoder = orjson.loads
+        """
+        return self._json_decoder
+
+    @json_decoder.setter
+    def json_decoder(self, v):
+        assert_satisfies(v, v is None or callable(v))
+        self._json_decoder = v
+
+    @property
+    def lazy_responses(self):
+        """
+        If True, the schema objects in the JSON responses of the server are built only when first accessed.
+
+        The responses are then decoded into plain dicts and lists, and each nested object is converted into its
+        client class (:class:`H2OTwoDimTable`, model metrics, etc.) the first time it is read from its parent. This
+        saves the construction of the many tables of a large model that the caller never looks at. The results are
+        the same as with the default (eager) decoding, see :class:`H2OLazyResponse`.
+
+        :examples:
+            >>> h2o.connection().lazy_responses = True
+        """
+        return self._lazy_responses
+
+    @lazy_responses.setter
+    def lazy_responses(self, v):
+        assert_is_type(v, bool)
+        self._lazy_responses = v
+
 
     def start_logging(self, dest=None):
         """
@@ -502,14 +634,20 @@ class H2OConnection(backwards_compatible()):
         if dest is None:
             dest = os.path.join(tempfile.mkdtemp(), "h2o-connection.log")
         self._print("Now logging all API requests to file %r" % dest)
+        self.stop_logging(quiet=True)
         self._is_logging = True
         self._logging_dest = dest
+        if is_type(dest, str):
+            self._logging_file = open(dest, "at", encoding="utf-8")
 
-    def stop_logging(self):
+    def stop_logging(self, quiet=False):
         """Stop logging API requests."""
         if self._is_logging:
-            self._print("Logging stopped.")
+            if not quiet: self._print("Logging stopped.")
             self._is_logging = False
+            if self._logging_file is not None:
+                self._logging_file.close()
+                self._logging_file = None
 
 
     #-------------------------------------------------------------------------------------------------------------------
@@ -531,9 +669,15 @@ class H2OConnection(backwards_compatible()):
         self._cluster = None        # H2OCluster object
         self._verbose = None        # Print detailed information about connection status
         self._requests_counter = 0  # how many API requests were made
+        self._requests_session = None  # requests.Session holding the pool of keep-alive sockets to the server
+        self._json_decoder = None   # function decoding JSON responses, if not the standard json module
+        self._lazy_responses = False  # build the schema objects of JSON responses only when they are accessed
+        self._sockets_counter = {"new": 0, "reused": 0}  # sockets usage, preserved after the connection is closed
         self._timeout = None        # timeout for a single request (in seconds)
         self._is_logging = False    # when True, log every request
         self._logging_dest = None   # where the log messages will be written, either filename or open file handle
+        self._logging_file = None   # file opened by start_logging() when the destination is a file name
+        self._tracer = H2ORequestTracer()  # statistics of all requests
         self._local_server = None   # H2OLocalServer instance to which we are connected (if known)
         # self.start_logging(sys.stdout)
 
@@ -588,6 +732,33 @@ class H2OConnection(backwards_compatible()):
                                      % (self._base_url, max_retries, "\n".join(errors)))
 
 
+    @staticmethod
+    def _make_requests_session(pool_size):
+        """Create a ``requests.Session`` that keeps up to `pool_size` sockets to the server alive between requests."""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+    def _set_max_retries(self, max_retries):
+        """
+        Make the pooled sockets retry failed requests up to `max_retries` times, with exponential backoff.
+
+        Only idempotent GET requests are retried on read errors or 502/503/504 responses -- everything else is sent
+        exactly once, since e.g. re-posting a Rapids expression may have side effects on the server.
+        """
+        retry_kwargs = dict(total=max_retries, connect=max_retries, read=max_retries, redirect=None,
+                            status_forcelist=(502, 503, 504), backoff_factor=0.2, raise_on_status=False)
+        try:
+            retry = Retry(allowed_methods=frozenset(["GET"]), **retry_kwargs)
+        except TypeError:  # urllib3 < 1.26
+            retry = Retry(method_whitelist=frozenset(["GET"]), **retry_kwargs)
+        for adapter in set(viewvalues(self._requests_session.adapters)):
+            adapter.max_retries = retry
+
+
     @staticmethod
     def _prepare_data_payload(data):
         """
@@ -625,16 +796,61 @@ class H2OConnection(backwards_compatible()):
         return {os.path.basename(absfilename): open(absfilename, "rb")}
 
 
+    @staticmethod
+    def _prepare_stream_payload(chunks):
+        """
+        Wrap a generator of file content chunks into a streamed multipart/form-data request body.
+
+        :returns: a tuple (body generator, value of the Content-Type header).
+        """
+        boundary = uuid.uuid4().hex
+
+        def body():
+            yield ("--%s\r\nContent-Disposition: form-data; name=\"file\"; filename=\"upload\"\r\n"
+                   "Content-Type: application/octet-stream\r\n\r\n" % boundary).encode("ascii")
+            for chunk in chunks:
+                if chunk:
+                    yield chunk
+            yield ("\r\n--%s--\r\n" % boundary).encode("ascii")
+
+        return body(), "multipart/form-data; boundary=%s" % boundary
+
+
+    @staticmethod
+    def _count_bytes(chunks, counter):
+        """Pass the chunks of a streamed request body through, adding their sizes to ``counter[0]``."""
+        for chunk in chunks:
+            counter[0] += len(chunk)
+            yield chunk
+
+
+    @staticmethod
+    def _request_size(response, streamed_size):
+        """Size of the body of the request that produced `response` (streamed bodies are counted as they are sent)."""
+        body = None if response is None else response.request.body
+        if body is None or isinstance(body, types.GeneratorType): return streamed_size
+        return len(body)
+
+
+    @staticmethod
+    def _response_size(response):
+        """Number of bytes of the response body received so far (before decompression, if the body is compressed)."""
+        if response is None: return 0
+        try:
+            return response.raw.tell()
+        except (AttributeError, IOError):
+            return int(response.headers.get("Content-Length") or 0)
+
+
     def _log_start_transaction(self, endpoint, data, json, files, params):
         """Log the beginning of an API request."""
-        # TODO: add information about the caller, i.e. which module + line of code called the .request() method
-        #       This can be done by fetching current traceback and then traversing it until we find the request function
         self._requests_counter += 1
         if not self._is_logging: return
         msg = "\n---- %d --------------------------------------------------------\n" % self._requests_counter
         msg += "[%s] %s\n" % (time.strftime("%H:%M:%S"), endpoint)
         if params is not None: msg += "     params: {%s}\n" % ", ".join("%s:%s" % item for item in viewitems(params))
-        if data is not None:   msg += "     body: {%s}\n" % ", ".join("%s:%s" % item for item in viewitems(data))
+        if is_type(data, dict):  msg += "     body: {%s}\n" % ", ".join("%s:%s" % item for item in viewitems(data))
+        elif data is not None: msg += "     file: <streamed>\n"
         if json is not None:
             import json as j
             msg += "     json: %s\n" % j.dumps(json)
@@ -663,27 +879,33 @@ class H2OConnection(backwards_compatible()):
         """
         Log the message `msg` to the destination `self._logging_dest`.
 
-        If this destination is a file name, then we append the message to the file and then close the file
-        immediately. If the destination is an open file handle, then we simply write the message there and do not
-        attempt to close it.
+        If this destination is a file name, then the message is appended to the file opened by
+        :meth:`start_logging`, and flushed so that the log is complete even if the process dies. If the destination is
+        an open file handle, then we simply write the message there and do not attempt to close it.
         """
-        if is_type(self._logging_dest, str):
-            with open(self._logging_dest, "at", encoding="utf-8") as f:
-                f.write(msg)
-        else:
-            self._logging_dest.write(msg)
+        f = self._logging_file or self._logging_dest
+        f.write(msg)
+        if f is self._logging_file: f.flush()
 
 
     @staticmethod
-    def _process_response(response, save_to):
+    def _process_response(response, save_to, json_decoder=None, lazy=False):
         """
         Given a response object, prepare it to be handed over to the external caller.
 
         Preparation steps include:
            * detect if the response has error status, and convert it to an appropriate exception;
            * detect Content-Type, and based on that either parse the response as JSON or return as plain text.
+
+        JSON responses are decoded with ``json_decoder`` if given, or with the standard json module otherwise. With
+        ``lazy``, their schema objects are converted on first access (see :class:`H2OLazyResponse`).
         """
         status_code = response.status_code
+        if status_code == 200 and save_to is not None and not is_type(save_to, str):
+            for chunk in response.iter_content(chunk_size=65536):
+                if chunk:
+                    save_to.write(chunk)
+            return save_to
         if status_code == 200 and save_to:
             if save_to.startswith("~"): save_to = os.path.expanduser(save_to)
             if os.path.isdir(save_to) or save_to.endswith(os.path.sep):
@@ -707,12 +929,21 @@ class H2OConnection(backwards_compatible()):
         if ";" in content_type:  # Remove a ";charset=..." part
             content_type = content_type[:content_type.index(";")]
 
-        # Auto-detect response type by its content-type. Decode JSON, all other responses pass as-is.
+        # Auto-detect response type by its content-type. Decode JSON, binary frame data is returned as raw bytes,
+        # all other responses pass as-is.
         if content_type == "application/json":
             try:
-                data = response.json(object_pairs_hook=H2OResponse)
-            except (JSONDecodeError, requests.exceptions.ContentDecodingError) as e:
+                if lazy:
+                    data = H2OLazyResponse.wrap(response.json() if json_decoder is None
+                                                else json_decoder(response.content))
+                elif json_decoder is None:
+                    data = response.json(object_pairs_hook=H2OResponse)
+                else:
+                    data = H2OResponse.convert(json_decoder(response.content))
+            except (JSONDecodeError, ValueError, requests.exceptions.ContentDecodingError) as e:
                 raise H2OServerError("Malformed JSON from server (%s):\n%s" % (str(e), response.text))
+        elif content_type == "application/x-h2o-columnar":
+            data = response.content
         else:
             data = response.text
 
@@ -733,7 +964,7 @@ class H2OConnection(backwards_compatible()):
     @staticmethod
     def _find_file_name(response):
         cd = response.headers.get("Content-Disposition", "")
-        mm = re.search(r'filename="(.*)"$', cd)
+        mm = re.search(r'filename="?([^";]+)"?', cd)
         return mm.group(1) if mm else "unknown"
 
 
@@ -838,6 +1069,25 @@ class H2OResponse(dict):
         if schema == "ModelMetricsAutoEncoderV3": return H2OAutoEncoderModelMetrics.make(keyvals)
         return super(H2OResponse, cls).__new__(cls, keyvals)
 
+    @staticmethod
+    def convert(obj):
+        """
+        Convert a JSON document decoded into plain dicts and lists into H2OResponse (and schema) objects.
+
+        This gives the same result as decoding the document with ``object_pairs_hook=H2OResponse``. Lists of numbers
+        or strings (such as the data of tables) are not traversed.
+        """
+        if type(obj) is dict:
+            return H2OResponse([(k, H2OResponse.convert(v)) for k, v in obj.items()])
+        if type(obj) is list:
+            # Arrays are homogeneous, so the first non-null element tells whether there is anything to convert
+            for v in obj:
+                if v is not None:
+                    if type(v) is dict or type(v) is list:
+                        return [H2OResponse.convert(x) for x in obj]
+                    break
+        return obj
+
     # def __getattr__(self, key):
     #     """This gets invoked for any attribute "key" that is NOT yet defined on the object."""
     #     if key in self:
@@ -845,6 +1095,125 @@ class H2OResponse(dict):
     #     return None
 
 
+class H2OLazyResponse(H2OResponse):
+    """
+    Response object whose values are converted into H2OResponse (and schema) objects when they are first accessed.
+
+    The object holds the plain dicts and lists of the decoded JSON document. Reading a value (``r[key]``,
+    ``r.get(key)``) converts that value only: schema objects such as tables and model metrics are built then, and
+    other objects become H2OLazyResponses themselves. The methods that expose all the values at once (``items()``,
+    ``values()``, ``copy()``, comparisons, ``repr()``...) convert all the values first, so the object is
+    indistinguishable from the result of the eager decoding. (On Python 2 ``dict(r)`` and ``**r`` bypass these
+    methods, and may return unconverted values.)
+    """
+
+    # Schemas whose objects are converted into dedicated classes, the same as in H2OResponse.__new__()
+    _SCHEMAS = {"CloudV3", "H2OErrorV3", "H2OModelBuilderErrorV3", "TwoDimTableV3", "ModelMetricsRegressionV3",
+                "ModelMetricsClusteringV3", "ModelMetricsBinomialV3", "ModelMetricsMultinomialV3",
+                "ModelMetricsAutoEncoderV3"}
+
+    def __new__(cls, *args, **kwargs):
+        self = dict.__new__(cls)
+        self._pending = set()  # keys whose values are not converted yet
+        return self
+
+    def __init__(self, *args, **kwargs):
+        super(H2OLazyResponse, self).__init__(*args, **kwargs)
+        self._pending = set(self.keys())
+
+    @staticmethod
+    def wrap(obj):
+        """Convert (lazily) a JSON document decoded into plain dicts and lists."""
+        if type(obj) is dict:
+            meta = obj.get("__meta")
+            schema = meta.get("schema_name") if isinstance(meta, dict) else obj.get("__schema")
+            if schema == "TwoDimTableV3":
+                # The table only reads the names, types and formats of the columns, which need no conversion
+                return H2OTwoDimTable.make(obj.items())
+            if schema in H2OLazyResponse._SCHEMAS:
+                return H2OResponse([(k, H2OLazyResponse.wrap(v)) for k, v in obj.items()])
+            return H2OLazyResponse(obj)
+        if type(obj) is list:
+            for v in obj:
+                if v is not None:
+                    if type(v) is dict or type(v) is list:
+                        return [H2OLazyResponse.wrap(x) for x in obj]
+                    break
+        return obj
+
+    def _convert(self, key):
+        if key in self._pending:
+            self._pending.discard(key)
+            dict.__setitem__(self, key, H2OLazyResponse.wrap(dict.__getitem__(self, key)))
+
+    def _convert_all(self):
+        for key in list(self._pending):
+            self._convert(key)
+
+    def __getitem__(self, key):
+        self._convert(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        self._convert(key)
+        return dict.get(self, key, default)
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def setdefault(self, key, default=None):
+        self._convert(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *args):
+        self._convert(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._convert_all()
+        return dict.popitem(self)
+
+    def update(self, *args, **kwargs):
+        self._convert_all()
+        dict.update(self, *args, **kwargs)
+
+    def __iter__(self):
+        # Iterating over the keys needs no conversion, but overriding this disables the shortcut taken by dict(r)
+        # and **r (on Python 3), which would read the values without converting them
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self._convert_all()
+        if isinstance(other, H2OLazyResponse): other._convert_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._convert_all()
+        return dict.__repr__(self)
+
+
+def _converting(name):
+    method = getattr(dict, name)
+
+    def converting_method(self, *args):
+        self._convert_all()
+        return method(self, *args)
+
+    converting_method.__name__ = str(name)
+    return converting_method
+
+
+for _name in ["values", "items", "copy", "itervalues", "iteritems", "viewvalues", "viewitems"]:
+    if hasattr(dict, _name):
+        setattr(H2OLazyResponse, _name, _converting(_name))
+
+
 # Find the exception that occurs on invalid JSON input
 JSONDecodeError, _r = None, None
 try:
@@ -0,0 +1,243 @@
+# -*- encoding: utf-8 -*-
+"""
+Client-side tracing of the requests made to the H2O server.
+
+Every :class:`H2OConnection` owns an :class:`H2ORequestTracer`, which records each request as it completes: its
+latency, the number of bytes sent and received, the HTTP status, and the line of user code that caused it. The data
+is aggregated per endpoint (``h2o.connection().stats()``), and the most recent requests are kept as individual events
+that can be exported as JSON or in the Chrome trace format (to be viewed in ``chrome://tracing`` or Perfetto).
+
+:copyright: (c) 2016 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import os
+import sys
+import threading
+from bisect import bisect_left
+from collections import deque
+
+from h2o.two_dim_table import H2OTwoDimTable
+from h2o.utils.compatibility import *  # NOQA
+from h2o.utils.typechecks import assert_is_type
+
+__all__ = ("H2ORequestTracer", )
+
+_H2O_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.path.sep
+
+
+class H2ORequestTracer(object):
+    """
+    Statistics about the requests made over an H2O connection.
+
+    Requests are grouped by endpoint, where the keys embedded in the URL are replaced with ``*`` (so that
+    ``GET /3/Frames/iris.hex`` and ``GET /3/Frames/prostate.hex`` both count as ``GET /3/Frames/*``). For each endpoint
+    the tracer keeps the number of calls and errors, the total and maximum latency, a latency histogram, the bytes
+    sent and received, and the number of calls coming from each caller site. The caller site of a request is the
+    innermost line of code outside of the ``h2o`` package.
+
+    The tracer is always on; it can be switched off by setting its ``enabled`` attribute to False.
+    """
+
+    # Upper bounds (in milliseconds) of the latency histogram buckets; the last bucket holds all slower requests.
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+    # Names in the URLs which are followed by a key, such as ``/3/Predictions/models/{model}/frames/{frame}``
+    COLLECTIONS = frozenset(["models", "frames", "columns", "grids", "jobs", "predictions_frame", "actuals_frame"])
+
+    # Endpoint pattern under which the requests are counted once there are ``max_endpoints`` distinct endpoints
+    OTHER_ENDPOINTS = "(other endpoints)"
+
+    def __init__(self, max_events=10000, max_endpoints=1000):
+        """
+        Create a new tracer.
+
+        :param max_events: how many of the most recent requests to keep as individual events.
+        :param max_endpoints: how many distinct endpoints to keep statistics for; the requests to any further
+            endpoints are all counted under :attr:`OTHER_ENDPOINTS`.
+        """
+        assert_is_type(max_events, int)
+        assert_is_type(max_endpoints, int)
+        self.enabled = True
+        self.max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._events = deque(maxlen=max_events)
+        self._file_in_h2o = {}  # cache: code file name => whether the file is part of the h2o package
+
+
+    def record(self, endpoint, start_time, duration, status, bytes_sent=0, bytes_received=0):
+        """
+        Record a completed request.
+
+        :param endpoint: the endpoint of the request, for example "GET /3/Frames/iris.hex".
+        :param start_time: time when the request was started, in seconds since the epoch.
+        :param duration: how long the request took, in seconds.
+        :param status: HTTP status code of the response, or the name of the exception if there was no response.
+        :param bytes_sent: size of the request body.
+        :param bytes_received: size of the response body.
+        """
+        if not self.enabled: return
+        caller = self._caller()
+        key = self.endpoint_pattern(endpoint)
+        ms = duration * 1000
+        failed = not (isinstance(status, int) and status < 400)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None and len(self._endpoints) >= self.max_endpoints:
+                key = self.OTHER_ENDPOINTS
+                stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                                "histogram": [0] * (len(self.BUCKETS_MS) + 1),
+                                                "bytes_sent": 0, "bytes_received": 0, "callers": {}}
+            stats["calls"] += 1
+            stats["errors"] += failed
+            stats["total_ms"] += ms
+            stats["max_ms"] = max(stats["max_ms"], ms)
+            stats["histogram"][bisect_left(self.BUCKETS_MS, ms)] += 1
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+            stats["callers"][caller] = stats["callers"].get(caller, 0) + 1
+            self._events.append((endpoint, start_time, duration, status, bytes_sent, bytes_received, caller,
+                                 threading.current_thread().ident))
+
+
+    def reset(self):
+        """Forget all the requests recorded so far."""
+        with self._lock:
+            self._endpoints.clear()
+            self._events.clear()
+
+
+    def stats(self):
+        """
+        Per-endpoint statistics, slowest endpoints (by total time) first.
+
+        :returns: a list of dictionaries with keys ``endpoint``, ``calls``, ``errors``, ``total_ms``, ``mean_ms``,
+            ``p50_ms``, ``p95_ms``, ``max_ms``, ``histogram`` (number of calls in each bucket of :attr:`BUCKETS_MS`,
+            plus one for the slower calls), ``bytes_sent``, ``bytes_received``, and ``callers`` (a dictionary
+            caller site => number of calls).
+        """
+        with self._lock:
+            res = [dict(stats, endpoint=key, histogram=list(stats["histogram"]), callers=dict(stats["callers"]))
+                   for key, stats in viewitems(self._endpoints)]
+        for stats in res:
+            stats["mean_ms"] = stats["total_ms"] / stats["calls"]
+            stats["p50_ms"] = self._percentile(stats, 0.5)
+            stats["p95_ms"] = self._percentile(stats, 0.95)
+        res.sort(key=lambda s: -s["total_ms"])
+        return res
+
+
+    def summary(self):
+        """Per-endpoint statistics as an :class:`H2OTwoDimTable`."""
+        rows = []
+        for s in self.stats():
+            top_caller = max(viewitems(s["callers"]), key=lambda kv: kv[1])[0]
+            rows.append([s["endpoint"], s["calls"], s["errors"], s["total_ms"] / 1000, s["mean_ms"], s["p50_ms"],
+                         s["p95_ms"], s["max_ms"], s["bytes_sent"], s["bytes_received"], top_caller])
+        return H2OTwoDimTable(table_header="Requests by endpoint",
+                              col_header=["endpoint", "calls", "errors", "total (s)", "mean (ms)", "p50 (ms)",
+                                          "p95 (ms)", "max (ms)", "bytes sent", "bytes received", "top caller"],
+                              cell_values=rows)
+
+
+    def events(self):
+        """
+        The most recent requests, oldest first.
+
+        :returns: a list of dictionaries with keys ``endpoint``, ``start`` (seconds since the epoch), ``duration_ms``,
+            ``status``, ``bytes_sent``, ``bytes_received``, ``caller`` and ``thread``.
+        """
+        with self._lock:
+            events = list(self._events)
+        return [{"endpoint": e[0], "start": e[1], "duration_ms": e[2] * 1000, "status": e[3], "bytes_sent": e[4],
+                 "bytes_received": e[5], "caller": e[6], "thread": e[7]} for e in events]
+
+
+    def to_json(self, path=None):
+        """
+        Export the per-endpoint statistics and the recent requests as a JSON document.
+
+        :param path: if given, the document is written to this file.
+        :returns: the JSON document (as a string).
+        """
+        return self._export({"buckets_ms": list(self.BUCKETS_MS), "endpoints": self.stats(), "events": self.events()},
+                            path)
+
+
+    def to_chrome_trace(self, path=None):
+        """
+        Export the recent requests in the Chrome trace event format.
+
+        Each request is a complete event ("ph": "X") on the timeline of the thread that made it.
+
+        :param path: if given, the trace is written to this file.
+        :returns: the trace (as a string).
+        """
+        pid = os.getpid()
+        trace = [{"name": e["endpoint"], "cat": "h2o", "ph": "X", "pid": pid, "tid": e["thread"],
+                  "ts": int(e["start"] * 1e6), "dur": int(e["duration_ms"] * 1000),
+                  "args": {"status": e["status"], "bytes_sent": e["bytes_sent"],
+                           "bytes_received": e["bytes_received"], "caller": e["caller"]}}
+                 for e in self.events()]
+        return self._export({"traceEvents": trace, "displayTimeUnit": "ms"}, path)
+
+
+    @staticmethod
+    def endpoint_pattern(endpoint):
+        """
+        Endpoint with the keys embedded in its URL replaced by ``*``.
+
+        In H2O URLs a key follows either the resource name, as in ``/3/Frames/{frame_id}/summary``, or one of the
+        :attr:`COLLECTIONS` names, as in ``/3/Predictions/models/{model_id}/frames/{frame_id}`` or
+        ``/3/Frames/{frame_id}/columns/{column}/summary``; all other path segments are kept.
+        """
+        method, _, url = endpoint.partition(" ")
+        parts = url.split("?", 1)[0].split("/")
+        # parts[0] is empty, parts[1] is the API version, parts[2] the resource name
+        key_expected = True
+        for i in range(3, len(parts)):
+            if parts[i] in H2ORequestTracer.COLLECTIONS and not (key_expected and i > 3):
+                key_expected = True
+            elif key_expected:
+                parts[i] = "*"
+                key_expected = False
+        return method + " " + "/".join(parts)
+
+
+    def _caller(self):
+        """Return "file:line" of the innermost stack frame outside of the h2o package."""
+        frame = sys._getframe(2)
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            in_h2o = self._file_in_h2o.get(filename)
+            if in_h2o is None:
+                in_h2o = self._file_in_h2o[filename] = os.path.abspath(filename).startswith(_H2O_DIR)
+            if not in_h2o:
+                return "%s:%d" % (filename, frame.f_lineno)
+            frame = frame.f_back
+        return "<h2o>"
+
+
+    def _percentile(self, stats, q):
+        """Estimate a latency percentile (in ms) from the histogram, as the upper bound of the bucket it falls in."""
+        rank = q * stats["calls"]
+        seen = 0
+        for i, n in enumerate(stats["histogram"]):
+            seen += n
+            if seen >= rank and n:
+                return min(self.BUCKETS_MS[i], stats["max_ms"]) if i < len(self.BUCKETS_MS) else stats["max_ms"]
+        return stats["max_ms"]
+
+
+    @staticmethod
+    def _export(obj, path):
+        text = json.dumps(obj)
+        if path is not None:
+            with open(path, "wt", encoding="utf-8") as f:
+                f.write(text)
+        return text
@@ -7,8 +7,6 @@ h2o -- module for using H2O services.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import tabulate
-
 from .utils.compatibility import *  # NOQA
 
 
@@ -61,6 +59,7 @@ class H2ODisplay(object):
     # for python REPL console
     def __repr__(self):
         if self.do_print or not H2ODisplay._in_ipy():
+            import tabulate
             if self.header is None:
                 return tabulate.tabulate(self.table, **self.kwargs)
             else:
@@ -4,22 +4,30 @@
 # This file is auto-generated by h2o-3/h2o-bindings/bin/gen_python.py
 # Copyright 2016 H2O.ai;  Apache License Version 2.0 (see LICENSE for details)
 #
-from .aggregator import H2OAggregatorEstimator
-from .deeplearning import H2OAutoEncoderEstimator
-from .deeplearning import H2ODeepLearningEstimator
-from .deepwater import H2ODeepWaterEstimator
-from .estimator_base import H2OEstimator
-from .gbm import H2OGradientBoostingEstimator
-from .glm import H2OGeneralizedLinearEstimator
-from .glrm import H2OGeneralizedLowRankEstimator
-from .kmeans import H2OKMeansEstimator
-from .naive_bayes import H2ONaiveBayesEstimator
-from .pca import H2OPrincipalComponentAnalysisEstimator
-from .random_forest import H2ORandomForestEstimator
-from .stackedensemble import H2OStackedEnsembleEstimator
-from .svd import H2OSingularValueDecompositionEstimator
-from .word2vec import H2OWord2vecEstimator
-from .xgboost import H2OXGBoostEstimator
+from h2o.utils.shared_utils import lazy_attributes
+
+# The estimator modules are imported on first use
+__getattr__ = lazy_attributes(__name__, {
+    "H2OAggregatorEstimator": ".aggregator",
+    "H2OAutoEncoderEstimator": ".deeplearning",
+    "H2ODeepLearningEstimator": ".deeplearning",
+    "H2ODeepWaterEstimator": ".deepwater",
+    "H2OEstimator": ".estimator_base",
+    "H2OGradientBoostingEstimator": ".gbm",
+    "H2OGeneralizedLinearEstimator": ".glm",
+    "H2OGeneralizedLowRankEstimator": ".glrm",
+    "H2OKMeansEstimator": ".kmeans",
+    "H2ONaiveBayesEstimator": ".naive_bayes",
+    "H2OPrincipalComponentAnalysisEstimator": ".pca",
+    "H2ORandomForestEstimator": ".random_forest",
+    "H2OStackedEnsembleEstimator": ".stackedensemble",
+    "H2OSingularValueDecompositionEstimator": ".svd",
+    "H2OWord2vecEstimator": ".word2vec",
+    "H2OXGBoostEstimator": ".xgboost",
+}, submodules=(
+    "aggregator", "deeplearning", "deepwater", "estimator_base", "gbm", "glm", "glrm", "kmeans", "naive_bayes", "pca",
+    "random_forest", "stackedensemble", "svd", "word2vec", "xgboost"
+))
 
 __all__ = (
     "H2OAggregatorEstimator", "H2OAggregatorEstimator", "H2OAutoML", "H2OAutoEncoderEstimator",
@@ -78,6 +78,40 @@ class H2OEstimator(ModelBase):
         """Wait until job's completion."""
         self._future = False
         self._job.poll()
+        self._join_model()
+
+
+    def train_async(self, x=None, y=None, training_frame=None, offset_column=None, fold_column=None,
+                    weights_column=None, validation_frame=None, max_runtime_secs=None, ignored_columns=None,
+                    model_id=None, conn=None):
+        """
+        Train the H2O model from an asyncio event loop: ``await model.train_async(...)`` (requires Python 3.5+).
+
+        The parameters are the same as for :meth:`train`; the model build is started and waited for without
+        blocking the event loop, so that many models can be trained concurrently.
+
+        :param conn: the :class:`AsyncH2OConnection` to use (by default a shared one).
+        :returns: an awaitable which resolves to this estimator once the model is trained.
+        """
+        from h2o.backend.async_connection import AsyncH2OConnection
+
+        def start():
+            self._future = True
+            self.train(x=x, y=y, training_frame=training_frame, offset_column=offset_column, fold_column=fold_column,
+                       weights_column=weights_column, validation_frame=validation_frame,
+                       max_runtime_secs=max_runtime_secs, ignored_columns=ignored_columns, model_id=model_id)
+            return self._job
+
+        def finish(job):
+            self._future = False
+            self._join_model()
+            return self
+
+        return (conn or AsyncH2OConnection.default()).build(start, finish)
+
+
+    def _join_model(self):
+        """Fetch the model built by the (finished) job started with :meth:`start`."""
         model_key = self._job.dest_key
         self._job = None
         model_json = h2o.api("GET /%d/Models/%s" % (self._rest_version, model_key))["models"][0]
@@ -7,22 +7,19 @@ Rapids expressions. These are helper classes for H2OFrame.
 """
 from __future__ import division, print_function, absolute_import, unicode_literals
 
+import atexit
 import collections
 import copy
-import gc
 import math
-import sys
+import threading
 import time
 
-import tabulate
-
 import h2o
-from h2o.backend.connection import H2OConnectionError
 from h2o.utils.compatibility import *  # NOQA
 from h2o.utils.compatibility import repr2, viewitems, viewvalues
 from h2o.utils.shared_utils import _is_fr, _py_tmp_key
 from h2o.model.model_base import ModelBase
-from h2o.expr_optimizer import optimize
+from h2o.expr_optimizer import optimize, optimize_dag
 
 class ExprNode(object):
     """
@@ -40,8 +37,8 @@ class ExprNode(object):
       ----------------------
         An expression is declared top-level if it
           A) Computes and returns an H2OFrame to some on-demand call from somewhere
-          B) An H2OFrame instance has more referrers than the 4 needed for the usual flow
-             of python execution (see MAGIC_REF_COUNT below for more details).
+          B) It is shared: referenced by more than one parent expression and/or H2OFrame
+             instance (see _nrefs below for more details).
 
       Sane Amount of State
       --------------------
@@ -71,16 +68,17 @@ class ExprNode(object):
         There are more details available under the H2OCache class declaration.
     """
 
-    # Magical count-of-5:   (get 2 more when looking at it in debug mode)
-    #  2 for _get_ast_str frame, 2 for _get_ast_str local dictionary list, 1 for parent
-    MAGIC_REF_COUNT = 5 if sys.gettrace() is None else 7  # M = debug ? 7 : 5
-
     # Flag to control application of local expression tree optimizations
     __ENABLE_EXPR_OPTIMIZATIONS__ = True
 
     def __init__(self, op="", *args):
         # assert isinstance(op, str), op
         self._op = op  # Base opcode string
+        # Number of references to this node from the _children of other nodes and from the _ex of H2OFrames. It is
+        # maintained by the _children and H2OFrame._ex setters, and is the count of "owners" of the node that is
+        # needed to decide whether the node must be cached as a temp (previously computed with gc.get_referrers()).
+        self._nrefs = 0
+        self.__children = None
         self._children = tuple(
             a._ex if _is_fr(a) else a for a in args)  # ast children; if not None and _cache._id is not None then tmp
         self._cache = H2OCache()  # ncols, nrows, names, types
@@ -88,6 +86,23 @@ class ExprNode(object):
         if self.__ENABLE_EXPR_OPTIMIZATIONS__:
             self._optimize()
 
+    @property
+    def _children(self):
+        return self.__children
+
+    @_children.setter
+    def _children(self, children):
+        ExprNode._add_refs(children, 1)
+        ExprNode._add_refs(self.__children, -1)
+        self.__children = children
+
+    @staticmethod
+    def _add_refs(nodes, delta):
+        if nodes is None: return
+        for node in nodes:
+            if isinstance(node, ExprNode):
+                node._nrefs += delta
+
     def _eager_frame(self):
         if not self._cache.is_empty(): return
         if self._cache._id is not None: return  # Data already computed under ID, but not cached locally
@@ -104,6 +119,8 @@ class ExprNode(object):
         return self._cache._data
 
     def _eval_driver(self, top):
+        if self.__ENABLE_EXPR_OPTIMIZATIONS__:
+            optimize_dag(self)
         exec_str = self._get_ast_str(top)
         res = ExprNode.rapids(exec_str)
         if 'scalar' in res:
@@ -118,6 +135,40 @@ class ExprNode(object):
             self._cache.ncols = res['num_cols']
         return self
 
+    @staticmethod
+    def _eval_all(nodes):
+        """
+        Evaluate several frame expressions with a single Rapids call, and fill their caches with the shapes, column
+        names and types of the results.
+
+        The expressions are sent as one Rapids block ``(, (tmp= id1 expr1) ... (frameInfo id1 ...))``; sub-trees
+        shared between the expressions are computed only once. An expression which the optimizer merged with an equal
+        one is stored as a (shallow) copy of its result, ``(tmp= id2 id1)``, so that every node gets a key of its own.
+        """
+        nodes = [node for node in nodes if node._cache.is_empty() and node._cache._id is None]
+        if not nodes: return
+        block = ExprNode(",", *nodes)  # also makes the sub-trees shared between the expressions cached as temps
+        if ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__:
+            optimize_dag(block)
+        roots = []
+        for node in block._children:  # equal expressions may have been merged
+            if not any(node is root for root in roots): roots.append(node)
+        exec_str = " ".join(node._get_ast_str(True) for node in roots)
+        merged = [(node, root) for node, root in zip(nodes, block._children) if node is not root]
+        for node, root in merged:
+            node._cache._id = _py_tmp_key(append=h2o.connection().session_id)
+            exec_str += " (tmp= {} {})".format(node._cache._id, root._cache._id)
+        res = ExprNode.rapids("(, {} (frameInfo {}))".format(exec_str, " ".join(node._cache._id for node in roots)))
+        del block
+        info = res["string"]
+        offsets = []  # where the description of each root starts in info
+        i = 0
+        for node in roots:
+            offsets.append(i)
+            i = node._cache._fill_meta(info, i)
+        for node, root in merged:
+            node._cache._fill_meta(info, next(i for r, i in zip(roots, offsets) if r is root))
+
     def _optimize(self):
         while True:
             opt = optimize(self)
@@ -126,9 +177,9 @@ class ExprNode(object):
             else:
                 break
 
-    # Recursively build a rapids execution string.  Any object with more than
-    # MAGIC_REF_COUNT referrers will be cached as a temp until the next client GC
-    # cycle - consuming memory.  Do Not Call This except when you need to do some
+    # Recursively build a rapids execution string.  Any object referenced by more
+    # than one parent expression or frame will be cached as a temp until the next
+    # client GC cycle - consuming memory.  Do Not Call This except when you need to do some
     # other cluster operation on the evaluated object.  Examples might be: lazy
     # dataset time parse vs changing the global timezone.  Global timezone change
     # is eager, so the time parse as to occur in the correct order relative to
@@ -141,8 +192,7 @@ class ExprNode(object):
             return self._cache._id  # Data already computed under ID, but not cached
         # assert isinstance(self._children,tuple)
         exec_str = "({} {})".format(self._op, " ".join([ExprNode._arg_to_expr(ast) for ast in self._children]))
-        gc_ref_cnt = len(gc.get_referrers(self))
-        if top or gc_ref_cnt >= ExprNode.MAGIC_REF_COUNT:
+        if top or self._nrefs > 1:
             self._cache._id = _py_tmp_key(append=h2o.connection().session_id)
             exec_str = "(tmp= {} {})".format(self._cache._id, exec_str)
         return exec_str
@@ -172,11 +222,17 @@ class ExprNode(object):
 
     def __del__(self):
         try:
-            if self._cache._id is not None and self._children is not None:
-                ExprNode.rapids("(rm {})".format(self._cache._id))
-        except (AttributeError, H2OConnectionError):
+            ExprNode._add_refs(self.__children, -1)
+            if self._cache._id is not None and self.__children is not None:
+                ExprNode._temps.add(self._cache._id)
+        except AttributeError:
             pass
 
+    def _adopt_temp(self, key):
+        """Make this node refer to the server object ``key``, which is then removed once the node is collected."""
+        self._cache._id = key
+        self._children = ()
+
     def arg(self, idx):
         return self._children[idx]
 
@@ -232,6 +288,109 @@ class ExprNode(object):
 
 
 
+class H2OTempsCollector(object):
+    """
+    Deferred removal of the temporary frames whose ExprNodes were garbage-collected on the client.
+
+    Instead of sending one ``(rm id)`` request per dead ExprNode (often from within a GC pause, or at the
+    interpreter shutdown), the ids are queued and removed in batches with a single ``(rm id1 id2 ...)`` request.
+    The queue is flushed when it reaches ``batch_size`` ids, at most ``flush_interval`` seconds after the previous
+    flush (by a daemon thread, also when the session is idle), at the exit of the interpreter, or explicitly with
+    :meth:`flush` (``h2o.flush_temps()``). With ``background`` enabled, all the flushes are done by the daemon thread,
+    so that the finalizers never block on the network.
+
+    If the removal request fails the ids stay queued, and are sent again with the next flush. Temporaries still
+    queued when the connection is closed are removed by the server together with the session.
+    """
+
+    def __init__(self, batch_size=100, flush_interval=10.0, background=False):
+        self.batch_size = batch_size
+        self._background = background
+        self._keys = []
+        self._lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self.flush_interval = flush_interval
+        self._thread = None
+        self._last_flush = time.time()
+
+    @property
+    def flush_interval(self):
+        return self._flush_interval
+
+    @flush_interval.setter
+    def flush_interval(self, value):
+        self._flush_interval = value
+        self._wakeup.set()
+
+    @property
+    def background(self):
+        return self._background
+
+    @background.setter
+    def background(self, value):
+        self._background = value
+        if value and self._keys:
+            self._wakeup.set()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key):
+        """Queue a temporary key for removal; never raises."""
+        with self._lock:
+            self._keys.append(key)
+            n = len(self._keys)
+            if self._thread is None:
+                self._start()
+        if n >= self.batch_size or time.time() - self._last_flush >= self.flush_interval:
+            if self._background:
+                self._wakeup.set()
+            else:
+                self.flush(quiet=True)
+
+    def flush(self, quiet=False):
+        """
+        Remove all queued temporaries from the cluster in a single request.
+
+        :param quiet: if True, errors are ignored (the keys stay queued in that case, for the next flush).
+        :returns: the number of keys sent for removal.
+        """
+        with self._lock:
+            keys, self._keys = self._keys, []
+            self._last_flush = time.time()
+        if not keys: return 0
+        try:
+            ExprNode.rapids("(rm %s)" % " ".join(keys))
+        except Exception:
+            with self._lock:
+                self._keys[:0] = keys
+            if not quiet: raise
+            return 0
+        return len(keys)
+
+    def _start(self):
+        # Started with the first queued key, so that the exit handler runs before the one closing the connection
+        self._thread = threading.Thread(target=self._run, name="h2o-temps-collector")
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(lambda: self.flush(quiet=True))
+
+    def _run(self):
+        while True:
+            # Wake up when the oldest queued key is due, or when add() asks for a background flush
+            timeout = self._last_flush + self.flush_interval - time.time() if self._keys else self.flush_interval
+            self._wakeup.wait(max(timeout, 0.1))
+            self._wakeup.clear()
+            if not self._keys: continue
+            if self._background or time.time() - self._last_flush >= self.flush_interval:
+                self.flush(quiet=True)
+
+
+ExprNode._temps = H2OTempsCollector()
+
+
+
+
 class ASTId:
     def __init__(self, name=None):
         if name is None:
@@ -346,6 +505,28 @@ class H2OCache(object):
         self._types = dict(zip(self._names, [c["type"] for c in res["columns"]]))
         self._fill_data(res)
 
+    def fill_meta(self):
+        """
+        Fill in the number of rows and columns, the column names and types if any of them is not known yet.
+
+        Unlike :meth:`fill` this neither fetches any rows of data, nor drops the fields that are already cached.
+        """
+        assert self._id is not None
+        if self.nrows_valid() and self.ncols_valid() and self.names_valid() and self.types_valid():
+            return
+        self._fill_meta(ExprNode.rapids("(frameInfo %s)" % self._id)["string"], 0)
+
+    def _fill_meta(self, info, offset):
+        # Parse the description of one frame from the result of the frameInfo Rapids primitive, starting at offset;
+        # returns the offset of the next frame's description
+        ncols = int(info[offset + 1])
+        names = info[offset + 2:offset + 2 + ncols]
+        self._nrows = int(info[offset])
+        self._ncols = ncols
+        self._names = names
+        self._types = dict(zip(names, info[offset + 2 + ncols:offset + 2 + 2 * ncols]))
+        return offset + 2 + 2 * ncols
+
     def _fill_data(self, json):
         self._data = collections.OrderedDict()
         for c in json["columns"]:
@@ -393,6 +574,7 @@ class H2OCache(object):
                     v['mean'] = v['sigma'] = v['zero_count'] = None
                 x = [v['type'], mins, v['mean'], maxs, v['sigma'], v['zero_count'], v['missing_count']] + x
             d[k] = x  # Insert into ordered-dict
+        import tabulate
         return tabulate.tabulate(d, headers="keys", tablefmt=tablefmt)
 
     def flush(self):  # flush everything but the frame_id
@@ -7,23 +7,36 @@ Rapids expression optimizer.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import operator
+
+try:
+    from builtins import id as _id  # the module defines its own id() below
+except ImportError:  # Python 2
+    from __builtin__ import id as _id
+
 import h2o.expr
+from h2o.exceptions import H2OValueError
+from h2o.utils.typechecks import is_type, numeric
 
 
 class ExprOptimization(object):
     """
     A generic Rapids expression optimizer
 
+    Each optimization has a unique ``name``, which can be used to switch it on/off individually with
+    ``h2o.enable_expr_optimizations(flag, name)``.
     """
 
-    def __init__(self, supported_ops):
+    def __init__(self, supported_ops, name):
         self._supported_ops = supported_ops
+        self.name = name
+        self.enabled = True
 
     def supports(self, op):
         """
-        A quick check if this optimization supports given operator.
+        A quick check if this optimization supports given operator (None means all operators).
         """
-        return op in self._supported_ops
+        return self._supported_ops is None or op in self._supported_ops
 
     def is_applicable(self, expr):
         """
@@ -58,7 +71,7 @@ class FoldExprOptimization(ExprOptimization):
     """
 
     def __init__(self):
-        super(self.__class__, self).__init__(["append", "cbind", "rbind"])
+        super(self.__class__, self).__init__(["append", "cbind", "rbind"], "fold")
 
     def is_applicable(self, expr):
         # Only applicable if the source parameter is the same operator
@@ -87,7 +100,7 @@ class SkipExprOptimization(ExprOptimization):
     """
 
     def __init__(self):
-        super(self.__class__, self).__init__(["cols_py"])
+        super(self.__class__, self).__init__(["cols_py"], "skip")
 
     def is_applicable(self, expr):
         assert isinstance(expr, h2o.expr.ExprNode)
@@ -113,9 +126,230 @@ class SkipExprOptimization(ExprOptimization):
         return foptimizer
 
 
+class ConstantFoldOptimization(ExprOptimization):
+    """
+    Constant folding: arithmetic on numeric literals is computed
+    on the client.
+
+    For example:
+      (+ frame (* 2 3)) is transformed to (+ frame 6)
+
+    Note: this optimization is applied when the expression is evaluated
+    """
+
+    _FOLDABLE_OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv,
+                     "^": operator.pow}
+
+    def __init__(self):
+        super(self.__class__, self).__init__(None, "constants")
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        return any(self._fold(child) is not None for child in expr._children or ())
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            folded = [self._fold(child) for child in expr._children]
+            expr._children = tuple(child if value is None else value
+                                   for child, value in zip(expr._children, folded))
+            return expr
+
+        return foptimizer
+
+    def _fold(self, expr):
+        if not (_is_pending(expr) and expr._op in self._FOLDABLE_OPS and expr.narg() == 2): return None
+        lhs, rhs = expr._children
+        if not (_is_number(lhs) and _is_number(rhs)): return None
+        try:
+            # Rapids computes in doubles, so should we
+            return float(self._FOLDABLE_OPS[expr._op](lhs, rhs))
+        except (ArithmeticError, TypeError):  # e.g. 1/0 or a complex power: leave those to the backend
+            return None
+
+
+class CollapseSelectionsOptimization(ExprOptimization):
+    """
+    Collapse chained selections of columns (or rows) into a single
+    selection.
+
+    For example:
+      (cols_py (cols_py frame [1 3 5]) [0 2]) is transformed to (cols_py frame [1 5])
+      (rows (rows frame [10:90]) [0:5]) is transformed to (rows frame [10:5])
+
+    Objective:
+      - saves creating the intermediate frame
+
+    Note: this optimization is applied when the expression is evaluated; only
+    selections by position are collapsed
+    """
+
+    def __init__(self):
+        super(self.__class__, self).__init__(["cols_py", "rows"], "selections")
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        return self._collapse(expr) is not None
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            nested_expr = expr.arg(0)
+            expr._children = (nested_expr.arg(0), self._collapse(expr))
+            return expr
+
+        return foptimizer
+
+    def _collapse(self, expr):
+        if expr.narg() != 2: return None
+        nested_expr = expr.arg(0)
+        if not (_is_pending(nested_expr) and nested_expr._op == expr._op and nested_expr.narg() == 2): return None
+        inner, outer = nested_expr.arg(1), expr.arg(1)
+        if isinstance(inner, slice) and isinstance(outer, slice):
+            return _compose_slices(inner, outer)
+        positions = _positions(outer)
+        if positions is None: return None
+        if expr._op == "rows" and positions != sorted(positions): return None  # rows cannot be reordered
+        if isinstance(inner, slice):
+            start, step = inner.start or 0, inner.step or 1
+            if start < 0 or step < 1: return None
+            selected = [start + p * step for p in positions]
+            if inner.stop is not None and any(s >= inner.stop for s in selected): return None
+        else:
+            inner_positions = _positions(inner)
+            if inner_positions is None or any(p >= len(inner_positions) for p in positions): return None
+            if expr._op == "rows" and inner_positions != sorted(inner_positions): return None
+            selected = [inner_positions[p] for p in positions]
+        return selected[0] if _is_number(outer) else selected
+
+
+class ProjectionPushdownOptimization(ExprOptimization):
+    """
+    Push column selection below a row filter, so that the filter
+    copies only the selected columns.
+
+    For example:
+      (cols_py (rows frame mask) [1 2]) is transformed to (rows (cols_py frame [1 2]) mask)
+
+    Note: this optimization is applied when the expression is evaluated
+    """
+
+    def __init__(self):
+        super(self.__class__, self).__init__(["cols_py"], "pushdown")
+
+    def is_applicable(self, expr):
+        assert isinstance(expr, h2o.expr.ExprNode)
+        if expr.narg() != 2: return False
+        rows_expr = expr.arg(0)
+        return _is_pending(rows_expr) and rows_expr._op == "rows" and rows_expr.narg() == 2
+
+    def get_optimizer(self, expr):
+        def foptimizer(ctx):
+            rows_expr = expr.arg(0)
+            projection = h2o.expr.ExprNode("cols_py", rows_expr.arg(0), expr.arg(1))
+            expr._op = "rows"
+            expr._children = (projection, rows_expr.arg(1))
+            return expr
+
+        return foptimizer
+
+
+class CommonSubexprOptimization(ExprOptimization):
+    """
+    Common subexpression elimination: structurally equal sub-trees
+    of the expression DAG are replaced with a single node, so that
+    it is computed (and bound with tmp=) only once.
+
+    For example:
+      (+ (log (cols_py frame "x")) (* (log (cols_py frame "x")) 2)) is sent as
+      (+ (tmp= py_1 (log (cols_py frame "x"))) (* py_1 2))
+
+    Note: unlike the other optimizations this one works on the whole DAG
+    at once, and is applied when the expression is evaluated
+    """
+
+    # Operators that produce a different result each time (or have side effects) must never be merged
+    _VOLATILE_OPS = {"h2o.runif", "kfold_column", "stratified_kfold_column", "h2o.random_stratified_split",
+                     "h2o.impute", "assign", "tmp=", "rm", "ls", "listTimeZones", "setTimeZone"}
+
+    def __init__(self):
+        super(self.__class__, self).__init__(None, "cse")
+
+    def apply(self, expr):
+        self._canonicalize(expr, {}, [], {})
+
+    def _canonicalize(self, expr, keys, canonical, memo):
+        """
+        Return an integer id of the structure of ``expr``, replacing its duplicate descendants with canonical nodes.
+
+        :param keys: structure (a flat tuple of the operator and the ids/literals of the arguments) -> id
+        :param canonical: id -> the first node seen with that structure
+        :param memo: id(node) -> (structure id, node) of the nodes visited so far
+        """
+        if _id(expr) in memo: return memo[_id(expr)][0]
+        if not _is_pending(expr):
+            key = ("=", expr._get_ast_str(False))  # frame id or scalar value
+        else:
+            children = []
+            key = [expr._op]
+            for child in expr._children or ():
+                if isinstance(child, h2o.expr.ExprNode):
+                    child_id = self._canonicalize(child, keys, canonical, memo)
+                    child = canonical[child_id]
+                    key.append(child_id)
+                else:
+                    key.append(h2o.expr.ExprNode._arg_to_expr(child))
+                children.append(child)
+            if any(a is not b for a, b in zip(children, expr._children or ())):
+                expr._children = tuple(children)
+            key = ("!", _id(expr)) if expr._op in self._VOLATILE_OPS else tuple(key)
+        key_id = keys.setdefault(key, len(keys))
+        if key_id == len(canonical): canonical.append(expr)
+        memo[_id(expr)] = (key_id, expr)
+        return key_id
+
+
+def _is_pending(expr):
+    """True if expr is an expression that was not evaluated yet."""
+    return isinstance(expr, h2o.expr.ExprNode) and expr._cache._id is None and expr._cache.is_empty()
+
+
+def _is_number(x):
+    return is_type(x, numeric) and not isinstance(x, bool)
+
+
+def _positions(sel):
+    """List of non-negative positions selected by an int, a list of ints or a bounded slice; otherwise None."""
+    if _is_number(sel):
+        return [sel] if sel >= 0 and sel == int(sel) else None
+    if isinstance(sel, slice):
+        start, step = sel.start or 0, sel.step or 1
+        if sel.stop is None or start < 0 or step < 1: return None
+        return list(range(start, sel.stop, step))
+    if isinstance(sel, (list, tuple)) and sel and all(_is_number(p) and p >= 0 and p == int(p) for p in sel):
+        return [int(p) for p in sel]
+    return None
+
+
+def _compose_slices(inner, outer):
+    """Slice equivalent to selecting ``outer`` from the result of selecting ``inner``, or None."""
+    a, b, s = inner.start or 0, inner.stop, inner.step or 1
+    c, d, t = outer.start or 0, outer.stop, outer.step or 1
+    if min(a, c) < 0 or min(s, t) < 1 or (b is not None and b < 0) or (d is not None and d < 0): return None
+    start = a + c * s
+    stop = None if d is None else a + d * s
+    if b is not None: stop = b if stop is None else min(stop, b)
+    if stop is not None:
+        if stop <= start: return None
+        stop = max(stop, start + s * t)  # same selection, but in the form expected by ExprNode._arg_to_expr()
+    return slice(start, stop, s * t)
+
+
 def optimize(expr):
     assert isinstance(expr, h2o.expr.ExprNode)
     all_optimizers = get_optimization(expr._op)
+    return _select_optimizer(expr, all_optimizers)
+
+
+def _select_optimizer(expr, all_optimizers):
     applicable_optimizers = [f for f in all_optimizers if f.is_applicable(expr)]
     # at this point we should select the right optimizer operator, but
     # we just pick the first one
@@ -126,7 +360,62 @@ def optimize(expr):
 
 
 def get_optimization(op):
-    return [f for f in __REGISTERED_EXPR_OPTIMIZATIONS__ if f.supports(op)]
+    return [f for f in __REGISTERED_EXPR_OPTIMIZATIONS__ if f.enabled and f.supports(op)]
+
+
+def optimize_dag(expr):
+    """
+    Optimize the whole (not yet evaluated) expression DAG rooted at ``expr``, right before it is sent to the backend.
+
+    First the optimizations registered for evaluation time are applied to each node, children before their parents;
+    then the structurally equal sub-trees are merged.
+    """
+    assert isinstance(expr, h2o.expr.ExprNode)
+    if not _is_pending(expr): return
+    _optimize_nodes(expr, {})
+    for f in __REGISTERED_DAG_OPTIMIZATIONS__:
+        if f.enabled: f.apply(expr)
+
+
+def _optimize_nodes(expr, visited):
+    while True:
+        for child in expr._children or ():
+            if _is_pending(child) and _id(child) not in visited:
+                visited[_id(child)] = child  # the value keeps the node alive, so that its id is not reused
+                _optimize_nodes(child, visited)
+        opt = _select_optimizer(expr, [f for f in __REGISTERED_EVAL_OPTIMIZATIONS__
+                                       if f.enabled and f.supports(expr._op)])
+        if opt is None: return
+        opt(ctx=None)
+
+
+def get_optimizations():
+    """Return all registered optimizations as a dictionary {name: optimization}."""
+    return {f.name: f for f in __REGISTERED_EXPR_OPTIMIZATIONS__ + __REGISTERED_EVAL_OPTIMIZATIONS__ +
+            __REGISTERED_DAG_OPTIMIZATIONS__}
+
+
+def find_optimization(name):
+    """Return the optimization with the given name."""
+    optimizations = get_optimizations()
+    if name not in optimizations:
+        raise H2OValueError("Unknown expression optimization %r; the available ones are: %s"
+                            % (name, ", ".join(sorted(optimizations))))
+    return optimizations[name]
+
+
+def register_optimization(optimization, on_eval=False):
+    """
+    Register a custom optimization.
+
+    :param optimization: an :class:`ExprOptimization` instance with a unique name.
+    :param on_eval: if True, the optimization is applied to the expression DAG right before its evaluation (after
+        all the nodes were constructed); otherwise it is applied to each node as it is constructed.
+    """
+    assert isinstance(optimization, ExprOptimization)
+    if optimization.name in get_optimizations():
+        raise H2OValueError("Expression optimization %r is already registered" % optimization.name)
+    (__REGISTERED_EVAL_OPTIMIZATIONS__ if on_eval else __REGISTERED_EXPR_OPTIMIZATIONS__).append(optimization)
 
 
 def id(expr):
@@ -149,3 +438,19 @@ __REGISTERED_EXPR_OPTIMIZATIONS__ = [
     FoldExprOptimization(),
     SkipExprOptimization()
 ]
+
+#
+# Optimizations applied to each node of the DAG before its evaluation
+#
+__REGISTERED_EVAL_OPTIMIZATIONS__ = [
+    CollapseSelectionsOptimization(),
+    ProjectionPushdownOptimization(),
+    ConstantFoldOptimization()
+]
+
+#
+# Optimizations applied to the whole DAG before its evaluation (after those above)
+#
+__REGISTERED_DAG_OPTIMIZATIONS__ = [
+    CommonSubexprOptimization()
+]
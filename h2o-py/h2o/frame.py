@@ -10,27 +10,33 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import csv
 import datetime
 import functools
+import hashlib
 import os
+import shutil
 import sys
 import tempfile
+import threading
+import time
 import traceback
 import warnings
+import weakref
+import zlib
 from io import StringIO
 from types import FunctionType
 
-import requests
-
 import h2o
 from h2o.display import H2ODisplay
-from h2o.exceptions import H2OTypeError, H2OValueError
+from h2o.exceptions import H2OConnectionError, H2OResponseError, H2OServerError, H2OTypeError, H2OValueError
 from h2o.expr import ExprNode
 from h2o.group_by import GroupBy
 from h2o.job import H2OJob
 from h2o.utils.compatibility import *  # NOQA
 from h2o.utils.compatibility import viewitems, viewvalues
 from h2o.utils.config import get_config_value
-from h2o.utils.shared_utils import (_handle_numpy_array, _handle_pandas_data_frame, _handle_python_dicts,
-                                    _handle_python_lists, _is_list, _is_str_list, _py_tmp_key, _quoted,
+from h2o.utils.progressbar import ProgressBar
+from h2o.utils.shared_utils import (_columnar_to_numpy, _columnar_to_pandas, _gen_header, _handle_numpy_array,
+                                    _handle_python_dicts, _handle_python_lists, _is_list, _is_str_list,
+                                    _pandas_column_types, _pandas_csv_chunks, _prefetching_map, _py_tmp_key, _quoted,
                                     can_use_pandas, quote, normalize_slice, slice_is_normalized, check_frame_id)
 from h2o.utils.typechecks import (assert_is_type, assert_satisfies, Enum, I, is_type, numeric, numpy_ndarray,
                                   numpy_datetime, pandas_dataframe, pandas_timestamp, scipy_sparse, U)
@@ -51,6 +57,9 @@ class H2OFrame(object):
     # Construction
     #-------------------------------------------------------------------------------------------------------------------
 
+    # Weak references to the frames derived within the active ``h2o.batch()`` block, or None
+    _batch = None
+
     def __init__(self, python_obj=None, destination_frame=None, header=0, separator=",",
                  column_names=None, column_types=None, na_strings=None):
         """
@@ -108,8 +117,29 @@ class H2OFrame(object):
         fr._ex = expr
         if cache is not None:
             fr._ex._cache.fill_from(cache)
+        if H2OFrame._batch is not None:
+            H2OFrame._batch.append(weakref.ref(fr))
         return fr
 
+    @property
+    def _ex(self):
+        return self.__ex
+
+    @_ex.setter
+    def _ex(self, expr):
+        # Keep the reference counts of the expressions up to date: an expression referenced by several frames and/or
+        # parent expressions is cached as a temp when evaluated (see ExprNode._get_ast_str).
+        if expr is not None: expr._nrefs += 1
+        old = self.__dict__.get("_H2OFrame__ex")
+        if old is not None: old._nrefs -= 1
+        self.__ex = expr
+
+    def __del__(self):
+        try:
+            self._ex = None
+        except AttributeError:
+            pass
+
 
     def _upload_python_object(self, python_obj, destination_frame=None, header=0, separator=",",
                               column_names=None, column_types=None, na_strings=None):
@@ -117,9 +147,12 @@ class H2OFrame(object):
         if is_type(python_obj, scipy_sparse):
             self._upload_sparse_matrix(python_obj, destination_frame=destination_frame)
             return
+        if is_type(python_obj, pandas_dataframe) or (is_type(python_obj, numpy_ndarray) and header != 1 and
+                                                     1 <= python_obj.ndim <= 2 and can_use_pandas()):
+            self._upload_pandas_data_frame(python_obj, destination_frame, column_names, column_types, na_strings)
+            return
         # TODO: all these _handlers should really belong to this class, not to shared_utils.
-        processor = (_handle_pandas_data_frame if is_type(python_obj, pandas_dataframe) else
-                     _handle_numpy_array if is_type(python_obj, numpy_ndarray) else
+        processor = (_handle_numpy_array if is_type(python_obj, numpy_ndarray) else
                      _handle_python_dicts if is_type(python_obj, dict) else
                      _handle_python_lists)
         col_header, data_to_write = processor(python_obj, header)
@@ -144,6 +177,35 @@ class H2OFrame(object):
         os.remove(tmp_path)  # delete the tmp file
 
 
+    def _upload_pandas_data_frame(self, df, destination_frame=None, column_names=None, column_types=None,
+                                  na_strings=None):
+        """
+        Upload a pandas DataFrame (or a numpy array) without converting it cell-by-cell into Python objects.
+
+        The data is formatted as CSV in vectorized batches and streamed straight into the request body (optionally
+        gzip-compressed, see the ``general.compress_uploads`` config key), and the columns' dtypes are passed on
+        to the parser, so that it doesn't need to guess them.
+        """
+        import pandas
+        if not is_type(df, pandas_dataframe):
+            df = pandas.DataFrame(df)
+            df.columns = _gen_header(df.shape[1])
+        if not column_names:
+            column_names = [str(col) for col in df.columns]
+        if len(column_names) != df.shape[1]:
+            raise H2OValueError("Expected %d column names, got %d" % (df.shape[1], len(column_names)))
+        types = _pandas_column_types(df)
+        if column_types is None:
+            column_types = types
+        elif isinstance(column_types, dict):
+            column_types = dict({name: t for name, t in zip(column_names, types) if t}, **column_types)
+        elif len(column_types) == len(types):
+            column_types = [user_type or t for user_type, t in zip(column_types, types)]
+        compress = get_config_value("general.compress_uploads", "false").lower() == "true"
+        ret = h2o.api("POST /3/PostFile", filename=_pandas_csv_chunks(df, column_names, compress))
+        self._parse(ret["destination_frame"], destination_frame, 1, ",", column_names, column_types, na_strings)
+
+
     def _upload_sparse_matrix(self, matrix, destination_frame=None):
         import scipy.sparse as sp
         if not sp.issparse(matrix):
@@ -208,6 +270,19 @@ class H2OFrame(object):
         return fr
 
 
+    @staticmethod
+    def _temp_frame(frame_id):
+        """
+        Handle to a frame that the server created for this client, such as the result of a job.
+
+        Like the temporary frames of expressions, the frame is removed from the server once the handle is
+        garbage-collected.
+        """
+        fr = H2OFrame()
+        fr._ex._adopt_temp(frame_id)
+        return fr
+
+
     def refresh(self):
         """Reload frame information from the backend H2O server."""
         self._ex._cache.flush()
@@ -223,8 +298,7 @@ class H2OFrame(object):
     def names(self):
         """The list of column names (List[str])."""
         if not self._ex._cache.names_valid():
-            self._ex._cache.flush()
-            self._frame(fill_cache=True)
+            self._frame(fill_meta=True)
         return list(self._ex._cache.names)
 
     @names.setter
@@ -236,8 +310,7 @@ class H2OFrame(object):
     def nrows(self):
         """Number of rows in the dataframe (int)."""
         if not self._ex._cache.nrows_valid():
-            self._ex._cache.flush()
-            self._frame(fill_cache=True)
+            self._frame(fill_meta=True)
         return self._ex._cache.nrows
 
 
@@ -245,8 +318,7 @@ class H2OFrame(object):
     def ncols(self):
         """Number of columns in the dataframe (int)."""
         if not self._ex._cache.ncols_valid():
-            self._ex._cache.flush()
-            self._frame(fill_cache=True)
+            self._frame(fill_meta=True)
         return self._ex._cache.ncols
 
 
@@ -260,8 +332,7 @@ class H2OFrame(object):
     def types(self):
         """The dictionary of column name/type pairs."""
         if not self._ex._cache.types_valid():
-            self._ex._cache.flush()
-            self._frame(fill_cache=True)
+            self._frame(fill_meta=True)
         return dict(self._ex._cache.types)
 
 
@@ -291,8 +362,7 @@ class H2OFrame(object):
         """
         assert_is_type(col, int, str)
         if not self._ex._cache.types_valid() or not self._ex._cache.names_valid():
-            self._ex._cache.flush()
-            self._frame(fill_cache=True)
+            self._frame(fill_meta=True)
         types = self._ex._cache.types
         if is_type(col, str):
             if col in types:
@@ -313,8 +383,13 @@ class H2OFrame(object):
 
 
     def _upload_parse(self, path, destination_frame, header, sep, column_names, column_types, na_strings):
-        ret = h2o.api("POST /3/PostFile", filename=path)
-        rawkey = ret["destination_frame"]
+        part_size = int(get_config_value("general.upload_part_size", 64 << 20))
+        if os.path.getsize(path) > part_size:
+            rawkey = _upload_file_parts(path, part_size,
+                                        nthreads=int(get_config_value("general.upload_threads", 4)),
+                                        compress=get_config_value("general.compress_uploads", "false").lower() == "true")
+        else:
+            rawkey = h2o.api("POST /3/PostFile", filename=path)["destination_frame"]
         self._parse(rawkey, destination_frame, header, sep, column_names, column_types, na_strings)
         return self
 
@@ -478,10 +553,16 @@ class H2OFrame(object):
         self.summary()
 
 
-    def _frame(self, rows=10, rows_offset=0, cols=-1, cols_offset=0, fill_cache=False):
+    def _frame(self, rows=10, rows_offset=0, cols=-1, cols_offset=0, fill_cache=False, fill_meta=False):
+        # fill_cache fetches the first rows of data (and the column summaries); fill_meta only the missing
+        # shape / names / types of the frame
+        if fill_meta and not fill_cache:
+            ExprNode._eval_all([self._ex])  # evaluates the frame and fetches its metadata with a single request
         self._ex._eager_frame()
         if fill_cache:
             self._ex._cache.fill(rows=rows, rows_offset=rows_offset, cols=cols, cols_offset=cols_offset)
+        elif fill_meta:
+            self._ex._cache.fill_meta()
         return self
 
 
@@ -1243,13 +1324,32 @@ class H2OFrame(object):
         """
         if can_use_pandas() and use_pandas:
             import pandas
-            return pandas.read_csv(StringIO(self.get_frame_data()), low_memory=False, skip_blank_lines=False)
+            data = h2o.api("GET /3/DownloadDataset",
+                           data={"frame_id": self.frame_id, "hex_string": False, "format": "columnar"})
+            if isinstance(data, bytes):
+                return _columnar_to_pandas(data)
+            # Older servers don't support the columnar format, and send CSV instead
+            return pandas.read_csv(StringIO(data), low_memory=False, skip_blank_lines=False)
         frame = [row for row in csv.reader(StringIO(self.get_frame_data()))]
         if not header:
             frame.pop(0)
         return frame
 
 
+    def collect(self, use_pandas=True, header=True, conn=None):
+        """
+        Compute the frame and download its data, from an asyncio event loop: ``await frame.collect()``.
+
+        This is the asynchronous counterpart of :meth:`as_data_frame` (requires Python 3.5+); the frame is evaluated
+        and fetched without blocking the event loop.
+
+        :param conn: the :class:`AsyncH2OConnection` to use (by default a shared one).
+        :returns: an awaitable which resolves to the same object as :meth:`as_data_frame` returns.
+        """
+        from h2o.backend.async_connection import AsyncH2OConnection
+        return (conn or AsyncH2OConnection.default()).run(self.as_data_frame, use_pandas=use_pandas, header=header)
+
+
     def get_frame_data(self):
         """
         Get frame data as a string in csv format.
@@ -1260,6 +1360,45 @@ class H2OFrame(object):
         return h2o.api("GET /3/DownloadDataset", data={"frame_id": self.frame_id, "hex_string": False})
 
 
+    def iter_batches(self, batch_rows=100000, columns=None, use_pandas=True):
+        """
+        Iterate over the frame's data in batches of consecutive rows.
+
+        Only one batch (plus the next one, which is prefetched in the background while the current one is being
+        processed) is held in memory at any time, so this method can be used to stream frames that are too big to
+        be downloaded with :meth:`as_data_frame` all at once.
+
+        :param int batch_rows: maximum number of rows in each batch.
+        :param columns: if given, only these columns (names or indices) will be downloaded.
+        :param bool use_pandas: If True (default) then each batch is a pandas DataFrame, otherwise it is an
+            ``OrderedDict`` mapping column names to numpy arrays.
+
+        :returns: a generator of batches of the frame's data, in row order.
+
+        :examples:
+            >>> for batch in frame.iter_batches(batch_rows=50000, columns=["x", "y"]):
+            ...     scorer.process(batch)
+        """
+        assert_is_type(batch_rows, int)
+        assert_satisfies(batch_rows, batch_rows > 0)
+        assert_is_type(columns, None, [str, int])
+        assert_is_type(use_pandas, bool)
+        fr = self if columns is None else self[columns]
+        frame_id = fr.frame_id
+        nrows = fr.nrows
+
+        def fetch(row_offset):
+            data = h2o.api("GET /3/DownloadDataset",
+                           data={"frame_id": frame_id, "format": "columnar",
+                                 "row_offset": row_offset, "row_count": batch_rows})
+            if not isinstance(data, bytes):
+                raise H2OServerError("The H2O server does not support downloading frames in batches, please upgrade.")
+            return _columnar_to_pandas(data) if use_pandas else _columnar_to_numpy(data)
+
+        for batch in _prefetching_map(fetch, range(0, nrows, batch_rows)):
+            yield batch
+
+
     def __getitem__(self, item):
         """
         Frame slicing, supports row and column slicing.
@@ -1699,27 +1838,34 @@ class H2OFrame(object):
         return fr
 
 
-    def split_frame(self, ratios=None, destination_frames=None, seed=None):
+    def split_frame(self, ratios=None, destination_frames=None, seed=None, method="random", stratify_by=None):
         """
         Split a frame into distinct subsets of size determined by the given ratios.
 
-        The number of subsets is always 1 more than the number of ratios given. Note that
-        this does not give an exact split. H2O is designed to be efficient on big data
-        using a probabilistic splitting method rather than an exact split. For example
-        when specifying a split of 0.75/0.25, H2O will produce a test/train split with
-        an expected value of 0.75/0.25 rather than exactly 0.75/0.25. On small datasets,
-        the sizes of the resulting splits will deviate from the expected value more than
-        on big data, where they will be very close to exact.
+        The number of subsets is always 1 more than the number of ratios given. All the subsets are written by a
+        single job, in one pass over the data; the rows keep their original order within each subset.
+
+        By default (``method="random"``) this does not give an exact split. H2O is designed to be efficient on big
+        data using a probabilistic splitting method rather than an exact split. For example when specifying a split
+        of 0.75/0.25, H2O will produce a test/train split with an expected value of 0.75/0.25 rather than exactly
+        0.75/0.25. On small datasets, the sizes of the resulting splits will deviate from the expected value more
+        than on big data, where they will be very close to exact. With ``method="exact"`` the subsets have exactly
+        the requested sizes (rounded to whole rows), and with ``method="stratified"`` the same holds for each level
+        of the ``stratify_by`` column, so that every subset has the same distribution of that column.
 
         :param List[float] ratios: The fractions of rows for each split.
         :param List[str] destination_frames: The names of the split frames.
         :param int seed: seed for the random number generator
+        :param str method: how rows are assigned to the subsets: ``"random"``, ``"exact"`` or ``"stratified"``.
+        :param str stratify_by: name of the categorical column to stratify by; implies ``method="stratified"``.
 
         :returns: A list of H2OFrames
         """
         assert_is_type(ratios, [numeric], None)
         assert_is_type(destination_frames, [str], None)
         assert_is_type(seed, int, None)
+        assert_is_type(method, "random", "exact", "stratified")
+        assert_is_type(stratify_by, str, None)
 
         if ratios is None:
             ratios = [0.75]
@@ -1731,51 +1877,37 @@ class H2OFrame(object):
                 raise ValueError("The number of provided destination_frames must be one more "
                                  "than the number of provided ratios")
 
-        num_slices = len(ratios) + 1
-        boundaries = []
+        if stratify_by is not None:
+            method = "stratified"
+        elif method == "stratified":
+            raise ValueError("Argument `stratify_by` is required for a stratified split")
 
         last_boundary = 0
-        i = 0
-        while i < num_slices - 1:
-            ratio = ratios[i]
+        for ratio in ratios:
             if ratio < 0:
                 raise ValueError("Ratio must be greater than 0")
-            boundary = last_boundary + ratio
-            if boundary >= 1.0:
+            last_boundary += ratio
+            if last_boundary >= 1.0:
                 raise ValueError("Ratios must add up to less than 1.0")
-            boundaries.append(boundary)
-            last_boundary = boundary
-            i += 1
 
-        splits = []
-        tmp_runif = self.runif(seed)
-        tmp_runif.frame_id = "%s_splitter" % _py_tmp_key(h2o.connection().session_id)
-
-        i = 0
-        while i < num_slices:
-            if i == 0:
-                # lower_boundary is 0.0
-                upper_boundary = boundaries[i]
-                tmp_slice = self[(tmp_runif <= upper_boundary), :]
-            elif i == num_slices - 1:
-                lower_boundary = boundaries[i - 1]
-                # upper_boundary is 1.0
-                tmp_slice = self[(tmp_runif > lower_boundary), :]
-            else:
-                lower_boundary = boundaries[i - 1]
-                upper_boundary = boundaries[i]
-                tmp_slice = self[((tmp_runif > lower_boundary) & (tmp_runif <= upper_boundary)), :]
+        temporary = destination_frames is None
+        if temporary:
+            destination_frames = [_py_tmp_key(h2o.connection().session_id) for _ in range(len(ratios) + 1)]
+        params = {"dataset": self.frame_id, "ratios": ratios, "destination_frames": destination_frames,
+                  "method": method, "seed": -1 if seed is None else seed}
+        if stratify_by is not None:
+            params["stratify_by"] = stratify_by
+        res = h2o.api("POST /3/SplitFrame", data=params)
+        H2OJob(h2o.api("GET /3/Jobs/%s" % res["key"]["name"]), "Split Frame").poll()
 
-            if destination_frames is None:
-                splits.append(tmp_slice)
+        splits = []
+        for frame_id in destination_frames:
+            if temporary:
+                split = H2OFrame._temp_frame(frame_id)
             else:
-                destination_frame_id = destination_frames[i]
-                tmp_slice.frame_id = destination_frame_id
-                splits.append(tmp_slice)
-
-            i += 1
-
-        del tmp_runif
+                split = H2OFrame()
+                split._ex._cache._id = frame_id
+            splits.append(split)
         return splits
 
 
@@ -2079,6 +2211,42 @@ class H2OFrame(object):
         return ExprNode("naCnt", self)._eager_scalar()
 
 
+    def compare(self, other, tol=0):
+        """
+        Compare this frame with another frame of the same shape, cell by cell.
+
+        The comparison is made on the server in a single pass over both frames. Numeric columns are compared with the
+        relative tolerance ``tol``: values ``a`` and ``b`` differ if ``|a - b| / max(1, |a|, |b|) > tol``. Categorical
+        and string columns are compared by their string values, and a numeric column is compared to a string or
+        categorical column by parsing the strings as numbers. Two missing values are equal, a missing value is
+        different from any other value.
+
+        :param H2OFrame other: the frame to compare with.
+        :param float tol: relative tolerance of the differences between numeric values.
+        :returns: A list with a dictionary per column, with keys ``column`` (the name of the column in this frame),
+            ``mismatches`` (the number of rows where the values differ), ``na_mismatches`` (how many of those rows have
+            a missing value in only one of the frames), ``max_abs_error`` and ``max_rel_error`` (the largest differences
+            between non-missing numeric values), ``first_mismatch`` (the index of the first row where the values
+            differ, or None) and ``values`` (the values of both frames in that row, as strings, or None).
+
+        :examples:
+            >>> diffs = frame.compare(expected, tol=1e-10)
+            >>> assert all(d["mismatches"] == 0 for d in diffs), diffs
+        """
+        assert_is_type(other, H2OFrame)
+        assert_is_type(tol, numeric)
+        res = ExprNode("compare", self, other, tol)._eager_scalar()
+        diffs = []
+        for i, name in enumerate(self.names):
+            mismatches, na_mismatches, max_abs, max_rel, row, value1, value2 = res[7 * i:7 * i + 7]
+            first = int(row)
+            diffs.append({"column": name, "mismatches": int(mismatches), "na_mismatches": int(na_mismatches),
+                          "max_abs_error": float(max_abs), "max_rel_error": float(max_rel),
+                          "first_mismatch": None if first < 0 else first,
+                          "values": None if first < 0 else (value1, value2)})
+        return diffs
+
+
     def median(self, na_rm=False):
         """
         Compute the median of each column in the frame.
@@ -3119,6 +3287,224 @@ class H2OFrame(object):
 # Helpers
 #-----------------------------------------------------------------------------------------------------------------------
 
+def _upload_file_parts(path, part_size, nthreads=4, compress=False, retries=3):
+    """
+    Upload a local file in parts of `part_size` bytes, sent in parallel by `nthreads` threads.
+
+    Each part carries the CRC32 checksum of its content (which the server verifies), and is retried up to `retries`
+    times if it fails. The upload id is derived from the file's path, size and modification time, so that the parts
+    already received by the server -- e.g. by an earlier attempt that got interrupted -- are not sent again. Once all
+    the parts are uploaded, the server concatenates them into a single raw frame, whose key is returned.
+
+    :param compress: if True, then the parts are gzip-compressed for the transfer.
+    """
+    stat = os.stat(path)
+    nparts = (stat.st_size + part_size - 1) // part_size
+    upload_id = _upload_file_id(path, part_size)
+    ret = h2o.api("GET /3/PostFilePart", data={"upload_id": upload_id, "parts": nparts})
+    received = {p["part"]: p["checksum"] for p in ret["parts"]}
+
+    pending = list(range(nparts))
+    state = {"bytes": 0, "error": None}
+    lock = threading.Lock()
+
+    def upload_part(i):
+        with open(path, "rb") as f:
+            f.seek(i * part_size)
+            data = f.read(part_size)
+        size = len(data)
+        checksum = "%x" % (zlib.crc32(data) & 0xffffffff)
+        if received.get(i) != checksum:
+            endpoint = "POST /3/PostFilePart?upload_id=%s&part=%d&checksum=%s" % (upload_id, i, checksum)
+            if compress:
+                compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+                data = compressor.compress(data) + compressor.flush()
+                endpoint += "&encoding=gzip"
+            for attempt in range(retries + 1):
+                try:
+                    h2o.api(endpoint, filename=(chunk for chunk in [data]))
+                    break
+                except (H2OConnectionError, H2OResponseError):
+                    if attempt == retries: raise
+                    time.sleep(2 ** attempt)
+        with lock:
+            state["bytes"] += size
+
+    def worker():
+        while True:
+            with lock:
+                if not pending or state["error"] is not None: return
+                i = pending.pop(0)
+            try:
+                upload_part(i)
+            except Exception as e:
+                with lock:
+                    state["error"] = e
+
+    def progress():
+        if state["error"] is not None: raise StopIteration("failed")
+        return state["bytes"]
+
+    threads = [threading.Thread(target=worker) for _ in range(min(nthreads, nparts))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    try:
+        ProgressBar(title="Upload progress", maxval=stat.st_size, hidden=not H2OJob.__PROGRESS_BAR__).execute(progress)
+    finally:
+        with lock:
+            del pending[:]  # if interrupted, the threads only finish the parts in flight
+    for thread in threads:
+        thread.join()
+    if state["error"] is not None:
+        raise state["error"]
+    ret = h2o.api("POST /3/PostFilePart", data={"upload_id": upload_id, "parts": nparts})
+    return ret["destination_frame"]
+
+
+def _upload_file_id(path, part_size):
+    """Id of the upload of a file in parts, which stays the same for as long as the file isn't modified."""
+    stat = os.stat(path)
+    fingerprint = "%s:%d:%d:%d" % (os.path.abspath(path), stat.st_size, int(stat.st_mtime), part_size)
+    return "upload_" + hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+def _download_csv_parts(frame_id, nrows, path, part_rows, nthreads=4, compress=False, resume=False, retries=3):
+    """
+    Download a frame as a CSV file, streaming ranges of `part_rows` rows to disk on `nthreads` threads in parallel.
+
+    A single part is written to `path` directly; otherwise each part goes to its own ``.partN`` file, and the parts are
+    concatenated into `path` once they are all downloaded. A transfer that fails is retried (up to `retries` times)
+    from the last complete row received. With ``resume=True`` the complete rows already present in the files of an
+    earlier, interrupted download are kept, and only the remaining rows are requested.
+
+    :param compress: if True, then the data is gzip-compressed for the transfer.
+    """
+    nparts = max(1, (nrows + part_rows - 1) // part_rows)
+    part_paths = [path] if nparts == 1 else ["%s.part%d" % (path, i) for i in range(nparts)]
+    if resume and nparts > 1 and not any(os.path.exists(p) for p in part_paths) and os.path.exists(path) and \
+            _csv_complete_lines(path)[0] == nrows + 1:
+        return path  # the parts of an earlier download were already concatenated
+
+    pending = list(range(nparts))
+    state = {"lines": 0, "error": None}
+    lock = threading.Lock()
+
+    def add_lines(n):
+        with lock:
+            state["lines"] += n
+
+    def download_part(i):
+        first = i * part_rows
+        count = nrows - first if nparts == 1 else min(part_rows, nrows - first)
+        header = i == 0
+        lines, size = _csv_complete_lines(part_paths[i]) if resume else (0, 0)
+        add_lines(lines)
+        with open(part_paths[i], "r+b" if size else "wb") as f:
+            writer = _CsvLinesWriter(f, size, add_lines)
+            attempt = 0
+            while True:
+                # Drop the incomplete last line (if any), and request the rows following the complete ones
+                writer.rewind()
+                written = lines + writer.lines
+                done = written - 1 if header and written else written
+                if done >= count and (written or not header): break
+                if attempt > retries:
+                    raise H2OServerError("Rows %d to %d of frame %s could not be downloaded" %
+                                         (first + done, first + count, frame_id))
+                params = {"frame_id": frame_id, "hex_string": False, "row_offset": first + done,
+                          "row_count": count - done, "header": header and not written}
+                if compress: params["compression"] = "gzip"
+                try:
+                    h2o.api("GET /3/DownloadDataset", data=params, save_to=writer)
+                except H2OResponseError:
+                    raise
+                except (H2OConnectionError, H2OServerError, IOError):
+                    if attempt == retries: raise
+                    time.sleep(2 ** attempt)
+                attempt += 1
+
+    def worker():
+        while True:
+            with lock:
+                if not pending or state["error"] is not None: return
+                i = pending.pop(0)
+            try:
+                download_part(i)
+            except Exception as e:
+                with lock:
+                    state["error"] = e
+
+    def progress():
+        if state["error"] is not None: raise StopIteration("failed")
+        return state["lines"]
+
+    threads = [threading.Thread(target=worker) for _ in range(min(nthreads, nparts))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    try:
+        ProgressBar(title="Download progress", maxval=nrows + 1, hidden=not H2OJob.__PROGRESS_BAR__).execute(progress)
+    finally:
+        with lock:
+            del pending[:]  # if interrupted, the threads only finish the parts in flight
+    for thread in threads:
+        thread.join()
+    if state["error"] is not None:
+        raise state["error"]
+    if nparts > 1:
+        with open(path, "wb") as f:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, f, 1 << 20)
+        for part_path in part_paths:
+            os.remove(part_path)
+    return path
+
+
+def _csv_complete_lines(path):
+    """Number of complete lines in the file at `path`, and the size of the file up to the end of the last of them."""
+    lines = size = pos = 0
+    if not os.path.exists(path):
+        return 0, 0
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block: break
+            n = block.count(b"\n")
+            if n:
+                lines += n
+                size = pos + block.rindex(b"\n") + 1
+            pos += len(block)
+    return lines, size
+
+
+class _CsvLinesWriter(object):
+    """File wrapper which counts the complete lines written, and the size of the file up to the last of them."""
+
+    def __init__(self, f, size, on_lines):
+        self._file = f
+        self._size = size
+        self._on_lines = on_lines
+        self.lines = 0
+        self.complete_size = size
+
+    def write(self, chunk):
+        self._file.write(chunk)
+        n = chunk.count(b"\n")
+        if n:
+            self.lines += n
+            self.complete_size = self._size + chunk.rindex(b"\n") + 1
+            self._on_lines(n)
+        self._size += len(chunk)
+
+    def rewind(self):
+        """Truncate the file after the last complete line."""
+        self._file.truncate(self.complete_size)
+        self._file.seek(self.complete_size)
+        self._size = self.complete_size
+
+
 def _getValidCols(by_idx, fr):  # so user can input names of the columns as well is idx num
     tmp = []
     for i in by_idx:
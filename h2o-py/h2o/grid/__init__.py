@@ -1,4 +1,5 @@
 from .grid_search import H2OGridSearch
+from .grid_search import H2OGridModels
 from .grid_search import H2OBinomialGridSearch
 from .grid_search import H2OClusteringGridSearch
 from .grid_search import H2OAutoEncoderGridSearch
@@ -6,6 +7,6 @@ from .grid_search import H2OMultinomialGridSearch
 from .grid_search import H2ODimReductionGridSearch
 from .grid_search import H2ORegressionGridSearch
 
-__all__ = ['H2OGridSearch', 'H2OBinomialGridSearch', 'H2OClusteringGridSearch',
+__all__ = ['H2OGridSearch', 'H2OGridModels', 'H2OBinomialGridSearch', 'H2OClusteringGridSearch',
            'H2OAutoEncoderGridSearch', 'H2OMultinomialGridSearch',
            'H2ODimReductionGridSearch', 'H2ORegressionGridSearch']
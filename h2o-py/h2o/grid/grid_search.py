@@ -11,7 +11,7 @@ from h2o.two_dim_table import H2OTwoDimTable
 from h2o.display import H2ODisplay
 from h2o.grid.metrics import *  # NOQA
 from h2o.utils.backward_compatibility import backwards_compatible
-from h2o.utils.shared_utils import deprecated, quoted
+from h2o.utils.shared_utils import _parallel_map, deprecated, quoted
 from h2o.utils.compatibility import *  # NOQA
 from h2o.utils.typechecks import assert_is_type, is_type
 
@@ -65,7 +65,7 @@ class H2OGridSearch(backwards_compatible()):
         self.hyper_params = dict(hyper_params)
         self.search_criteria = None if search_criteria is None else dict(search_criteria)
         self._grid_json = None
-        self.models = None  # list of H2O Estimator instances
+        self.models = None  # list of H2O Estimator instances (an H2OGridModels, once the grid is built)
         self._parms = {}  # internal, for object recycle #
         self.parms = {}  # external#
         self._future = False  # used by __repr__/show to query job state#
@@ -150,6 +150,33 @@ class H2OGridSearch(backwards_compatible()):
         self._job = None
 
 
+    def train_async(self, x, y=None, training_frame=None, offset_column=None, fold_column=None, weights_column=None,
+                    validation_frame=None, conn=None, **params):
+        """
+        Train the models from an asyncio event loop: ``await grid.train_async(...)`` (requires Python 3.5+).
+
+        The parameters are the same as for :meth:`train`; the grid search is started and waited for without
+        blocking the event loop.
+
+        :param conn: the :class:`AsyncH2OConnection` to use (by default a shared one).
+        :returns: an awaitable which resolves to this grid search once all its models are built.
+        """
+        from h2o.backend.async_connection import AsyncH2OConnection
+
+        def start():
+            self.start(x=x, y=y, training_frame=training_frame, offset_column=offset_column, fold_column=fold_column,
+                       weights_column=weights_column, validation_frame=validation_frame, **params)
+            return self._job
+
+        def finish(job):
+            self._future = False
+            self._job = None
+            self._fetch_grid(job.dest_key, self._rest_version)
+            return self
+
+        return (conn or AsyncH2OConnection.default()).build(start, finish)
+
+
     def train(self, x, y=None, training_frame=None, offset_column=None, fold_column=None, weights_column=None,
               validation_frame=None, **params):
         """
@@ -227,11 +254,15 @@ class H2OGridSearch(backwards_compatible()):
 
         if self._future:
             self._job = grid
+            self._rest_version = rest_ver
             return
 
         grid.poll()
+        self._fetch_grid(grid.dest_key, rest_ver)
 
-        grid_json = h2o.api("GET /99/Grids/%s" % (grid.dest_key))
+
+    def _fetch_grid(self, grid_id, rest_ver=None):
+        grid_json = h2o.api("GET /99/Grids/%s" % grid_id)
         failure_messages_stacks = ""
         error_index = 0
         if len(grid_json["failure_details"]) > 0:
@@ -250,14 +281,14 @@ class H2OGridSearch(backwards_compatible()):
                     failure_messages_stacks += error_message+'\n'
                 error_index += 1
 
-        self.models = [h2o.get_model(key['name']) for key in grid_json['model_ids']]
+        self.models = H2OGridModels(key['name'] for key in grid_json['model_ids'])
 
         # get first model returned in list of models from grid search to get model class (binomial, multinomial, etc)
         # sometimes no model is returned due to bad parameter values provided by the user.
         if len(grid_json['model_ids']) > 0:
             first_model_json = h2o.api("GET /%d/Models/%s" %
                                        (rest_ver or 3, grid_json['model_ids'][0]['name']))['models'][0]
-            self._resolve_grid(grid.dest_key, grid_json, first_model_json)
+            self._resolve_grid(grid_id, grid_json, first_model_json)
         else:
             if len(failure_messages_stacks)>0:
                 raise ValueError(failure_messages_stacks)
@@ -281,8 +312,7 @@ class H2OGridSearch(backwards_compatible()):
 
 
     def __iter__(self):
-        nmodels = len(self.models)
-        return (self[i] for i in range(nmodels))
+        return iter(self.models)
 
 
     def __len__(self):
@@ -720,6 +750,17 @@ class H2OGridSearch(backwards_compatible()):
         print("No sorted metric table for this grid search")
 
 
+    @staticmethod
+    def _hyper_params_from_summary(grid_json):
+        """The values of the hyper-parameters of the grid's models, as listed in the grid's summary table."""
+        summary = grid_json["summary_table"]
+        hyper_params = {}
+        for param in grid_json["hyper_names"]:
+            values = summary[param] if summary is not None else []
+            hyper_params[str(param)] = list(set(_parse_summary_value(v) for v in values))
+        return hyper_params
+
+
     @staticmethod
     def _metrics_class(model_json):
         model_type = model_json["output"]["model_category"]
@@ -762,7 +803,9 @@ class H2OGridSearch(backwards_compatible()):
 
         grid_json = h2o.api("GET /99/Grids/%s" % self._id, data={"sort_by": sort_by, "decreasing": decreasing})
         grid = H2OGridSearch(self.model, self.hyper_params, self._id)
-        grid.models = [h2o.get_model(key['name']) for key in grid_json['model_ids']]  # reordered
+        model_ids = [key['name'] for key in grid_json['model_ids']]
+        grid.models = self.models.reorder(model_ids) if isinstance(self.models, H2OGridModels) else \
+            H2OGridModels(model_ids)
         first_model_json = h2o.api("GET /99/Models/%s" % grid_json['model_ids'][0]['name'])['models'][0]
         model_class = H2OGridSearch._metrics_class(first_model_json)
         m = model_class()
@@ -795,3 +838,83 @@ class H2OGridSearch(backwards_compatible()):
             col_header=['Model Id', 'Hyperparameters: [' + ', '.join(list(self.hyper_params.keys())) + ']', metric],
             table_header='Grid Search Results for ' + self.model.__class__.__name__,
             cell_values=[list(x) for x in zip(*c_values)])
+
+
+
+class H2OGridModels(object):
+    """
+    The models of a grid search, which are retrieved from the server only once they are accessed.
+
+    Accessing a single model (``grid.models[i]``) fetches just that model, whereas iterating over the models (or
+    slicing them) fetches all the models that are not available yet, in parallel.
+    """
+
+    # Maximum number of models fetched at the same time
+    FETCH_THREADS = 8
+
+    def __init__(self, model_ids):
+        self._model_ids = list(model_ids)
+        self._models = [None] * len(self._model_ids)
+
+
+    @property
+    def model_ids(self):
+        """Ids of the models, which are known without fetching the models."""
+        return list(self._model_ids)
+
+
+    def __len__(self):
+        return len(self._model_ids)
+
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            indices = range(len(self))[item]
+            self._fetch(indices)
+            return [self._models[i] for i in indices]
+        if self._models[item] is None:
+            self._models[item] = h2o.get_model(self._model_ids[item])
+        return self._models[item]
+
+
+    def __iter__(self):
+        self._fetch(range(len(self)))
+        return iter(list(self._models))
+
+
+    def __repr__(self):
+        return "<H2OGridModels: %s>" % ", ".join(self._model_ids)
+
+
+    def reorder(self, model_ids):
+        """
+        Return the models in a different order (or a subset of them), keeping the models already retrieved.
+
+        :param model_ids: the ids of the models, in the new order.
+        """
+        loaded = {mid: model for mid, model in zip(self._model_ids, self._models) if model is not None}
+        models = H2OGridModels(model_ids)
+        models._models = [loaded.get(mid) for mid in models._model_ids]
+        return models
+
+
+    def _fetch(self, indices):
+        missing = [i for i in indices if self._models[i] is None]
+        models = _parallel_map(h2o.get_model, [self._model_ids[i] for i in missing], H2OGridModels.FETCH_THREADS)
+        for i, model in zip(missing, models):
+            self._models[i] = model
+
+
+def _parse_summary_value(value):
+    # The summary table holds the hyper-parameters as strings, arrays as "[a, b]" (of which the first value is used,
+    # as with the models' parameters)
+    if not isinstance(value, str): return value
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1].split(",")[0].strip()
+    if value in ("true", "false"): return value == "true"
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
@@ -9,8 +9,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import logging
 import os
+from contextlib import contextmanager
 import warnings
-import webbrowser
 import types
 
 
@@ -18,35 +18,50 @@ from h2o.backend import H2OConnection
 from h2o.backend import H2OConnectionConf
 from h2o.backend import H2OLocalServer
 from h2o.exceptions import H2OConnectionError, H2OValueError
-from h2o.utils.config import H2OConfigReader
-from h2o.utils.shared_utils import check_frame_id, deprecated, gen_header, py_tmp_key, quoted, urlopen
+from h2o.utils.config import H2OConfigReader, get_config_value
+from h2o.utils.shared_utils import check_frame_id, deprecated, gen_header, lazy_attributes, py_tmp_key, quoted
 from h2o.utils.typechecks import assert_is_type, assert_satisfies, BoundInt, BoundNumeric, I, is_type, numeric, U
-from .estimators.deeplearning import H2OAutoEncoderEstimator
-from .estimators.deeplearning import H2ODeepLearningEstimator
-from .estimators.deepwater import H2ODeepWaterEstimator
-from .estimators.estimator_base import H2OEstimator
-from .estimators.xgboost import H2OXGBoostEstimator
-from .estimators.gbm import H2OGradientBoostingEstimator
-from .estimators.glm import H2OGeneralizedLinearEstimator
-from .estimators.glrm import H2OGeneralizedLowRankEstimator
-from .estimators.kmeans import H2OKMeansEstimator
-from .estimators.naive_bayes import H2ONaiveBayesEstimator
-from .estimators.random_forest import H2ORandomForestEstimator
-from .estimators.stackedensemble import H2OStackedEnsembleEstimator
-from .estimators.word2vec import H2OWord2vecEstimator
 from .expr import ExprNode
-from .frame import H2OFrame
-from .grid.grid_search import H2OGridSearch
+from .expr_optimizer import find_optimization
+from .frame import H2OFrame, _download_csv_parts
 from .job import H2OJob
 from .model.model_base import ModelBase
-from .transforms.decomposition import H2OPCA
-from .transforms.decomposition import H2OSVD
 from .utils.debugging import *  # NOQA
 from .utils.compatibility import *  # NOQA
-from .utils.compatibility import PY3
 
 logging.basicConfig()
 
+# The estimators, grids and transforms are only imported when first used (they used to be imported here, and are
+# still accessible as attributes of this module).
+__getattr__ = lazy_attributes(__name__, {
+    "H2OAutoEncoderEstimator": ".estimators.deeplearning",
+    "H2ODeepLearningEstimator": ".estimators.deeplearning",
+    "H2ODeepWaterEstimator": ".estimators.deepwater",
+    "H2OEstimator": ".estimators.estimator_base",
+    "H2OXGBoostEstimator": ".estimators.xgboost",
+    "H2OGradientBoostingEstimator": ".estimators.gbm",
+    "H2OGeneralizedLinearEstimator": ".estimators.glm",
+    "H2OGeneralizedLowRankEstimator": ".estimators.glrm",
+    "H2OKMeansEstimator": ".estimators.kmeans",
+    "H2ONaiveBayesEstimator": ".estimators.naive_bayes",
+    "H2ORandomForestEstimator": ".estimators.random_forest",
+    "H2OStackedEnsembleEstimator": ".estimators.stackedensemble",
+    "H2OWord2vecEstimator": ".estimators.word2vec",
+    "H2OGridModels": ".grid.grid_search",
+    "H2OGridSearch": ".grid.grid_search",
+    "H2OPCA": ".transforms.decomposition",
+    "H2OSVD": ".transforms.decomposition",
+})
+
+# Model class for each algo, as reported by the server
+_model_classes = {
+    "svd": "H2OSVD", "pca": "H2OPCA", "drf": "H2ORandomForestEstimator", "naivebayes": "H2ONaiveBayesEstimator",
+    "kmeans": "H2OKMeansEstimator", "glrm": "H2OGeneralizedLowRankEstimator", "glm": "H2OGeneralizedLinearEstimator",
+    "gbm": "H2OGradientBoostingEstimator", "deepwater": "H2ODeepWaterEstimator", "xgboost": "H2OXGBoostEstimator",
+    "word2vec": "H2OWord2vecEstimator", "deeplearning": "H2ODeepLearningEstimator",
+    "autoencoder": "H2OAutoEncoderEstimator", "stackedensemble": "H2OStackedEnsembleEstimator",
+}
+
 # An IPython deprecation warning is triggered after h2o.init(). Remove this once the deprecation has been resolved
 warnings.filterwarnings('ignore', category=DeprecationWarning, module='.*/IPython/.*')
 
@@ -297,7 +312,11 @@ def upload_file(path, destination_frame=None, header=0, sep=None, col_names=None
     """
     Upload a dataset from the provided local path to the H2O cluster.
 
-    Does a single-threaded push to H2O. Also see :meth:`import_file`.
+    Files larger than the ``general.upload_part_size`` config value (64MB by default) are pushed in parts, by
+    ``general.upload_threads`` parallel threads (4 by default). Each part is checksummed and retried on failure, and
+    if the upload is interrupted, calling this function again with the same file resumes it -- only the parts that
+    the cluster hasn't received yet are sent. With ``general.compress_uploads = true`` the parts are gzip-compressed
+    for the transfer. Also see :meth:`import_file`.
 
     :param path: A path specifying the location of the data to upload.
     :param destination_frame:  The unique hex key assigned to the imported file. If none is given, a key will
@@ -694,57 +713,46 @@ def get_model(model_id):
     """
     assert_is_type(model_id, str)
     model_json = api("GET /3/Models/%s" % model_id)["models"][0]
-    algo = model_json["algo"]
-    if algo == "svd":            m = H2OSVD()
-    elif algo == "pca":          m = H2OPCA()
-    elif algo == "drf":          m = H2ORandomForestEstimator()
-    elif algo == "naivebayes":   m = H2ONaiveBayesEstimator()
-    elif algo == "kmeans":       m = H2OKMeansEstimator()
-    elif algo == "glrm":         m = H2OGeneralizedLowRankEstimator()
-    elif algo == "glm":          m = H2OGeneralizedLinearEstimator()
-    elif algo == "gbm":          m = H2OGradientBoostingEstimator()
-    elif algo == "deepwater":    m = H2ODeepWaterEstimator()
-    elif algo == "xgboost":      m = H2OXGBoostEstimator()
-    elif algo == "word2vec":     m = H2OWord2vecEstimator()
-    elif algo == "deeplearning":
-        if model_json["output"]["model_category"] == "AutoEncoder":
-            m = H2OAutoEncoderEstimator()
-        else:
-            m = H2ODeepLearningEstimator()
-    elif algo == "stackedensemble": m = H2OStackedEnsembleEstimator()
-    else:
-        raise ValueError("Unknown algo type: " + algo)
+    m = _estimator_class(model_json)()
     m._resolve_model(model_id, model_json)
     return m
 
 
+def _estimator_class(model_json):
+    """The estimator class of the model described by ``model_json``."""
+    algo = model_json["algo"]
+    if algo == "deeplearning" and model_json["output"]["model_category"] == "AutoEncoder":
+        algo = "autoencoder"
+    if algo not in _model_classes:
+        raise ValueError("Unknown algo type: " + algo)
+    return __getattr__(_model_classes[algo])
+
+
 def get_grid(grid_id):
     """
     Return the specified grid.
 
+    Only the first model of the grid is retrieved (to find out the kind of the grid); the other models are retrieved
+    when they are accessed.
+
     :param grid_id: The grid identification in h2o
 
     :returns: an :class:`H2OGridSearch` instance.
     """
+    from h2o.grid.grid_search import H2OGridModels, H2OGridSearch
     assert_is_type(grid_id, str)
     grid_json = api("GET /99/Grids/%s" % grid_id)
-    models = [get_model(key["name"]) for key in grid_json["model_ids"]]
+    models = H2OGridModels(key["name"] for key in grid_json["model_ids"])
     # get first model returned in list of models from grid search to get model class (binomial, multinomial, etc)
     first_model_json = api("GET /3/Models/%s" % grid_json["model_ids"][0]["name"])["models"][0]
     gs = H2OGridSearch(None, {}, grid_id)
     gs._resolve_grid(grid_id, grid_json, first_model_json)
     gs.models = models
-    hyper_params = {param: set() for param in gs.hyper_names}
-    for param in gs.hyper_names:
-        for model in models:
-            if isinstance(model.full_parameters[param]["actual_value"], list):
-                hyper_params[param].add(model.full_parameters[param]["actual_value"][0])
-            else:
-                hyper_params[param].add(model.full_parameters[param]["actual_value"])
-
-    hyper_params = {str(param): list(vals) for param, vals in hyper_params.items()}
-    gs.hyper_params = hyper_params
-    gs.model = model.__class__()
+    gs.hyper_params = H2OGridSearch._hyper_params_from_summary(grid_json)
+    gs.model = _estimator_class(first_model_json)()
+    first_model = _estimator_class(first_model_json)()
+    first_model._resolve_model(grid_json["model_ids"][0]["name"], first_model_json)
+    models._models[0] = first_model
     return gs
 
 
@@ -773,13 +781,101 @@ def show_progress():
     H2OJob.__PROGRESS_BAR__ = True
 
 
-def enable_expr_optimizations(flag):
-    """Enable expression tree local optimizations."""
-    ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__ = flag
+def enable_expr_optimizations(flag, optimizations=None):
+    """
+    Enable expression tree optimizations.
+
+    :param flag: True to enable the optimizations, False to disable them.
+    :param optimizations: name (or list of names) of the individual optimizations to switch on/off, for example
+        ``"cse"`` (common subexpression elimination), ``"constants"`` (constant folding), ``"selections"``
+        (collapsing chained selections), ``"pushdown"`` (column selection before row filtering), ``"fold"`` and
+        ``"skip"``. If not given, all the optimizations are switched on/off together; the individual flags are kept.
+    """
+    assert_is_type(flag, bool)
+    assert_is_type(optimizations, None, str, [str])
+    if optimizations is None:
+        ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__ = flag
+    else:
+        if isinstance(optimizations, str): optimizations = [optimizations]
+        for opt in [find_optimization(name) for name in optimizations]:
+            opt.enabled = flag
+
+
+def is_expr_optimizations_enabled(optimization=None):
+    """
+    Check whether the expression tree optimizations are enabled.
+
+    :param optimization: name of an individual optimization to check (it is applied only when the optimizations are
+        enabled globally as well).
+    """
+    if optimization is None:
+        return ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__
+    return ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__ and find_optimization(optimization).enabled
 
 
-def is_expr_optimizations_enabled():
-    return ExprNode.__ENABLE_EXPR_OPTIMIZATIONS__
+def evaluate_all(frames):
+    """
+    Compute several lazy frames with a single request to the backend.
+
+    Each lazy frame is normally computed on its own, the first time its data or properties are needed. This sends
+    all the given frames to the backend at once (computing the sub-expressions they share only once), and fills in
+    their number of rows and columns, column names and types, so that those don't need to be requested later.
+
+    :param frames: list of H2OFrames; the frames already computed are skipped.
+    """
+    assert_is_type(frames, [H2OFrame])
+    ExprNode._eval_all([fr._ex for fr in frames if fr._ex is not None])
+
+
+@contextmanager
+def batch():
+    """
+    Context manager that computes all the frames derived within it with a single request to the backend when
+    the block exits (see :func:`evaluate_all`).
+
+    :examples:
+        >>> with h2o.batch():
+        ...     logs = [fr[col].log() for col in fr.names]
+        >>> [log.types for log in logs]  # no more requests here
+    """
+    outer = H2OFrame._batch
+    H2OFrame._batch = []
+    try:
+        yield
+        frames = [ref() for ref in H2OFrame._batch]
+        evaluate_all([fr for fr in frames if fr is not None])
+    finally:
+        H2OFrame._batch = outer
+
+
+def flush_temps():
+    """
+    Remove from H2O the temporary frames that were garbage-collected on the client but not removed yet.
+
+    Temporaries are removed lazily, in batches (see :func:`set_temps_gc`); this sends all pending ones at once.
+
+    :returns: the number of temporary frames removed.
+    """
+    return ExprNode._temps.flush()
+
+
+def set_temps_gc(batch_size=None, flush_interval=None, background=None):
+    """
+    Configure how temporary frames of garbage-collected expressions are removed from H2O.
+
+    :param batch_size: number of temporaries collected before they are removed with a single request (1 removes
+        each one immediately).
+    :param flush_interval: maximum number of seconds the temporaries are kept before removing them.
+    :param background: if True, the removal requests are sent from a background thread, so that the garbage
+        collection never blocks on the network.
+    """
+    assert_is_type(batch_size, None, BoundInt(1))
+    assert_is_type(flush_interval, None, BoundNumeric(0))
+    assert_is_type(background, None, bool)
+    temps = ExprNode._temps
+    if batch_size is not None: temps.batch_size = batch_size
+    if flush_interval is not None: temps.flush_interval = flush_interval
+    if background is not None: temps.background = background
 
 
 def log_and_echo(message=""):
@@ -805,6 +901,7 @@ def remove(x):
     :param x: H2OFrame, H2OEstimator, or string, or a list of those things: the object(s) or unique id(s)
         pointing to the object(s) to be removed.
     """
+    from h2o.estimators.estimator_base import H2OEstimator
     item_type = U(str, H2OFrame, H2OEstimator)
     assert_is_type(x, item_type, [item_type])
     if not isinstance(x, list): x = [x]
@@ -899,21 +996,32 @@ def download_pojo(model, path="", get_jar=True, jar_name=""):
         return filename
 
 
-def download_csv(data, filename):
+def download_csv(data, filename, resume=False):
     """
     Download an H2O data set to a CSV file on the local disk.
 
+    The data is streamed to disk, so the frame does not need to fit in memory. Frames with more than
+    ``general.download_part_rows`` rows (1,000,000 by default) are fetched as several ranges of rows downloaded in
+    parallel on ``general.download_threads`` threads (4 by default); set the ``general.compress_downloads`` option
+    to "true" to have the data gzip-compressed for the transfer. These options can be set in the ``.h2oconfig`` file.
+
     Warning: Files located on the H2O server may be very large! Make sure you have enough
     hard drive space to accommodate the entire file.
 
     :param data: an H2OFrame object to be downloaded.
     :param filename: name for the CSV file where the data should be saved to.
+    :param resume: if True, then an earlier download to the same file that was interrupted is continued: the rows
+        already saved are kept, and only the missing ones are downloaded.
+    :returns: the name of the CSV file.
     """
     assert_is_type(data, H2OFrame)
     assert_is_type(filename, str)
-    url = h2oconn.make_url("DownloadDataset", 3) + "?frame_id={}&hex_string=false".format(data.frame_id)
-    with open(filename, "wb") as f:
-        f.write(urlopen()(url).read())
+    assert_is_type(resume, bool)
+    return _download_csv_parts(data.frame_id, data.nrows, filename,
+                               part_rows=int(get_config_value("general.download_part_rows", 1000000)),
+                               nthreads=int(get_config_value("general.download_threads", 4)),
+                               compress=get_config_value("general.compress_downloads", "false").lower() == "true",
+                               resume=resume)
 
 
 def download_all_logs(dirname=".", filename=None):
@@ -932,26 +1040,10 @@ def download_all_logs(dirname=".", filename=None):
     """
     assert_is_type(dirname, str)
     assert_is_type(filename, str, None)
-    url = "%s/3/Logs/download" % h2oconn.base_url
-    opener = urlopen()
-    response = opener(url)
-
     if not os.path.exists(dirname): os.mkdir(dirname)
-    if filename is None:
-        if PY3:
-            headers = [h[1] for h in response.headers._headers]
-        else:
-            headers = response.headers.headers
-        for h in headers:
-            if "filename=" in h:
-                filename = h.split("filename=")[1].strip()
-                break
-    path = os.path.join(dirname, filename)
-    response = opener(url).read()
-
+    # Without a file name, the one suggested by the server is used
+    path = api("GET /3/Logs/download", save_to=os.path.join(dirname, filename) if filename else dirname)
     print("Writing H2O logs to " + path)
-    with open(path, "wb") as f:
-        f.write(response)
     return path
 
 
@@ -1275,6 +1367,7 @@ def flow():
     Open H2O Flow in your browser.
 
     """
+    import webbrowser
     webbrowser.open(connection().base_url, new = 1)
 
 
@@ -21,6 +21,11 @@ class H2OJob(object):
 
     __PROGRESS_BAR__ = True  # display & update progress bar while polling
 
+    # How long (in ms) a status request may wait on the server for the job to finish. The request returns as soon as
+    # the job finishes, so this only limits how long the progress bar goes without an update.
+    WAIT_MS = 1000
+    _server_waits = True  # cleared if the server doesn't support waiting for jobs (then we poll instead)
+
     def __init__(self, jobs, job_type):
         """Initialize new H2OJob object."""
         if "jobs" in jobs:
@@ -40,6 +45,7 @@ class H2OJob(object):
         self._job_type = job_type
         self._polling = False
         self._poll_count = 10**10
+        self._poll_interval = 0.1
 
 
     def poll(self, verbose_model_scoring_history = False):
@@ -64,6 +70,22 @@ class H2OJob(object):
 
         assert self.status in {"DONE", "CANCELLED", "FAILED"} or self._poll_count <= 0, \
             "Polling finished while the job has status %s" % self.status
+        return self._check_status()
+
+    def wait(self, conn=None):
+        """
+        Wait until the job finishes, from an asyncio event loop: ``await job.wait()`` (requires Python 3.5+).
+
+        This is the asynchronous counterpart of :meth:`poll` (without a progress bar).
+
+        :param conn: the :class:`AsyncH2OConnection` to use (by default a shared one).
+        :returns: an awaitable which resolves to this job once it finishes.
+        """
+        from h2o.backend.async_connection import AsyncH2OConnection
+        return (conn or AsyncH2OConnection.default()).wait_job(self)
+
+    def _check_status(self):
+        """Issue the job's warnings, and raise an exception if the job failed or was cancelled."""
         if self.warnings:
             for w in self.warnings:
                 warnings.warn(w)
@@ -90,7 +112,7 @@ class H2OJob(object):
 
     def _refresh_job_status(self):
         if self._poll_count <= 0: raise StopIteration("")
-        jobs = h2o.api("GET /3/Jobs/%s" % self.job_key)
+        jobs, delay = self._fetch_job()
         self.job = jobs["jobs"][0] if "jobs" in jobs else jobs["job"][0]
         self.status = self.job["status"]
         self.progress = self.job["progress"]
@@ -105,7 +127,26 @@ class H2OJob(object):
         if self.status == "DONE": self.progress = 1
         if self.status == "FAILED": raise StopIteration("failed")
         if self.status == "CANCELLED": raise StopIteration("cancelled by the server")
-        return self.progress
+        return self.progress, delay
+
+    def _fetch_job(self):
+        """
+        Fetch the current state of the job.
+
+        The server is asked to hold the request until the job finishes (but for at most ``WAIT_MS``), so that its
+        completion is noticed immediately, and the next request can be sent right away. Servers that cannot do this
+        are polled at exponentially increasing intervals instead.
+
+        :returns: tuple (jobs response, delay until the next request in seconds).
+        """
+        if H2OJob._server_waits and self._poll_count > 1:
+            try:
+                return h2o.api("GET /3/Jobs/%s" % self.job_key, data={"wait_ms": H2OJob.WAIT_MS}), 0
+            except H2OResponseError as e:
+                if "wait_ms" not in e.args[0].msg: raise
+                H2OJob._server_waits = False
+        self._poll_interval = min(self._poll_interval * 2, 2.0)
+        return h2o.api("GET /3/Jobs/%s" % self.job_key), self._poll_interval
 
     def _print_verbose_info(self):
         try:
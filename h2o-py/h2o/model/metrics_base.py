@@ -8,10 +8,13 @@ Regression model.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import imp
+import warnings
+from bisect import bisect_left
 
 from h2o.model.confusion_matrix import ConfusionMatrix
 from h2o.utils.backward_compatibility import backwards_compatible
 from h2o.utils.compatibility import *  # NOQA
+from h2o.utils.shared_utils import can_use_numpy
 from h2o.utils.typechecks import assert_is_type, assert_satisfies, numeric
 
 
@@ -317,6 +320,8 @@ class H2OBinomialModelMetrics(MetricsBase):
           :returns: A new H2OBinomialModelMetrics object.
           """
         super(H2OBinomialModelMetrics, self).__init__(metric_json, on, algo)
+        self._threshold_index = None
+        self._max_metric_thresholds = None
 
 
     def F1(self, thresholds=None):
@@ -490,12 +495,31 @@ class H2OBinomialModelMetrics(MetricsBase):
         """
         assert_is_type(thresholds, None, [numeric])
         if not thresholds: thresholds = [self.find_threshold_by_max_metric(metric)]
-        thresh2d = self._metric_json['thresholds_and_metric_scores']
-        metrics = []
-        for t in thresholds:
-            idx = self.find_idx_by_threshold(t)
-            metrics.append([t, thresh2d[metric][idx]])
-        return metrics
+        values = self._thresholds().column(metric)
+        return [[t, values[idx]] for t, idx in zip(thresholds, self._find_idx_by_thresholds(thresholds))]
+
+
+    def metric_values(self, metric, thresholds):
+        """
+        Look up the values of a metric at many thresholds at once.
+
+        The thresholds table is indexed on the first call, so that each threshold is then found with a binary search
+        instead of a scan of the whole table. Thresholds that are not in the table are replaced with the closest ones.
+
+        :param str metric: The desired metric (a column of the ``thresholds_and_metric_scores`` table).
+        :param thresholds: A list (or a numpy array) of thresholds between 0 and 1.
+        :returns: A numpy array with the values of the metric at the given thresholds (or a list if numpy is not
+            installed).
+
+        :examples:
+            >>> f1s = perf.metric_values("f1", numpy.linspace(0, 1, 1001))
+        """
+        index = self._thresholds()
+        idxs = self._find_idx_by_thresholds(thresholds)
+        if index.vectorized:
+            return index.array(metric)[idxs]
+        values = index.column(metric)
+        return [values[i] for i in idxs]
 
 
     def plot(self, type="roc", server=False):
@@ -591,10 +615,9 @@ class H2OBinomialModelMetrics(MetricsBase):
             thresholds_list.append(mt)
 
         thresh2d = self._metric_json['thresholds_and_metric_scores']
-        actual_thresholds = [float(e[0]) for i, e in enumerate(thresh2d.cell_values)]
+        actual_thresholds = self._thresholds().thresholds
         cms = []
-        for t in thresholds_list:
-            idx = self.find_idx_by_threshold(t)
+        for t, idx in zip(thresholds_list, self._find_idx_by_thresholds(thresholds_list)):
             row = thresh2d.cell_values[idx]
             tns = row[11]
             fns = row[12]
@@ -625,12 +648,15 @@ class H2OBinomialModelMetrics(MetricsBase):
             "accuracy", "f0point5", "f2", "f1", "mean_per_class_accuracy"}.
         :returns: the threshold at which the given metric is maximal.
         """
-        crit2d = self._metric_json['max_criteria_and_metric_scores']
-
-        for e in crit2d.cell_values:
-            if e[0] == "max " + metric.lower():
-                return e[1]
-        raise ValueError("No metric " + str(metric.lower()))
+        if self._max_metric_thresholds is None:
+            crit2d = self._metric_json['max_criteria_and_metric_scores']
+            self._max_metric_thresholds = {}
+            for e in crit2d.cell_values:
+                self._max_metric_thresholds.setdefault(e[0], e[1])
+        threshold = self._max_metric_thresholds.get("max " + metric.lower())
+        if threshold is None:
+            raise ValueError("No metric " + str(metric.lower()))
+        return threshold
 
 
     def find_idx_by_threshold(self, threshold):
@@ -642,20 +668,37 @@ class H2OBinomialModelMetrics(MetricsBase):
         :raises ValueError: if no such index can be found.
         """
         assert_is_type(threshold, numeric)
-        thresh2d = self._metric_json['thresholds_and_metric_scores']
-        for i, e in enumerate(thresh2d.cell_values):
-            t = float(e[0])
-            if abs(t - threshold) < 0.00000001 * max(t, threshold):
-                return i
-        if threshold >= 0 and threshold <= 1:
-            thresholds = [float(e[0]) for i, e in enumerate(thresh2d.cell_values)]
-            threshold_diffs = [abs(t - threshold) for t in thresholds]
-            closest_idx = threshold_diffs.index(min(threshold_diffs))
-            closest_threshold = thresholds[closest_idx]
-            print("Could not find exact threshold {0}; using closest threshold found {1}."
-                  .format(threshold, closest_threshold))
-            return closest_idx
-        raise ValueError("Threshold must be between 0 and 1, but got {0} ".format(threshold))
+        return int(self._find_idx_by_thresholds([threshold])[0])
+
+
+    def _thresholds(self):
+        """The index of the thresholds_and_metric_scores table, built on first use."""
+        if self._threshold_index is None:
+            self._threshold_index = _ThresholdIndex(self._metric_json['thresholds_and_metric_scores'])
+        return self._threshold_index
+
+
+    def _find_idx_by_thresholds(self, thresholds):
+        """
+        Indices of the given thresholds (or of the closest ones found) in the thresholds table.
+
+        A single threshold which is not in the table is reported with a warning naming the closest threshold; for
+        several thresholds one warning tells how many of them were replaced with the closest ones.
+        """
+        index = self._thresholds()
+        idxs, closest = index.find(thresholds)
+        inexact = 0
+        for t, c in zip(thresholds, closest):
+            if c is None: continue
+            if not 0 <= t <= 1:
+                raise ValueError("Threshold must be between 0 and 1, but got {0} ".format(t))
+            inexact += 1
+            if len(thresholds) == 1:
+                warnings.warn("Could not find exact threshold {0}; using closest threshold found {1}.".format(t, c))
+        if inexact and len(thresholds) > 1:
+            warnings.warn("Could not find exact thresholds for {0} of the {1} thresholds; using the closest thresholds "
+                          "found.".format(inexact, len(thresholds)))
+        return idxs
 
 
     def gains_lift(self):
@@ -667,6 +710,87 @@ class H2OBinomialModelMetrics(MetricsBase):
 
 
 
+class _ThresholdIndex(object):
+    """
+    The thresholds of a ``thresholds_and_metric_scores`` table, sorted for binary-search lookups.
+
+    The columns of the table are extracted once (and converted to numpy arrays if numpy is available), so that looking
+    up the metrics at many thresholds doesn't rescan the table for each threshold.
+    """
+
+    def __init__(self, table):
+        self._table = table
+        self._columns = {}
+        self._arrays = {}
+        self._sorted_array = self._order_array = None
+        self.thresholds = [float(row[0]) for row in table.cell_values]
+        # A stable sort, so that the first of equal thresholds is the one closest to the top of the table
+        self._order = sorted(range(len(self.thresholds)), key=self.thresholds.__getitem__)
+        self._sorted = [self.thresholds[i] for i in self._order]
+        self.vectorized = can_use_numpy()
+
+
+    def column(self, name):
+        """Values of the given column of the table, in the table's order."""
+        if name not in self._columns:
+            self._columns[name] = self._table[name]
+        return self._columns[name]
+
+
+    def array(self, name):
+        """Values of the given column of the table, as a numpy array."""
+        if name not in self._arrays:
+            import numpy
+            self._arrays[name] = numpy.array(self.column(name))
+        return self._arrays[name]
+
+
+    def find(self, thresholds):
+        """
+        Find the rows of the table with the given thresholds.
+
+        When a threshold is not in the table, the closest one is used instead (the one nearest to the top of the table,
+        if there are several).
+
+        :returns: a tuple of the row indices, and of the thresholds used instead of the requested ones (None for the
+            thresholds found in the table).
+        """
+        if not self.thresholds:
+            raise ValueError("The thresholds table is empty")
+        if self.vectorized:
+            return self._find_vectorized(thresholds)
+        idxs, closest = [], []
+        last = len(self._sorted) - 1
+        for t in thresholds:
+            hi = bisect_left(self._sorted, self._sorted[min(bisect_left(self._sorted, t), last)])
+            lo = bisect_left(self._sorted, self._sorted[max(hi - 1, 0)])
+            dlo, dhi = abs(self._sorted[lo] - t), abs(self._sorted[hi] - t)
+            pos = lo if dlo < dhi or (dlo == dhi and self._order[lo] < self._order[hi]) else hi
+            found = self._sorted[pos]
+            idxs.append(self._order[pos])
+            closest.append(None if abs(found - t) <= 1e-8 * max(found, t) else found)
+        return idxs, closest
+
+
+    def _find_vectorized(self, thresholds):
+        import numpy
+        if self._sorted_array is None:
+            self._sorted_array = numpy.array(self._sorted)
+            self._order_array = numpy.array(self._order)
+        s, order = self._sorted_array, self._order_array
+        t = numpy.asarray(thresholds, dtype=float)
+        hi = numpy.searchsorted(s, s[numpy.minimum(numpy.searchsorted(s, t), len(s) - 1)])
+        lo = numpy.searchsorted(s, s[numpy.maximum(hi - 1, 0)])
+        dlo, dhi = numpy.abs(s[lo] - t), numpy.abs(s[hi] - t)
+        pos = numpy.where((dlo < dhi) | ((dlo == dhi) & (order[lo] < order[hi])), lo, hi)
+        found = s[pos]
+        exact = numpy.abs(found - t) <= 1e-8 * numpy.maximum(found, t)
+        closest = [None if e else f for e, f in zip(exact.tolist(), found.tolist())]
+        return order[pos], closest
+
+
+
+
 class H2OAutoEncoderModelMetrics(MetricsBase):
 
     def __init__(self, metric_json, on=None, algo=""):
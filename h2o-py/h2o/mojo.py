@@ -0,0 +1,699 @@
+# -*- encoding: utf-8 -*-
+"""
+Scoring of MOJO models in Python, without an H2O server or a Java runtime.
+
+A MOJO produced by :meth:`H2OEstimator.download_mojo` (or :func:`h2o.save_model` + ``download_mojo``) can be loaded
+with :func:`load_mojo`, and then used to score pandas DataFrames, dicts of columns or single rows::
+
+    mojo = h2o.mojo.load_mojo("GBM_model_python_1500000000000_1.zip")
+    preds = mojo.predict(pandas.read_csv("test.csv"))
+    mojo.predict_row({"AGE": 65, "RACE": "1", "PSA": 1.4})
+
+The predictions are the same as those of ``hex.genmodel.tools.PredictCsv`` (``EasyPredictModelWrapper``). Tree models
+(GBM and DRF) are compiled into flat numpy arrays, which are traversed for all the rows of a batch and all the trees
+of the model at once; linear models (GLM) are scored as one matrix product. Requires numpy.
+
+:copyright: (c) 2017 H2O.ai
+:license:   Apache License Version 2.0 (see LICENSE for details)
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import io
+import os
+import struct
+import zipfile
+
+import numpy
+
+from h2o.exceptions import H2OValueError
+from h2o.utils.compatibility import *  # NOQA
+from h2o.utils.shared_utils import can_use_pandas
+from h2o.utils.typechecks import assert_is_type, is_type, numpy_ndarray, pandas_dataframe
+
+__all__ = ("load_mojo", "MojoModel", "GbmMojoModel", "DrfMojoModel", "GlmMojoModel")
+
+
+def load_mojo(path):
+    """
+    Load a MOJO model for scoring in Python.
+
+    :param path: MOJO zip file, or a directory with the content of the zip file.
+    :returns: a :class:`MojoModel` (:class:`GbmMojoModel`, :class:`DrfMojoModel` or :class:`GlmMojoModel`).
+    """
+    assert_is_type(path, str)
+    reader = _MojoReader(path)
+    algo = reader.info.get("algo")
+    if algo not in _MOJO_CLASSES:
+        raise H2OValueError("Scoring of %s MOJO models is not supported in Python (supported algos: %s)"
+                            % (algo, ", ".join(sorted(_MOJO_CLASSES))))
+    return _MOJO_CLASSES[algo](reader)
+
+
+
+class MojoModel(object):
+    """
+    Base class of the MOJO models, see :func:`load_mojo`.
+
+    Input data is given by column name; columns which the model doesn't use are ignored, and the missing ones (as well
+    as ``None``, ``"NA"`` and unknown categorical levels) are treated as missing values.
+    """
+
+    # Maximum number of rows scored together, so that the intermediate arrays stay small
+    BATCH_SIZE = 10000
+
+    def __init__(self, reader):
+        info = reader.info
+        self._info = info
+        self._names = reader.columns
+        self._domains = reader.domains
+        self._nfeatures = info["n_features"]
+        self._nclasses = info["n_classes"]
+        self._category = info["category"]
+        self._supervised = info["supervised"]
+        self._default_threshold = info.get("default_threshold", 0.5)
+        self._balance_classes = info.get("balance_classes", False)
+        self._prior_class_distrib = info.get("prior_class_distrib")
+        self._model_class_distrib = info.get("model_class_distrib")
+        self._levels = [None if d is None else {level: i for i, level in enumerate(d)}
+                        for d in self._domains[:self._nfeatures]]
+        self._features_levels = list(zip(range(self._nfeatures), self._names, self._levels))
+
+    @property
+    def names(self):
+        """Names of the columns used by the model (followed by the response column, for supervised models)."""
+        return list(self._names)
+
+    @property
+    def features(self):
+        """Names of the input columns of the model."""
+        return self._names[:self._nfeatures]
+
+    @property
+    def category(self):
+        """Model category, such as "Regression", "Binomial" or "Multinomial"."""
+        return self._category
+
+    @property
+    def response_domain(self):
+        """Class labels of a classification model, or None."""
+        return self._domains[-1] if self._supervised and self._nclasses > 1 else None
+
+    @property
+    def columns(self):
+        """Names of the columns of the predictions (the same as the header of PredictCsv output)."""
+        return ["predict"] + (self.response_domain or [])
+
+
+    def predict(self, data, use_pandas=True):
+        """
+        Score a batch of rows.
+
+        :param data: a pandas DataFrame, a dict of columns (name -> list or numpy array), or a list of rows (each a
+            dict of name -> value). A 2-dimensional numpy array is taken as already encoded by :meth:`encode`.
+        :param use_pandas: return the predictions as a pandas DataFrame (if pandas is available).
+        :returns: the predictions, with :attr:`columns`: ``predict`` (the predicted value or class label) and for
+            classification models the probabilities of the classes. If not returned as a DataFrame, then it is an
+            ordered dict of numpy arrays.
+        """
+        preds = self.score(self.encode(data))
+        columns = collections.OrderedDict()
+        domain = self.response_domain
+        if domain is None:
+            columns["predict"] = preds[:, 0]
+        else:
+            columns["predict"] = numpy.asarray(domain, dtype=object)[preds[:, 0].astype(numpy.int64)]
+            for i, label in enumerate(domain):
+                columns[label] = preds[:, i + 1]
+        if use_pandas and can_use_pandas():
+            import pandas
+            return pandas.DataFrame(columns, columns=list(columns))
+        return columns
+
+
+    def predict_row(self, row):
+        """
+        Score a single row.
+
+        :param dict row: mapping of column names to values.
+        :returns: an ordered dict with the values of :attr:`columns` for this row.
+        """
+        preds = self._score_row(self._encode_row(row))
+        domain = self.response_domain
+        if domain is None:
+            return collections.OrderedDict([("predict", preds[0])])
+        res = collections.OrderedDict([("predict", domain[int(preds[0])])])
+        for i, label in enumerate(domain):
+            res[label] = preds[i + 1]
+        return res
+
+
+    def encode(self, data):
+        """
+        Convert the input data into the numeric matrix scored by the model.
+
+        Columns are put into the order of :attr:`features`, and categorical levels are replaced with their indices in
+        the domain of the column.
+
+        :param data: see :meth:`predict`.
+        :returns: a 2-dimensional float numpy array with a row per input row, and a column per feature.
+        """
+        if is_type(data, numpy_ndarray):
+            x = numpy.asarray(data, dtype=numpy.float64)
+            if x.ndim != 2 or x.shape[1] != self._nfeatures:
+                raise H2OValueError("Expected an array of shape (nrows, %d), got %r" % (self._nfeatures, x.shape))
+            return x
+        if is_type(data, pandas_dataframe):
+            columns = {name: data[name].values for name in data.columns}
+            nrows = len(data)
+        elif isinstance(data, dict):
+            columns = data
+            nrows = len(next(iter(data.values()))) if data else 0
+        else:
+            assert_is_type(data, [dict])
+            columns = {name: [row.get(name) for row in data] for name in self.features}
+            nrows = len(data)
+        x = numpy.full((nrows, self._nfeatures), numpy.nan)
+        for j, name in enumerate(self.features):
+            if name not in columns: continue
+            levels = self._levels[j]
+            if levels is None:
+                x[:, j] = _to_numbers(columns[name], name)
+            else:
+                x[:, j] = [levels.get(_to_level(v), numpy.nan) for v in columns[name]]
+        return x
+
+
+    def score(self, x):
+        """
+        Score rows which were already encoded, see :meth:`encode`.
+
+        :param x: 2-dimensional numpy array of encoded rows.
+        :returns: numpy array with a row of predictions per input row, same as ``score0()`` of the Java model: for
+            classification models the index of the predicted class followed by the class probabilities, for
+            regression models the predicted value.
+        """
+        nrows = x.shape[0]
+        if nrows <= self.BATCH_SIZE:
+            return self._score(x)
+        return numpy.concatenate([self._score(x[i:i + self.BATCH_SIZE]) for i in range(0, nrows, self.BATCH_SIZE)])
+
+
+    def __repr__(self):
+        return "<%s %s, %d features>" % (type(self).__name__, self._category, self._nfeatures)
+
+
+    #-------------------------------------------------------------------------------------------------------------------
+    # Implementation
+    #-------------------------------------------------------------------------------------------------------------------
+
+    def _score(self, x):
+        raise NotImplementedError()
+
+    def _score_row(self, x):
+        return self._score(numpy.array([x], dtype=numpy.float64))[0]
+
+    def _encode_row(self, row):
+        x = [numpy.nan] * self._nfeatures
+        for j, name, levels in self._features_levels:
+            if name not in row: continue
+            if levels is None:
+                x[j] = _to_number(row[name], name)
+            else:
+                x[j] = levels.get(_to_level(row[name]), numpy.nan)
+        return x
+
+    def _finish_classification(self, preds, x):
+        """Correct the class probabilities for balanced classes, and fill in the predicted class."""
+        if self._balance_classes and self._prior_class_distrib and self._model_class_distrib:
+            prior = numpy.asarray(self._prior_class_distrib)
+            model = numpy.asarray(self._model_class_distrib)
+            ratio = numpy.where((prior != 0) & (model != 0), prior / numpy.where(model != 0, model, 1), 1)
+            probs = preds[:, 1:] * ratio
+            total = probs.sum(axis=1, keepdims=True)
+            preds[:, 1:] = numpy.where(total > 0, probs / numpy.where(total > 0, total, 1), probs)
+        if self._nclasses == 2:
+            preds[:, 0] = preds[:, 2] >= self._default_threshold
+        else:
+            # ties between the classes are resolved in favour of the first class (the Java model breaks them randomly)
+            preds[:, 0] = numpy.argmax(preds[:, 1:], axis=1)
+        return preds
+
+
+
+class _TreeModel(MojoModel):
+    """Common part of the tree ensembles (GBM and DRF): see ``SharedTreeMojoModel`` in h2o-genmodel."""
+
+    def __init__(self, reader):
+        super(_TreeModel, self).__init__(reader)
+        info = self._info
+        version = info["mojo_version"]
+        if version not in {1.0, 1.1, 1.2}:
+            raise H2OValueError("Unsupported version %s of the tree MOJO format" % version)
+        ntrees_per_class = info.get("n_trees_per_class")
+        if ntrees_per_class is None:
+            # mojos v1.0 don't have this information
+            bdt = info.get("binomial_double_trees")
+            ntrees_per_class = 1 if self._nclasses == 2 and not bdt else self._nclasses
+        self._ntree_groups = info["n_trees"]
+        self._ntrees_per_group = ntrees_per_class
+        trees = []
+        for i in range(ntrees_per_class):
+            k = 0 if self._nclasses == 1 else i + 1
+            for j in range(self._ntree_groups):
+                name = "trees/t%02d_%03d.bin" % (i, j)
+                if reader.exists(name):
+                    trees.append((k, reader.read(name)))
+        domain_sizes = [numpy.inf if d is None else len(d) for d in self._domains[:self._nfeatures]]
+        self._forest = _Forest(trees, version, self._nclasses, domain_sizes)
+
+    def _score_trees(self, x):
+        preds = numpy.zeros((x.shape[0], 1 if self._nclasses == 1 else self._nclasses + 1))
+        self._forest.score(x, preds)
+        return preds
+
+    def _score_row(self, x):
+        preds = numpy.zeros((1, 1 if self._nclasses == 1 else self._nclasses + 1))
+        self._forest.score_row(x, preds[0])
+        return self._unify_preds(preds, numpy.array([x]))[0]
+
+    def _score(self, x):
+        return self._unify_preds(self._score_trees(x), x)
+
+    def _unify_preds(self, preds, x):
+        raise NotImplementedError()
+
+
+
+class GbmMojoModel(_TreeModel):
+    """Gradient Boosting Machine MOJO model, see :func:`load_mojo`."""
+
+    def __init__(self, reader):
+        super(GbmMojoModel, self).__init__(reader)
+        self._distribution = self._info["distribution"]
+        self._init_f = self._info["init_f"]
+
+    def _unify_preds(self, preds, x):
+        distribution = self._distribution
+        if distribution in {"bernoulli", "modified_huber"}:
+            preds[:, 2] = 1 / (1 + numpy.exp(-(preds[:, 1] + self._init_f)))
+            preds[:, 1] = 1 - preds[:, 2]
+        elif distribution == "multinomial":
+            if self._nclasses == 2:  # 1-tree optimization for binomial
+                preds[:, 1] += self._init_f
+                preds[:, 2] = -preds[:, 1]
+            probs = numpy.exp(preds[:, 1:] - preds[:, 1:].max(axis=1, keepdims=True))
+            preds[:, 1:] = probs / probs.sum(axis=1, keepdims=True)
+        else:
+            f = preds[:, 0] + self._init_f
+            if distribution in {"poisson", "gamma", "tweedie"}:
+                f = numpy.minimum(1e19, numpy.exp(f))
+            preds[:, 0] = f
+            return preds
+        return self._finish_classification(preds, x)
+
+
+
+class DrfMojoModel(_TreeModel):
+    """Distributed Random Forest MOJO model, see :func:`load_mojo`."""
+
+    def _unify_preds(self, preds, x):
+        if self._nclasses == 1:
+            preds[:, 0] /= self._ntree_groups
+            return preds
+        if self._nclasses == 2 and not self._info.get("binomial_double_trees"):
+            preds[:, 1] /= self._ntree_groups
+            preds[:, 2] = 1 - preds[:, 1]
+        else:
+            total = preds[:, 1:].sum(axis=1, keepdims=True)
+            preds[:, 1:] = numpy.where(total > 0, preds[:, 1:] / numpy.where(total > 0, total, 1), preds[:, 1:])
+        return self._finish_classification(preds, x)
+
+
+
+class GlmMojoModel(MojoModel):
+    """Generalized Linear Model MOJO model, see :func:`load_mojo`."""
+
+    def __init__(self, reader):
+        super(GlmMojoModel, self).__init__(reader)
+        info = self._info
+        self._family = info["family"]
+        self._link = info.get("link")
+        self._tweedie_link_power = info.get("tweedie_link_power", 0.0)
+        self._use_all_factor_levels = info.get("use_all_factor_levels", False)
+        self._cats = info.get("cats", -1)
+        self._nums = info.get("nums", -1)
+        self._cat_offsets = numpy.asarray(info.get("cat_offsets") or [0], dtype=numpy.int64)
+        self._cat_modes = numpy.asarray(info.get("cat_modes") or [], dtype=numpy.float64)
+        self._num_means = numpy.asarray(info.get("num_means") or [], dtype=numpy.float64)
+        self._mean_imputation = info.get("mean_imputation", False)
+        beta = numpy.asarray(info["beta"], dtype=numpy.float64)
+        if self._family == "multinomial":
+            if len(beta) % self._nclasses:
+                raise H2OValueError("Incorrect coding of the GLM coefficients")
+            self._beta = beta.reshape(self._nclasses, -1).T
+        else:
+            self._beta = beta.reshape(-1, 1)
+            if self._link not in _GLM_LINK_INV:
+                raise H2OValueError("Unexpected link function %s" % self._link)
+
+    def _score(self, x):
+        cats, nums = self._cats, self._nums
+        if self._mean_imputation:
+            x = x.copy()
+            for i, mode in enumerate(self._cat_modes):
+                x[numpy.isnan(x[:, i]), i] = mode
+            for i, mean in enumerate(self._num_means):
+                x[numpy.isnan(x[:, cats + i]), cats + i] = mean
+        beta = self._beta
+        ncoefs = self._cat_offsets[cats]
+        eta = x[:, cats:cats + nums].dot(beta[ncoefs:ncoefs + nums]) + beta[-1]
+        for i in range(cats):
+            # level 0 of each factor is the reference level, unless all factor levels are used
+            level = x[:, i] - (0 if self._use_all_factor_levels else 1)
+            if numpy.isnan(level).any() or (level != numpy.floor(level)).any():
+                raise H2OValueError("Categorical value out of range in column %s" % self._names[i])
+            idx = level.astype(numpy.int64) + self._cat_offsets[i]
+            used = (level >= 0) & (idx < self._cat_offsets[i + 1])
+            eta += numpy.where(used[:, None], beta[numpy.where(used, idx, 0)], 0)
+        if self._family == "multinomial":
+            probs = numpy.exp(eta - numpy.maximum(eta.max(axis=1, keepdims=True), 0))
+            preds = numpy.empty((x.shape[0], self._nclasses + 1))
+            preds[:, 1:] = probs / probs.sum(axis=1, keepdims=True)
+            preds[:, 0] = numpy.argmax(preds[:, 1:], axis=1)
+            return preds
+        mu = _GLM_LINK_INV[self._link](eta[:, 0], self._tweedie_link_power)
+        if self._family != "binomial":
+            return mu.reshape(-1, 1)
+        return numpy.column_stack((mu >= self._default_threshold, 1 - mu, mu)).astype(numpy.float64)
+
+
+_GLM_LINK_INV = {
+    "identity": lambda eta, p: eta,
+    "logit": lambda eta, p: 1 / (numpy.exp(-eta) + 1),
+    "log": lambda eta, p: numpy.exp(eta),
+    "inverse": lambda eta, p: 1 / numpy.where(eta < 0, numpy.minimum(-1e-5, eta), numpy.maximum(1e-5, eta)),
+    "tweedie": lambda eta, p: numpy.maximum(2e-16, numpy.exp(eta)) if p == 0 else numpy.power(eta, 1 / p),
+}
+
+_MOJO_CLASSES = {"gbm": GbmMojoModel, "drf": DrfMojoModel, "glm": GlmMojoModel}
+
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+# Trees
+#-----------------------------------------------------------------------------------------------------------------------
+
+# Node kinds
+_NUMERIC, _BITSET, _NA_VS_REST, _LEAF = 0, 1, 2, 3
+
+# Values of NaSplitDir (see hex.genmodel.algos.tree.NaSplitDir)
+_NSD_NA_VS_REST, _NSD_NA_LEFT, _NSD_LEFT = 1, 2, 4
+
+
+class _Forest(object):
+    """
+    All the trees of a model, compiled into flat arrays with one element per node.
+
+    Every node has a kind, the column it splits on, the split threshold or a slice of a shared array of bitset bits,
+    the direction of the missing values, and the indices of its children. A leaf is a node whose children are the leaf
+    itself, so a batch of rows can be pushed down all the trees for as many steps as the depth of the deepest tree,
+    without having to track which rows have already reached a leaf.
+    """
+
+    def __init__(self, trees, version, nclasses, domain_sizes):
+        self.version = version
+        self.domain_sizes = numpy.asarray(domain_sizes, dtype=numpy.float64)
+        self.classes = numpy.array([k for k, _ in trees], dtype=numpy.int64)
+        nodes = []
+        bits = [b"\0"]
+        self.nbits_total = 8
+        self.roots = numpy.array([self._decode(tree, nclasses, nodes, bits) for _, tree in trees], dtype=numpy.int64)
+        self.depth = max([n[-1] for n in nodes] or [0])
+        columns = list(zip(*nodes)) or [()] * 11
+        self.kind = numpy.array(columns[0], dtype=numpy.int8)
+        self.col = numpy.array(columns[1], dtype=numpy.int64)
+        self.threshold = numpy.array(columns[2], dtype=numpy.float64)
+        self.na_right = numpy.array(columns[3], dtype=bool)
+        self.bitoff = numpy.array(columns[4], dtype=numpy.int64)
+        self.nbits = numpy.array(columns[5], dtype=numpy.int64)
+        self.bitstart = numpy.array(columns[6], dtype=numpy.int64)
+        self.left = numpy.array(columns[7], dtype=numpy.int64)
+        self.right = numpy.array(columns[8], dtype=numpy.int64)
+        self.value = numpy.array(columns[9], dtype=numpy.float64)
+        self.bits = numpy.unpackbits(numpy.frombuffer(b"".join(bits), dtype=numpy.uint8), bitorder="little") \
+                        .astype(bool)
+        # Plain lists for scoring single rows, where numpy's per-call overhead would dominate
+        self._lists = [a.tolist() for a in (self.kind, self.col, self.threshold, self.na_right, self.bitoff,
+                                            self.nbits, self.bitstart, self.left, self.right, self.value, self.bits)]
+        self._domain_sizes_list = self.domain_sizes.tolist()
+        self._tree_list = list(zip(self.classes.tolist(), self.roots.tolist()))
+        self._plain_numeric = ((self.kind == _NUMERIC) &
+                               ~numpy.isfinite(self.domain_sizes[self.col] if len(self.col) else [])).tolist()
+
+
+    def score(self, x, preds):
+        """Add the predictions of all trees for the rows ``x`` into ``preds`` (in the order of the Java model)."""
+        ntrees = len(self.roots)
+        if ntrees == 0 or x.shape[0] == 0: return
+        rows = numpy.arange(x.shape[0])[:, None]
+        pos = numpy.repeat(self.roots[None, :], x.shape[0], axis=0)
+        strict = self.version >= 1.1
+        for _ in range(self.depth):
+            col = self.col[pos]
+            v = x[rows, col]
+            nan = numpy.isnan(v)
+            iv = numpy.where(nan, 0, numpy.trunc(numpy.clip(v, -2147483648, 2147483647))).astype(numpy.int64)
+            kind = self.kind[pos]
+            off = iv - self.bitoff[pos]
+            in_range = (off >= 0) & (off < self.nbits[pos])
+            bit = self.bits[self.bitstart[pos] + numpy.where(in_range, off, 0)] & in_range
+            go_right = numpy.where(kind == _NUMERIC, v >= self.threshold[pos], bit) & (kind != _NA_VS_REST)
+            missing = nan
+            if strict:
+                missing = missing | ((kind == _BITSET) & ~in_range)
+            if self.version >= 1.2:
+                missing = missing | (iv >= self.domain_sizes[col])
+            go_right = numpy.where(missing, self.na_right[pos], go_right)
+            pos = numpy.where(go_right, self.right[pos], self.left[pos])
+        values = self.value[pos]
+        # sum the trees one by one (as the Java model does), so that the results are exactly the same
+        for k in numpy.unique(self.classes):
+            preds[:, k] += numpy.cumsum(values[:, self.classes == k], axis=1)[:, -1]
+
+
+    def score_row(self, row, preds):
+        """Add the predictions of all trees for a single row (a list of floats) into ``preds``."""
+        kinds, cols, thresholds, na_right, bitoffs, nbitss, bitstarts, lefts, rights, values, bits = self._lists
+        plain = self._plain_numeric
+        for k, node in self._tree_list:
+            kind = kinds[node]
+            while kind != _LEAF:
+                v = row[cols[node]]
+                if v != v:
+                    right = na_right[node]
+                elif plain[node]:
+                    right = v >= thresholds[node]
+                else:
+                    right = self._go_right_slow(node, v)
+                node = rights[node] if right else lefts[node]
+                kind = kinds[node]
+            preds[k] += values[node]
+
+    def _go_right_slow(self, node, v):
+        """Direction of a (non-missing) value at a bitset split, or at a split on a categorical column."""
+        kinds, cols, thresholds, na_right, bitoffs, nbitss, bitstarts, lefts, rights, values, bits = self._lists
+        iv = int(max(-2147483648, min(2147483647, v)))
+        kind = kinds[node]
+        if self.version >= 1.2 and iv >= self._domain_sizes_list[cols[node]]:
+            return na_right[node]
+        if kind == _NUMERIC:
+            return v >= thresholds[node]
+        if kind == _NA_VS_REST:
+            return False
+        off = iv - bitoffs[node]
+        if 0 <= off < nbitss[node]:
+            return bits[bitstarts[node] + off]
+        return na_right[node] if self.version >= 1.1 else False
+
+
+    def _decode(self, tree, nclasses, nodes, bits):
+        """
+        Decode a tree from its compressed binary form (see ``SharedTreeMojoModel.scoreTree()``), appending its nodes
+        to ``nodes`` and the bitsets to ``bits``. Returns the index of the root node.
+        """
+        if struct.unpack_from("<H", tree, 1)[0] == 65535:
+            # a tree which is a single leaf
+            return self._add_leaf(nodes, struct.unpack_from("<f", tree, 3)[0], 0)
+        root = len(nodes)
+        stack = [(None, None, 0, 0)]  # (parent node, its field to fill in with the index of the node, position, depth)
+        while stack:
+            parent, field, pos, depth = stack.pop()
+            if parent is not None:
+                parent[field] = len(nodes)
+            node_type = bytearray(tree[pos:pos + 1])[0]
+            col = struct.unpack_from("<H", tree, pos + 1)[0]
+            na_split_dir = bytearray(tree[pos + 3:pos + 4])[0]
+            pos += 4
+            na_vs_rest = na_split_dir == _NSD_NA_VS_REST
+            leftward = na_split_dir in {_NSD_NA_LEFT, _NSD_LEFT}
+            kind, threshold, bitoff, nbits, bitstart = _NUMERIC, 0.0, 0, 0, 0
+            equal = node_type & 12
+            if na_vs_rest:
+                kind = _NA_VS_REST
+            elif equal == 0:
+                threshold = struct.unpack_from("<f", tree, pos)[0]
+                pos += 4
+            else:
+                kind = _BITSET
+                if equal == 8:
+                    nbytes, nbits = 4, 32
+                elif self.version >= 1.2:
+                    bitoff, nbits = struct.unpack_from("<Hi", tree, pos)
+                    nbytes = ((nbits - 1) >> 3) + 1
+                    pos += 6
+                else:
+                    bitoff, nbytes = struct.unpack_from("<HH", tree, pos)
+                    nbits = nbytes << 3
+                    pos += 4
+                bitstart = self.nbits_total
+                bits.append(tree[pos:pos + nbytes])
+                self.nbits_total += nbytes << 3
+                pos += nbytes
+            lmask = node_type & 51
+            rmask = (node_type & 0xC0) >> 2
+            if lmask <= 3:
+                size_len = lmask + 1
+                left_size = struct.unpack_from("<I", tree[pos:pos + size_len] + b"\0" * (4 - size_len))[0]
+                left_pos = pos + size_len
+                right_pos = left_pos + left_size
+            else:
+                left_pos = pos
+                right_pos = pos + (4 if lmask == 48 else 1 if nclasses < 256 else 2)
+            node = [kind, col, threshold, not leftward, bitoff, nbits, bitstart, None, None, 0.0, depth + 1]
+            nodes.append(node)
+            for child, mask, child_pos in ((8, rmask, right_pos), (7, lmask, left_pos)):
+                if mask & 16:
+                    node[child] = self._add_leaf(nodes, struct.unpack_from("<f", tree, child_pos)[0], depth + 1)
+                else:
+                    stack.append((node, child, child_pos, depth + 1))
+        return root
+
+    @staticmethod
+    def _add_leaf(nodes, value, depth):
+        i = len(nodes)
+        nodes.append([_LEAF, 0, 0.0, False, 0, 0, 0, i, i, value, depth])
+        return i
+
+
+
+#-----------------------------------------------------------------------------------------------------------------------
+# Reading of the MOJO files
+#-----------------------------------------------------------------------------------------------------------------------
+
+class _MojoReader(object):
+    """Reader of the model.ini, domains and binary files of a MOJO (see ``ModelMojoReader`` in h2o-genmodel)."""
+
+    def __init__(self, path):
+        if os.path.isdir(path):
+            self._zip = None
+            self._dir = path
+        elif zipfile.is_zipfile(path):
+            self._zip = zipfile.ZipFile(path)
+            self._dir = None
+        else:
+            raise H2OValueError("File %s is not a MOJO" % path)
+        self.info, self.columns, domain_files = self._parse_model_info()
+        self.domains = [None] * len(self.columns)
+        for i, (n, filename) in domain_files.items():
+            if i >= len(self.columns): continue
+            domain = self.read_text("domains/" + filename)
+            if len(domain) != n:
+                raise H2OValueError("Not enough elements in the domain file %s" % filename)
+            self.domains[i] = domain
+
+    def exists(self, name):
+        if self._zip is None:
+            return os.path.exists(os.path.join(self._dir, name))
+        try:
+            self._zip.getinfo(name)
+            return True
+        except KeyError:
+            return False
+
+    def read(self, name):
+        if self._zip is None:
+            with open(os.path.join(self._dir, name), "rb") as f:
+                return f.read()
+        return self._zip.read(name)
+
+    def read_text(self, name):
+        return io.TextIOWrapper(io.BytesIO(self.read(name)), encoding="utf-8", newline=None).read().splitlines()
+
+    def _parse_model_info(self):
+        info = {}
+        columns = []
+        domains = {}
+        section = None
+        for line in self.read_text("model.ini"):
+            line = line.strip()
+            if not line or line.startswith("#"): continue
+            if line in {"[info]", "[columns]", "[domains]"}:
+                section = line
+            elif section == "[info]":
+                key, value = [s.strip() for s in line.split("=", 1)]
+                info[key] = value if key == "uuid" else _parse_value(value)
+            elif section == "[columns]":
+                columns.append(line)
+            elif section == "[domains]":
+                col, domain = line.split(":", 1)
+                n, filename = domain.strip().split(" ", 1)
+                domains[int(col)] = (int(n), filename)
+        if "algo" not in info:
+            raise H2OValueError("Unable to find information about the model's algorithm")
+        if len(columns) != info.get("n_columns"):
+            raise H2OValueError("Expected %s columns in the MOJO, found %d" % (info.get("n_columns"), len(columns)))
+        return info, columns, domains
+
+
+def _parse_value(s):
+    """Parse a value of model.ini, in the same way as ``ParseUtils.tryParse()``."""
+    if s == "null": return None
+    if s == "true": return True
+    if s == "false": return False
+    if s.startswith("[") and s.endswith("]"):
+        return [_parse_value(v.strip()) for v in s[1:-1].split(",")] if s != "[]" else []
+    for convert in (int, float):
+        try:
+            return convert(s)
+        except ValueError:
+            pass
+    return s
+
+
+def _to_level(v):
+    """Categorical level of an input value: numbers are converted as they would be written into a CSV file."""
+    if v is None: return None
+    if isinstance(v, float):
+        if v != v: return None
+        if v == int(v): return str(int(v))
+    return v if is_type(v, str) else str(v)
+
+
+def _to_number(v, name):
+    if isinstance(v, (float, int)): return float(v)
+    if v is None: return numpy.nan
+    if is_type(v, str):
+        v = v.strip()
+        if v in {"", "NA", "N/A", "-"}: return numpy.nan
+    try:
+        return float(v)
+    except (ValueError, TypeError):
+        raise H2OValueError("Unable to parse value %r from column %s as a number" % (v, name))
+
+
+def _to_numbers(values, name):
+    try:
+        return numpy.asarray(values, dtype=numpy.float64)
+    except (ValueError, TypeError):
+        return [_to_number(v, name) for v in values]
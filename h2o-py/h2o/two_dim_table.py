@@ -4,17 +4,23 @@ A two dimensional table having row and column headers.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import copy
-
 from h2o.display import H2ODisplay
 from h2o.exceptions import H2OValueError
 from h2o.utils.compatibility import *  # NOQA
-from h2o.utils.shared_utils import _is_list_of_lists, can_use_pandas
+from h2o.utils.shared_utils import can_use_numpy, can_use_pandas
 from h2o.utils.typechecks import I, assert_is_type, is_type
 
 
 class H2OTwoDimTable(object):
-    """A class representing an 2D table (for pretty printing output)."""
+    """
+    A class representing an 2D table (for pretty printing output).
+
+    The table is stored column-wise: tables received from the server are kept in their raw form until their contents
+    are first accessed, and then each numeric column is converted at once into a numpy array (if numpy is available,
+    and the column has no missing values) or into a list. The rows of the table (``cell_values``) are built from the
+    columns only when requested; from then on the rows are the contents of the table (as they may be modified in
+    place), and the columns are derived from them.
+    """
 
     def __init__(self, table_header=None, table_description=None, col_header=None,
                  cell_values=None, raw_cell_values=None, col_types=None, row_header=None, col_formats=None):
@@ -25,8 +31,8 @@ class H2OTwoDimTable(object):
         :param table_description: Longer description of the table.
         :param col_header: list of column names (used in conjunction with)
         :param cell_values: table values, as an array of individual rows
-        :param raw_cell_values:
-        :param col_types:
+        :param raw_cell_values: table values as received from the server, as an array of columns
+        :param col_types: types of the columns in raw_cell_values
         :param row_header: ignored.
         :param col_formats: ignored.
         """
@@ -38,7 +44,17 @@ class H2OTwoDimTable(object):
         self._table_header = table_header
         self._table_description = table_description
         self._col_header = col_header
-        self._cell_values = cell_values or self._parse_values(raw_cell_values, col_types)
+        self._col_types = col_types or []
+        self._raw_cell_values = None
+        self._columns = None
+        self._rows = cell_values or None
+        if self._rows is None:
+            self._raw_cell_values = raw_cell_values or []
+            if self._col_header and self._col_header[0] is None:
+                # The first column holds the row headers, which are not shown
+                self._col_header = self._col_header[1:]
+                self._col_types = self._col_types[1:]
+                self._raw_cell_values = self._raw_cell_values[1:]
 
 
     @staticmethod
@@ -65,7 +81,13 @@ class H2OTwoDimTable(object):
     @property
     def cell_values(self):
         """The contents of the table, as a list of rows."""
-        return self._cell_values
+        if self._rows is None:
+            self._rows = self._row_slice(0, None)
+            self._columns = None
+        return self._rows
+
+    # Older code (and tests) access the rows directly
+    _cell_values = cell_values
 
 
     @property
@@ -79,32 +101,34 @@ class H2OTwoDimTable(object):
         if can_use_pandas():
             import pandas
             pandas.options.display.max_colwidth = 70
-            return pandas.DataFrame(self._cell_values, columns=self._col_header)
+            columns = self._get_columns()
+            if not columns or not len(columns[0]):
+                return pandas.DataFrame(self.cell_values, columns=self._col_header)
+            # The numpy columns are passed to pandas without copying them
+            df = pandas.DataFrame(dict(enumerate(columns)), copy=False)
+            if self._col_header is not None: df.columns = self._col_header
+            return df
         return self
 
 
     def show(self, header=True):
         """Print the contents of this table."""
-        # if h2o.can_use_pandas():
-        #  import pandas
-        #  pandas.options.display.max_rows = 20
-        #  print pandas.DataFrame(self._cell_values,columns=self._col_header)
-        #  return
         if header and self._table_header:
             print(self._table_header + ":", end=' ')
             if self._table_description: print(self._table_description)
         print()
-        table = copy.deepcopy(self._cell_values)
-        nr = 0
-        if _is_list_of_lists(table): nr = len(
-            table)  # only set if we truly have multiple rows... not just one long row :)
-        if nr > 20:  # create a truncated view of the table, first/last 5 rows
-            trunc_table = []
-            trunc_table += [v for v in table[:5]]
-            trunc_table.append(["---"] * len(table[0]))
-            trunc_table += [v for v in table[(nr - 5):]]
-            table = trunc_table
-
+        if self._rows is not None:
+            table = self._rows
+            nr = len(table)
+            if nr > 20:  # create a truncated view of the table, first/last 5 rows
+                table = table[:5] + [["---"] * len(table[0])] + table[(nr - 5):]
+        else:
+            columns = self._get_columns()
+            nr = len(columns[0]) if columns else 0
+            if nr > 20:
+                table = self._row_slice(0, 5) + [["---"] * len(columns)] + self._row_slice(nr - 5, None)
+            else:
+                table = self.cell_values
         H2ODisplay(table, self._col_header, numalign="left", stralign="left")
         if nr > 20 and can_use_pandas(): print('\nSee the whole table with table.as_data_frame()')
 
@@ -115,22 +139,22 @@ class H2OTwoDimTable(object):
         return ""
 
 
-    def _parse_values(self, values, types):
-        if self._col_header[0] is None:
-            self._col_header = self._col_header[1:]
-            types = types[1:]
-            values = values[1:]
-        for col_index, column in enumerate(values):
-            for row_index, row_value in enumerate(column):
-                if types[col_index] == 'integer':
-                    values[col_index][row_index] = "" if row_value is None else int(float(row_value))
+    def _get_columns(self):
+        """The columns of the table, parsed on first use (or taken from the rows, if these were built already)."""
+        if self._rows is not None:
+            # Not cached, the rows may have been modified since
+            return [list(col) for col in zip(*self._rows)] if self._rows else [[] for _ in (self._col_header or [])]
+        if self._columns is None:
+            use_numpy = can_use_numpy()
+            self._columns = [_parse_column(values, ctype, use_numpy)
+                             for values, ctype in zip(self._raw_cell_values, self._col_types)]
+            self._raw_cell_values = None
+        return self._columns
 
-                elif types[col_index] in ['double', 'float', 'long']:
-                    values[col_index][row_index] = "" if row_value is None else float(row_value)
 
-                else:  # string?
-                    continue
-        return list(zip(*values))  # transpose the values! <3 splat ops
+    def _row_slice(self, start, stop):
+        """Rows ``start:stop`` of the table, as a list of tuples of python values."""
+        return list(zip(*[_to_list(col[start:stop]) for col in self._get_columns()]))
 
 
     def __getitem__(self, item):
@@ -146,11 +170,16 @@ class H2OTwoDimTable(object):
                     index = self._col_header.index(item)
                 else:
                     raise H2OValueError("Column `%s` does not exist in the table" % item)
-            return [row[index] for row in self._cell_values]
+            if self._rows is not None:
+                return [row[index] for row in self._rows]
+            return _to_list(self._get_columns()[index])
         elif isinstance(item, slice):
             # row selection if item is slice returns H2OTwoDimTable
             # FIXME! slice behavior should be consistent with other selectors - return columns instead of rows...
-            self._cell_values = [self._cell_values[ii] for ii in range(*item.indices(len(self._cell_values)))]
+            if self._rows is not None:
+                self._rows = self._rows[item]
+            else:
+                self._columns = [col[item] for col in self._get_columns()]
             return self
         elif is_type(item, [int, str]):
             # multiple col selection returns list of cols
@@ -161,11 +190,42 @@ class H2OTwoDimTable(object):
 
     def __setitem__(self, key, value):
         # This is not tested, and probably not used anywhere... That's why it's so horrible.
-        cols = list(zip(*self._cell_values))
+        cols = [_to_list(col) for col in self._get_columns()]
         if len(cols[0]) != len(value): raise ValueError('value must be same length as columns')
         if key not in self._col_header:
             self._col_header.append(key)
-            cols.append(tuple(value))
+            cols.append(list(value))
         else:
-            cols[self._col_header.index(key)] = value
-        self._cell_values = [list(x) for x in zip(*cols)]
+            cols[self._col_header.index(key)] = list(value)
+        self._rows = [list(x) for x in zip(*cols)]
+        self._columns = None
+
+
+
+def _parse_column(values, ctype, use_numpy):
+    """
+    Convert a column of raw values from the server into a numpy array or a list, depending on its type.
+
+    Missing values of numeric columns become empty strings, so columns with missing values are kept as lists.
+    """
+    if ctype == "integer":
+        convert = lambda v: int(float(v))
+    elif ctype in {"double", "float", "long"}:
+        convert = float
+    else:  # string?
+        return values
+    if use_numpy and values and None not in values:
+        import numpy
+        try:
+            arr = numpy.array(values, dtype=numpy.float64)
+        except (TypeError, ValueError):
+            arr = None
+        if arr is not None and ctype != "integer":
+            return arr
+        if arr is not None and numpy.isfinite(arr).all():
+            return arr.astype(numpy.int64)
+    return ["" if v is None else convert(v) for v in values]
+
+
+def _to_list(col):
+    return col.tolist() if hasattr(col, "tolist") else list(col)
@@ -16,7 +16,7 @@ from types import FunctionType, GeneratorType, MethodType
 import colorama
 from h2o.utils.compatibility import *  # NOQA
 from h2o.utils.shared_utils import clamp
-from h2o.utils.typechecks import assert_is_type, is_type, numeric
+from h2o.utils.typechecks import assert_is_type, is_type, numeric, trusted
 
 
 class ProgressBar(object):
@@ -137,7 +137,8 @@ class ProgressBar(object):
 
         :param progress_fn: the executor function (or a generator). This function should take no arguments
             and return either a single number -- the current progress level, or a tuple (progress level, delay),
-            where delay is the time interval for when the progress should be checked again. This function may at
+            where delay is the time interval for when the progress should be checked again (0 means right away, which
+            is suitable for functions that block until there is some progress to report). This function may at
             any point raise the ``StopIteration(message)`` exception, which will interrupt the progress bar,
             display the ``message`` in red font, and then re-raise the exception.
         :raises StopIteration: if the job is interrupted. The reason for interruption is provided in the exception's
@@ -180,7 +181,8 @@ class ProgressBar(object):
                 if progress == 1 and self._get_real_progress() >= 1:
                     # Do not exit until both the model and the actual progress reach 100% mark.
                     break
-                result = self._widget.render(progress)
+                with trusted():  # the widgets are rendered on every tick, with arguments computed here
+                    result = self._widget.render(progress)
                 assert_is_type(result, RenderResult)
                 time0 = result.next_time
                 time1 = self._get_time_at_progress(result.next_progress)
@@ -228,6 +230,10 @@ class ProgressBar(object):
         raw_progress = clamp(raw_progress, 0, self._maxval)
         self._progress_data.append((now, raw_progress))
 
+        if delay == 0:
+            # The progress function does its own waiting, so there's no need to throttle it.
+            self._next_poll_time = now
+            return
         if delay < 0:
             # calculation of ``_guess_next_poll_interval()`` should be done only *after* we pushed the fresh data to
             # ``self._progress_data``.
@@ -9,11 +9,15 @@ This file INTENTIONALLY has NO module dependencies!
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import collections
 import imp
 import itertools
+import json
 import os
 import re
+import struct
 import sys
+import threading
 import zipfile
 import io
 
@@ -164,6 +168,184 @@ def _handle_pandas_data_frame(python_obj, header):
     data = _handle_python_lists(python_obj.as_matrix().tolist(), -1)[1]
     return list(python_obj.columns), data
 
+def _columnar_to_pandas(buf):
+    """Convert frame data downloaded in the columnar binary format into a pandas DataFrame."""
+    import pandas
+    columns = _columnar_to_numpy(buf)
+    return pandas.DataFrame(columns, columns=list(columns))
+
+
+def _columnar_to_numpy(buf):
+    """
+    Convert frame data downloaded in the columnar binary format into an ordered dict of numpy arrays (one per column).
+
+    The format is produced by ``ColumnarFrameWriter`` on the backend: a ``b"H2OC"`` magic, int32 header length,
+    JSON header with the number of rows and column descriptions, and then the data of each column in turn. Real
+    columns are float64 and integer (and time) columns int64 with an NA bitmap, both wrapped with zero copying; enum
+    and string columns are converted with a single pass over their values.
+
+    The types of the columns mimic ``pandas.read_csv()`` on the CSV download: integer columns become int64, or
+    float64 if they have missing values (so then values beyond 2**53 are rounded). The values differ from
+    ``read_csv()`` in a few cases though: empty strings are kept as ``""`` rather than read as NaN, and strings or enum
+    levels such as "NA" or "null" are kept as they are; enum levels become numbers only if all of them are numeric.
+    """
+    import numpy
+    if buf[:4] != b"H2OC":
+        raise H2OValueError("Frame data is not in the columnar format")
+    header_len = struct.unpack_from("<i", buf, 4)[0]
+    header = json.loads(buf[8:8 + header_len].decode("utf-8"))
+    nrows = header["nrows"]
+    pos = 8 + header_len
+    columns = collections.OrderedDict()
+    for col in header["columns"]:
+        ctype = col["type"]
+        if ctype == "real":
+            values = numpy.frombuffer(buf, dtype="<f8", count=nrows, offset=pos)
+            pos += 8 * nrows
+        elif ctype in {"int", "time"}:
+            values = numpy.frombuffer(buf, dtype="<i8", count=nrows, offset=pos)
+            pos += 8 * nrows
+            bitmap = numpy.frombuffer(buf, dtype=numpy.uint8, count=(nrows + 7) // 8, offset=pos)
+            rows = numpy.arange(nrows)
+            nas = (bitmap[rows >> 3] >> (rows & 7) & 1).astype(bool)
+            pos += (nrows + 7) // 8
+            # Mimic pandas.read_csv(): integer columns with missing values become float64
+            if nas.any():
+                values = values.astype(numpy.float64)
+                values[nas] = numpy.nan
+        elif ctype == "enum":
+            codes = numpy.frombuffer(buf, dtype="<i4", count=nrows, offset=pos)
+            pos += 4 * nrows
+            levels = _enum_levels(col["domain"])
+            values = levels[codes]  # code -1 (NA) picks the trailing NaN level
+            if levels.dtype == numpy.float64 and col["domain"] and not numpy.isnan(values).any() and \
+                    all(float(v).is_integer() for v in levels[:-1]):
+                values = values.astype(numpy.int64)
+        else:
+            lengths = numpy.frombuffer(buf, dtype="<i4", count=nrows, offset=pos)
+            pos += 4 * nrows
+            ends = pos + numpy.cumsum(numpy.maximum(lengths, 0))
+            starts = ends - numpy.maximum(lengths, 0)
+            values = numpy.array([buf[a:b].decode("utf-8") if n >= 0 else float("nan")
+                                  for a, b, n in zip(starts.tolist(), ends.tolist(), lengths.tolist())], dtype=object)
+            pos = int(ends[-1]) if nrows else pos
+        columns[col["name"]] = values
+    return columns
+
+
+def _enum_levels(domain):
+    """Array of enum levels followed by a NaN (for missing values); numeric-looking levels are converted to numbers."""
+    import numpy
+    try:
+        return numpy.array([float(d) for d in domain] + [float("nan")], dtype=numpy.float64)
+    except ValueError:
+        return numpy.array(list(domain) + [float("nan")], dtype=object)
+
+
+def _prefetching_map(fn, items):
+    """
+    Lazily map `fn` over `items`, computing the next result on a background thread while the current one is consumed.
+
+    At most one call to `fn` runs ahead of the consumer, so memory usage stays bounded by two results. Exceptions
+    raised by `fn` are re-raised in the consumer's thread when the corresponding result is requested.
+    """
+    def run(item, slot):
+        try:
+            slot["value"] = fn(item)
+        except BaseException as e:
+            slot["error"] = e
+
+    def start(item):
+        slot = {}
+        thread = threading.Thread(target=run, args=(item, slot))
+        thread.daemon = True
+        thread.start()
+        return thread, slot
+
+    def result(pending):
+        thread, slot = pending
+        thread.join()
+        if "error" in slot: raise slot["error"]
+        return slot["value"]
+
+    pending = None
+    for item in items:
+        ahead = start(item)
+        if pending is not None:
+            yield result(pending)
+        pending = ahead
+    if pending is not None:
+        yield result(pending)
+
+
+def _parallel_map(fn, items, nthreads=8):
+    """
+    Map `fn` over `items` on up to `nthreads` threads, and return the list of results (in the order of `items`).
+
+    Once any call fails, no more calls are started, and the exception is re-raised in the caller's thread.
+    """
+    items = list(items)
+    if len(items) <= 1 or nthreads <= 1:
+        return [fn(item) for item in items]
+    results = [None] * len(items)
+    errors = []
+    pending = collections.deque(enumerate(items))
+
+    def run():
+        while not errors:
+            try:
+                i, item = pending.popleft()
+            except IndexError:
+                return
+            try:
+                results[i] = fn(item)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(min(nthreads, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors: raise errors[0]
+    return results
+
+
+def _pandas_column_types(df):
+    """H2O column types matching the dtypes of a pandas DataFrame's columns (None where H2O should guess the type)."""
+    types = []
+    for dtype in df.dtypes:
+        if str(dtype) == "category" or dtype.kind == "b":
+            types.append("enum")
+        elif dtype.kind in "iuf":
+            types.append("numeric")
+        elif dtype.kind == "M":
+            types.append("time")
+        else:
+            types.append(None)
+    return types
+
+
+def _pandas_csv_chunks(df, column_names, compress=False, batch_rows=100000):
+    """
+    Generate the CSV representation of a pandas DataFrame, as a sequence of byte chunks.
+
+    Each batch of `batch_rows` rows is formatted by pandas' vectorized CSV writer, so the DataFrame is never converted
+    into Python objects cell by cell, and only one batch of text is held in memory at a time.
+
+    :param compress: if True, then the output will be gzip-compressed.
+    """
+    import zlib
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None  # gzip container
+    for start in range(0, max(len(df), 1), batch_rows):
+        text = df.iloc[start:start + batch_rows].to_csv(header=column_names if start == 0 else False, index=False)
+        chunk = text.encode("utf-8")
+        yield compressor.compress(chunk) if compressor else chunk
+    if compressor:
+        yield compressor.flush()
+
+
 def _handle_python_dicts(python_obj, check_header):
     header = list(python_obj.keys())
     is_valid = all(re.match(r"^[a-zA-Z_][a-zA-Z0-9_.]*$", col) for col in header)  # is this a valid header?
@@ -379,6 +561,38 @@ def deprecated(message):
     return deprecated_decorator
 
 
+def lazy_attributes(module_name, attributes, submodules=()):
+    """
+    Make the attributes of a module load on first access, to keep ``import h2o`` fast.
+
+    The returned function should be assigned to the module's ``__getattr__`` (PEP 562). On Python versions without
+    module-level ``__getattr__`` (before 3.7), all the attributes are imported right away instead.
+
+    :param module_name: name of the module (its ``__name__``).
+    :param attributes: dictionary attribute name => name of the module that defines it; relative module names are
+        resolved from the package of ``module_name``.
+    :param submodules: names of submodules of ``module_name`` that should be available as its attributes.
+    :returns: the ``__getattr__`` function for the module.
+    """
+    import importlib
+    package = module_name if hasattr(sys.modules[module_name], "__path__") else module_name.rpartition(".")[0]
+
+    def __getattr__(name):
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+        elif name in submodules:
+            value = importlib.import_module("." + name, module_name)
+        else:
+            raise AttributeError("module %r has no attribute %r" % (module_name, name))
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    if sys.version_info < (3, 7):
+        for attr in itertools.chain(attributes, submodules):
+            __getattr__(attr)
+    return __getattr__
+
+
 class InMemoryZipArch(object):
     def __init__(self, file_name = None, compression = zipfile.ZIP_DEFLATED):
         self._data = io.BytesIO()
@@ -95,6 +95,11 @@ As you have noticed, we define a number of special classes to facilitate type co
     # An enum. This is similar to a mere union of strings, except that we match case-insensitively
     Enum("case1", "case2", ...)
 
+Each type specification is compiled into a checker function the first time it is used, and the checker is cached, so
+that checking against the same specification again is fast. Specifications containing list / set / dict literals or
+lambda functions are compiled anew on every call (which is still faster than interpreting them). Internal code that
+knows its arguments to be valid can skip the checks altogether with ``with trusted(): ...``.
+
 
 :copyright: (c) 2016 H2O.ai
 :license:   Apache License Version 2.0 (see LICENSE for details)
@@ -105,7 +110,9 @@ import importlib
 import io
 import re
 import sys
+import threading
 import tokenize
+from contextlib import contextmanager
 from types import BuiltinFunctionType, FunctionType
 
 from h2o.exceptions import H2OTypeError, H2OValueError
@@ -114,7 +121,7 @@ from h2o.utils.compatibility import PY2, viewitems
 
 __all__ = ("U", "I", "NOT", "Tuple", "Dict", "MagicType", "BoundInt", "BoundNumeric", "Enum",
            "numeric", "h2oframe", "pandas_dataframe", "numpy_ndarray", "scipy_sparse",
-           "assert_is_type", "assert_matches", "assert_satisfies", "is_type")
+           "assert_is_type", "assert_matches", "assert_satisfies", "is_type", "trusted")
 
 
 if PY2:
@@ -140,7 +147,7 @@ def is_type(var, *args):
     This function is similar to :func:`assert_is_type`, however instead of raising an error when the variable does not
     match the provided type, it merely returns False.
     """
-    return _check_type(var, U(*args))
+    return _get_checker(args)(var)
 
 
 #-----------------------------------------------------------------------------------------------------------------------
@@ -150,6 +157,8 @@ def is_type(var, *args):
 class MagicType(object):
     """Abstract "special" type."""
 
+    _hash = None
+
     def check(self, var):
         """Return True if the variable matches this type, and False otherwise."""
 
@@ -157,6 +166,27 @@ class MagicType(object):
         """Return string representing the name of this type."""
         return "<%s>" % self.__class__.__name__
 
+    def _signature(self):
+        """
+        Return the values that define this type.
+
+        Types of the same class with equal signatures are equal, so that a type constructed anew on every call (such as
+        ``Enum("a", "b")`` in a property setter) finds its compiled checker in the cache. By default types are only
+        equal to themselves.
+        """
+        return id(self)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._signature() == other._signature()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((type(self), self._signature()))
+        return self._hash
+
 
 class U(MagicType):
     """
@@ -187,6 +217,9 @@ class U(MagicType):
         else:
             return " | ".join(res)
 
+    def _signature(self):
+        return self._types
+
 
 class I(MagicType):
     """
@@ -210,6 +243,9 @@ class I(MagicType):
         """Return string representing the name of this type."""
         return " & ".join(_get_type_name(tt, src) for tt in self._types)
 
+    def _signature(self):
+        return self._types
+
 
 class NOT(MagicType):
     """
@@ -234,6 +270,9 @@ class NOT(MagicType):
         else:
             return "!" + _get_type_name(self._types[0], src)
 
+    def _signature(self):
+        return self._types
+
 
 class Tuple(MagicType):
     """Tuple of arbitrary length and having elements of same type(s)."""
@@ -251,6 +290,9 @@ class Tuple(MagicType):
         """Return string representing the name of this type."""
         return "(*%s)" % _get_type_name(self._element_type, src)
 
+    def _signature(self):
+        return self._element_type
+
 
 class Dict(MagicType):
     """
@@ -285,6 +327,9 @@ class Dict(MagicType):
         return "{%s}" % ", ".join("%s: %s" % (key, _get_type_name(ktype, src))
                                   for key, ktype in viewitems(self._types))
 
+    def _signature(self):
+        return tuple(sorted(viewitems(self._types), key=lambda kv: kv[0]))
+
 
 class BoundInt(MagicType):
     """Integer type bounded from below/above."""
@@ -319,6 +364,9 @@ class BoundInt(MagicType):
             return "int≤%d" % self._upper_bound
         return "int[%d…%d]" % (self._lower_bound, self._upper_bound)
 
+    def _signature(self):
+        return self._lower_bound, self._upper_bound
+
 
 class BoundNumeric(MagicType):
     """Numeric type bounded from below/above."""
@@ -346,6 +394,9 @@ class BoundNumeric(MagicType):
         if self._lower_bound is None: return "numeric≤%d" % self._upper_bound
         return "numeric[%d…%d]" % (self._lower_bound, self._upper_bound)
 
+    def _signature(self):
+        return self._lower_bound, self._upper_bound
+
 
 class _LazyClass(MagicType):
     """
@@ -398,17 +449,27 @@ class Enum(MagicType):
 
     def __init__(self, *consts):
         """Initialize the Enum."""
-        self._consts = set(_enum_mangle(c) for c in consts)
+        self._values = consts
+        self._consts_set = None  # mangled constants, computed on first use
+
+    @property
+    def _consts(self):
+        if self._consts_set is None:
+            self._consts_set = set(_enum_mangle(c) for c in self._values)
+        return self._consts_set
 
     def check(self, var):
         """Check whether the provided value is a valid enum constant."""
         if not isinstance(var, _str_type): return False
-        return _enum_mangle(var) in self._consts
+        return var in self._values or _enum_mangle(var) in self._consts
 
     def name(self, src=None):
         """Return string representing the name of this type."""
         return "Enum[%s]" % ", ".join('"%s"' % c for c in self._consts)
 
+    def _signature(self):
+        return self._values
+
 
 
 numeric = U(int, float)
@@ -442,10 +503,10 @@ def assert_is_type(var, *types, **kwargs):
     :raises H2OTypeError: if the argument is not of the desired type.
     """
     assert types, "The list of expected types was not provided"
-    expected_type = types[0] if len(types) == 1 else U(*types)
-    if _check_type(var, expected_type): return
+    if _trusted.depth or _get_checker(types)(var): return
 
     # Type check failed => Create a nice error message
+    expected_type = types[0] if len(types) == 1 else U(*types)
     assert set(kwargs).issubset({"message", "skip_frames"}), "Unexpected keyword arguments: %r" % kwargs
     message = kwargs.get("message", None)
     skip_frames = kwargs.get("skip_frames", 1)
@@ -458,6 +519,26 @@ def assert_is_type(var, *types, **kwargs):
 
 
 
+@contextmanager
+def trusted():
+    """
+    Skip the checks of :func:`assert_is_type` in the current thread while in this context.
+
+    This is meant for internal code calling functions with arguments that are known to be valid, in places where the
+    checks are too costly (for example on every tick of a progress bar)::
+
+        with trusted():
+            result = widget.render(progress)
+
+    :func:`is_type` is not affected.
+    """
+    _trusted.depth += 1
+    try:
+        yield
+    finally:
+        _trusted.depth -= 1
+
+
 def assert_matches(v, regex):
     """
     Assert that string variable matches the provided regular expression.
@@ -567,40 +648,165 @@ def _check_type(var, vtype):
     :param var: variable to check
     :param vtype: expected variable's type
     """
-    if vtype is None:
-        return var is None
-    if isinstance(vtype, _primitive_type):
-        return var == vtype
-    if vtype is str:
-        return isinstance(var, _str_type)
-    if vtype is int:
-        return isinstance(var, _int_type)
-    if vtype is numeric:
-        return isinstance(var, _num_type)
-    if isinstance(vtype, MagicType):
-        return vtype.check(var)
-    if isinstance(vtype, type):
-        # ``vtype`` is a name of the class, or a built-in type such as "list", "tuple", etc
-        return isinstance(var, vtype)
-    if isinstance(vtype, list):
-        # ``vtype`` is a list literal
-        elem_type = U(*vtype)
-        return isinstance(var, list) and all(_check_type(item, elem_type) for item in var)
-    if isinstance(vtype, set):
-        # ``vtype`` is a set literal
-        elem_type = U(*vtype)
-        return isinstance(var, set) and all(_check_type(item, elem_type) for item in var)
-    if isinstance(vtype, tuple):
-        # ``vtype`` is a tuple literal
-        return (isinstance(var, tuple) and len(vtype) == len(var) and
-                all(_check_type(var[i], vtype[i]) for i in range(len(vtype))))
-    if isinstance(vtype, dict):
-        # ``vtype`` is a dict literal
-        ttkv = U(*viewitems(vtype))
-        return isinstance(var, dict) and all(_check_type(kv, ttkv) for kv in viewitems(var))
-    if isinstance(vtype, (FunctionType, BuiltinFunctionType)):
-        return vtype(var)
-    raise RuntimeError("Ivalid type %r in _check_type()" % vtype)
+    return _get_checker((vtype, ))(var)
+
+
+class _TrustedState(threading.local):
+    depth = 0  # number of nested trusted() contexts in the current thread
+
+_trusted = _TrustedState()
+
+# Cache of compiled checkers: tuple of type specifications => checker function
+_checkers = {}
+_MAX_CACHED_CHECKERS = 1000
+
+
+def _get_checker(types):
+    """Return a function checking whether a variable matches any of the ``types``."""
+    try:
+        checker = _checkers.get(types)
+    except TypeError:
+        checker = None
+    return checker or _compile_cached(types)[0]
+
+
+def _compile_cached(types):
+    """
+    Compile the union of ``types``, or find it in the cache.
+
+    Checkers are cached by the tuple of types, unless it cannot be hashed (it contains a list, set or dict literal) or
+    it contains functions (lambdas are typically created anew on every call, so caching them would only fill the cache).
+
+    :returns: tuple (checker, cacheable).
+    """
+    try:
+        checker = _checkers.get(types)
+    except TypeError:
+        return _compile_union(types)
+    if checker is not None:
+        return checker, True
+    checker, cacheable = _compile_union(types)
+    if cacheable:
+        if len(_checkers) >= _MAX_CACHED_CHECKERS:
+            _checkers.clear()
+        _checkers[types] = checker
+    return checker, cacheable
+
+
+def _always_true(var):
+    return True
+
+
+def _compile_union(types):
+    """
+    Compile the union of ``types`` into a checker function.
+
+    Classes are merged into a single ``isinstance()`` test, and literals into a single ``in`` test.
+
+    :returns: tuple (checker, cacheable), where cacheable is False if the types contain any functions.
+    """
+    classes = []
+    literals = []
+    checkers = []
+    accept_none = False
+    cacheable = True
+    i = 0
+    while i < len(types):
+        vtype = types[i]
+        i += 1
+        if isinstance(vtype, type):
+            if vtype is str:
+                classes.extend(_str_types)
+            elif vtype is int:
+                classes.extend(_int_types)
+            elif vtype is object:
+                return _always_true, cacheable
+            else:
+                classes.append(vtype)
+        elif vtype is None:
+            accept_none = True
+        elif vtype is numeric:
+            classes.extend(_num_type)
+        elif type(vtype) is U:
+            types = types + vtype._types
+        elif isinstance(vtype, MagicType):
+            checker, ok = _compile_magic(vtype)
+            checkers.append(checker)
+            cacheable = cacheable and ok
+        elif isinstance(vtype, _primitive_type):
+            literals.append(vtype)
+        elif isinstance(vtype, (list, set)):
+            checkers.append(_compile_collection(type(vtype), tuple(vtype)))
+        elif isinstance(vtype, tuple):
+            checker, ok = _compile_tuple(vtype)
+            checkers.append(checker)
+            cacheable = cacheable and ok
+        elif isinstance(vtype, dict):
+            checkers.append(_compile_dict(vtype))
+        elif isinstance(vtype, FunctionType):
+            checkers.append(vtype)
+            cacheable = False
+        elif isinstance(vtype, BuiltinFunctionType):
+            checkers.append(vtype)
+        else:
+            raise RuntimeError("Ivalid type %r in _check_type()" % vtype)
+
+    classes = tuple(classes)
+    if not literals and not checkers:
+        if accept_none:
+            return (lambda var: var is None or isinstance(var, classes)), cacheable
+        return (lambda var: isinstance(var, classes)), cacheable
+    if not classes and not literals and not accept_none and len(checkers) == 1:
+        return checkers[0], cacheable
+
+    literals = tuple(literals)
+    checkers = tuple(checkers)
+
+    def check_union(var):
+        return ((var is None and accept_none) or isinstance(var, classes) or (literals and var in literals) or
+                any(checker(var) for checker in checkers))
+    return check_union, cacheable
+
+
+def _compile_magic(vtype):
+    """Compile a :class:`MagicType`, returning tuple (checker, cacheable)."""
+    if type(vtype) is I:
+        compiled = [_compile_cached((t, )) for t in vtype._types]
+        checkers = tuple(c for c, _ in compiled)
+        return (lambda var: all(checker(var) for checker in checkers)), all(ok for _, ok in compiled)
+    if type(vtype) is NOT:
+        checker, ok = _compile_cached(vtype._types)
+        return (lambda var: not checker(var)), ok
+    if type(vtype) is Tuple:
+        checker, ok = _compile_cached((vtype._element_type, ))
+        return (lambda var: isinstance(var, tuple) and all(map(checker, var))), ok
+    return vtype.check, True
+
+
+def _compile_collection(ctype, elem_types):
+    """Checker for a list or set literal: a ``ctype`` instance whose elements match any of ``elem_types``."""
+    checker = _get_checker(elem_types)
+    return lambda var: isinstance(var, ctype) and all(map(checker, var))
+
+
+def _compile_tuple(vtype):
+    """Checker for a tuple literal: a tuple of the same length, with each element matching its type."""
+    compiled = [_compile_cached((t, )) for t in vtype]
+    checkers = tuple(c for c, _ in compiled)
+    size = len(checkers)
+    return (lambda var: (isinstance(var, tuple) and len(var) == size and
+                         all(checker(item) for checker, item in zip(checkers, var)))), all(ok for _, ok in compiled)
+
+
+def _compile_dict(vtype):
+    """Checker for a dict literal: a dict whose every (key, value) pair matches one of the literal's pairs."""
+    pairs = tuple((_get_checker((k, )), _get_checker((v, ))) for k, v in viewitems(vtype))
+    return lambda var: (isinstance(var, dict) and
+                        all(any(kcheck(k) and vcheck(v) for kcheck, vcheck in pairs) for k, v in viewitems(var)))
+
+
+_str_types = _str_type if isinstance(_str_type, tuple) else (_str_type, )
+_int_types = _int_type if isinstance(_int_type, tuple) else (_int_type, )
 
 
 def _get_type_name(vtype, dump=None):
@@ -2736,6 +2736,7 @@ def compare_frames(frame1, frame2, numElements, tol_time=0, tol_numeric=0, stric
                                    "NA number: {1}".format(na_frame1, na_frame2)
 
     # check column types are the same before proceeding to check each row content.
+    diffs = {}  # comparisons of all the cells (a single request per tolerance)
     for col_ind in range(cols1):
 
         c1_key = frame1.columns[col_ind]
@@ -2748,21 +2749,22 @@ def compare_frames(frame1, frame2, numElements, tol_time=0, tol_numeric=0, stric
         if strict:  # every column type must match
             assert c1_type == c2_type, "failed column type check! frame1 col type: {0}, frame2 col type: " \
                                        "{1}".format(c1_type, c2_type)
-        else:
-            if str(c2_type) == 'enum':  # orc files do not have enum column type.  We convert it here
-                frame1[col_ind].asfactor()
 
-        # compare string
-        if (str(c1_type) == 'string') or (str(c1_type) == 'enum'):
-            compareOneStringColumn(frame1, frame2, col_ind, rows1, numElements)
-        else:
-            if str(c2_type) == 'time':  # compare time columns
-                compareOneNumericColumn(frame1, frame2, col_ind, rows1, tol_time, numElements)
-            else:
-                compareOneNumericColumn(frame1, frame2, col_ind, rows1, tol_numeric, numElements)
+        tol = tol_time if str(c2_type) == 'time' else tol_numeric  # string columns are compared exactly anyway
+        if tol not in diffs:
+            diffs[tol] = frame1.compare(frame2, tol=tol)
+        _check_column_diff(diffs[tol][col_ind], col_ind)
     return True
 
 
+def _check_column_diff(diff, col_ind):
+    """Check that a column has no mismatches, given the result of ``H2OFrame.compare()`` for this column."""
+    assert diff["mismatches"] == 0, "failed frame values check! frame1 value: {0}, frame2 value: {1} at row {2}, " \
+                                    "column {3} ({4} rows differ, the largest relative difference is " \
+                                    "{5})".format(diff["values"][0], diff["values"][1], diff["first_mismatch"],
+                                                  col_ind, diff["mismatches"], diff["max_rel_error"])
+
+
 def compareOneStringColumn(frame1, frame2, col_ind, rows, numElements):
     """
     This function will compare two String columns of two H2O frames to make sure that they are the same.
@@ -2771,24 +2773,10 @@ def compareOneStringColumn(frame1, frame2, col_ind, rows, numElements):
     :param frame2: H2O frame to be compared
     :param col_ind: integer denoting column index to compare the two frames
     :param rows: integer denoting number of rows in the column
-    :param numElements: integer to denote number of rows to compare.  Done to reduce compare time
+    :param numElements: ignored, all the rows are compared (in a single request)
     :return: None.  Will throw exceptions if comparison failed.
     """
-
-    row_indices = list(range(rows))
-    if numElements > 0:
-        random.shuffle(row_indices)
-    else:
-        numElements = rows
-
-    for ele_ind in range(numElements):
-        row_ind = row_indices[ele_ind]
-
-        val1 = frame1[row_ind, col_ind]
-        val2 = frame2[row_ind, col_ind]
-
-        assert val1 == val2, "failed frame values check! frame1 value: {0}, frame2 value: {1} at row {2}, column " \
-                             "{3}".format(val1, val2, row_ind, col_ind)
+    _check_column_diff(frame1[col_ind].compare(frame2[col_ind])[0], col_ind)
 
 
 def compareOneNumericColumn(frame1, frame2, col_ind, rows, tolerance, numElements):
@@ -2800,34 +2788,10 @@ def compareOneNumericColumn(frame1, frame2, col_ind, rows, tolerance, numElement
     :param col_ind: integer denoting column index to compare the two frames
     :param rows: integer denoting number of rows in the column
     :param tolerance: double parameter to limit numerical value difference.
-    :param numElements: integer to denote number of rows to compare.  Done to reduce compare time.
+    :param numElements: ignored, all the rows are compared (in a single request)
     :return: None.  Will throw exceptions if comparison failed.
     """
-
-    row_indices = []
-    if numElements > 0:
-        row_indices = random.sample(range(rows), numElements)
-    else:
-        numElements = rows  # Compare all elements
-        row_indices = list(range(rows))
-
-
-    for ele_ind in range(numElements):
-        row_ind = row_indices[ele_ind]
-
-        val1 = frame1[row_ind, col_ind]
-        val2 = frame2[row_ind, col_ind]
-
-        if not(math.isnan(val1)) and not(math.isnan(val2)): # both frames contain valid elements
-            diff = abs(val1-val2)/max(1, abs(val1), abs(val2))
-            assert diff <= tolerance, "failed frame values check! frame1 value = {0}, frame2 value =  {1}, " \
-                                      "at row {2}, column {3}.  The difference is {4}.".format(val1, val2, row_ind,
-                                                                                               col_ind, diff)
-        elif math.isnan(val1) and math.isnan(val2): # both frame contains missing values
-            continue
-        else:   # something is wrong, one frame got a missing value while the other is fine.
-            assert 1 == 2,  "failed frame values check! frame1 value {0}, frame2 value {1} at row {2}, " \
-                            "column {3}".format(val1, val2, row_ind, col_ind)
+    _check_column_diff(frame1[col_ind].compare(frame2[col_ind], tol=tolerance)[0], col_ind)
 
 import warnings
 
@@ -3052,20 +3016,11 @@ def check_ignore_cols_automl(models,names,x,y):
 
 def compare_numeric_frames(f1, f2, prob=0.5, tol=1e-6):
     assert (f1.nrow==f2.nrow) and (f1.ncol==f2.ncol), "The two frames are of different sizes."
-    temp1 = f1.asnumeric()
-    temp2 = f2.asnumeric()
-    for colInd in range(f1.ncol):
-        for rowInd in range(f2.nrow):
-            if (random.uniform(0,1) < prob):
-                if (math.isnan(temp1[rowInd, colInd])):
-                    assert math.isnan(temp2[rowInd, colInd]), "Failed frame values check at row {2} and column {3}! " \
-                                                              "frame1 value: {0}, frame2 value: " \
-                                                              "{1}".format(temp1[rowInd, colInd], temp2[rowInd, colInd], rowInd, colInd)
-                else:
-                    diff = abs(temp1[rowInd, colInd]-temp2[rowInd, colInd])/max(1.0, abs(temp1[rowInd, colInd]),
-                                                                            abs(temp2[rowInd, colInd]))
-                    assert diff<=tol, "Failed frame values check at row {2} and column {3}! frame1 value: {0}, frame2 value: " \
-                                  "{1}".format(temp1[rowInd, colInd], temp2[rowInd, colInd], rowInd, colInd)
+    # all the cells are compared (in a single request), prob is no longer used
+    for colInd, diff in enumerate(f1.asnumeric().compare(f2.asnumeric(), tol=tol)):
+        assert diff["mismatches"] == 0, "Failed frame values check at row {2} and column {3}! frame1 value: {0}, " \
+                                        "frame2 value: {1}".format(diff["values"][0], diff["values"][1],
+                                                                   diff["first_mismatch"], colInd)
 
 def check_sorted_2_columns(frame1, sorted_column_indices, prob=0.5, ascending=[True, True]):
     for colInd in sorted_column_indices:
@@ -0,0 +1,51 @@
+from __future__ import print_function
+import gc, sys, os
+sys.path.insert(1, os.path.join("..","..",".."))
+import h2o
+from tests import pyunit_utils
+from h2o.automl import H2OAutoML
+
+
+def automl_leaderboard():
+    df = h2o.import_file(path=pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    df["CAPSULE"] = df["CAPSULE"].asfactor()
+    aml = H2OAutoML(max_models=2, nfolds=3, seed=1, project_name="py_aml_leaderboard")
+
+    tracer = h2o.connection().tracer
+    tracer.reset()
+    aml.train(y="CAPSULE", training_frame=df)
+    leaderboard = aml.leaderboard
+    assert set(leaderboard.columns) == {"model_id", "auc", "logloss"}
+    # The leaderboard is created on the server, not uploaded from the client
+    endpoints = {s["endpoint"] for s in tracer.stats()}
+    assert "POST /3/PostFile" not in endpoints and "POST /99/Leaderboards/*/frame" in endpoints, endpoints
+
+    model_ids = [leaderboard[i, 0] for i in range(leaderboard.nrows)]
+    assert aml.leader.model_id == model_ids[0]
+    for i in range(leaderboard.nrows):
+        auc = h2o.get_model(model_ids[i]).auc(xval=True)
+        assert abs(leaderboard[i, "auc"] - auc) < 1e-6, (model_ids[i], leaderboard[i, "auc"], auc)
+
+    # Nothing is fetched again until the models change
+    assert not aml.refresh()
+    assert aml.leaderboard is leaderboard and aml.leader is aml.leader
+    aml.train(y="CAPSULE", training_frame=df)
+    assert aml.leaderboard is not leaderboard and aml.leaderboard.nrows > leaderboard.nrows
+    # ... and the leader used by predict() is the one of the new leaderboard
+    assert aml.leader.model_id == aml.leaderboard[0, 0]
+    assert aml.predict(df).nrows == df.nrows
+    print(aml.leaderboard)
+
+    # The outdated leaderboard frame is removed from the server once it is no longer used
+    old_id = leaderboard.frame_id
+    del leaderboard
+    gc.collect()
+    h2o.flush_temps()
+    assert h2o.get_frame(old_id) is None, "The old leaderboard frame %s was not removed" % old_id
+    assert h2o.get_frame(aml.leaderboard.frame_id) is not None
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(automl_leaderboard)
+else:
+    automl_leaderboard()
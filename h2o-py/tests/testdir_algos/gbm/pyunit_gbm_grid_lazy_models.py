@@ -0,0 +1,50 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", "..", ".."))
+import h2o
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from h2o.grid import H2OGridModels
+from h2o.grid.grid_search import H2OGridSearch
+from tests import pyunit_utils
+
+
+def gbm_grid_lazy_models():
+    prostate = h2o.import_file(path=pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    prostate["CAPSULE"] = prostate["CAPSULE"].asfactor()
+    grid = H2OGridSearch(H2OGradientBoostingEstimator(seed=1), {"ntrees": [1, 2, 3, 4], "max_depth": [2, 3]})
+    grid.train(x=["AGE", "PSA", "GLEASON"], y="CAPSULE", training_frame=prostate)
+    hc = h2o.connection()
+
+    # Models are only fetched when accessed...
+    assert isinstance(grid.models, H2OGridModels) and len(grid) == 8
+    assert sorted(grid.models.model_ids) == sorted(grid.model_ids)
+    rest = hc.requests_count
+    first = grid[0]
+    assert isinstance(first, H2OGradientBoostingEstimator)
+    assert hc.requests_count - rest == 1
+    assert grid[0] is first
+
+    # ... and ranking by a metric uses the grid's summary table only
+    rest = hc.requests_count
+    by_auc = grid.get_grid(sort_by="auc", decreasing=True)
+    assert hc.requests_count - rest == 2  # the sorted grid, and the first model to determine the metrics class
+    assert by_auc[by_auc.models.model_ids.index(first.model_id)] is first  # already fetched models are kept
+
+    # Iterating fetches all the remaining models at once
+    aucs = [m.auc() for m in by_auc]
+    assert aucs == sorted(aucs, reverse=True)
+    rest = hc.requests_count
+    gbm = h2o.get_grid(grid.grid_id)
+    assert hc.requests_count - rest == 2  # the grid, and its first model
+    assert sorted(gbm.hyper_params["ntrees"]) == [1, 2, 3, 4]
+    assert sorted(gbm.hyper_params["max_depth"]) == [2, 3]
+    assert isinstance(gbm.model, H2OGradientBoostingEstimator)
+    assert gbm[0].model_id == gbm.models.model_ids[0]
+    assert hc.requests_count - rest == 2
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(gbm_grid_lazy_models)
+else:
+    gbm_grid_lazy_models()
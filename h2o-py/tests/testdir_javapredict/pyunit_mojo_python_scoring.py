@@ -0,0 +1,67 @@
+from __future__ import print_function
+import sys, os
+sys.path.insert(1, "../../../")
+import tempfile
+import h2o
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from h2o.estimators.glm import H2OGeneralizedLinearEstimator
+from h2o.estimators.random_forest import H2ORandomForestEstimator
+from h2o.mojo import load_mojo
+from tests import pyunit_utils
+import pandas
+
+
+def mojo_python_scoring():
+    prostate = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate_cat.csv"))
+    prostate["CAPSULE"] = prostate["CAPSULE"].asfactor()
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    cases = [
+        (H2OGradientBoostingEstimator(ntrees=30, max_depth=5, seed=1), prostate, "CAPSULE"),
+        (H2OGradientBoostingEstimator(ntrees=10, distribution="poisson", seed=1), prostate, "AGE"),
+        (H2OGradientBoostingEstimator(ntrees=10, max_depth=4, seed=1), iris, "class"),
+        (H2ORandomForestEstimator(ntrees=20, seed=1), prostate, "CAPSULE"),
+        (H2ORandomForestEstimator(ntrees=10, max_depth=10, seed=1), iris, "class"),
+        (H2ORandomForestEstimator(ntrees=10, seed=1), prostate, "VOL"),
+        (H2OGeneralizedLinearEstimator(family="binomial"), prostate, "CAPSULE"),
+        (H2OGeneralizedLinearEstimator(family="gaussian"), prostate, "VOL"),
+        (H2OGeneralizedLinearEstimator(family="multinomial"), iris, "class"),
+    ]
+    for model, data, y in cases:
+        train, test = data.split_frame(ratios=[0.8], seed=1)
+        model.train(x=[c for c in data.names if c not in {y, "ID"}], y=y, training_frame=train)
+        tmpdir = tempfile.mkdtemp()
+        mojo_name = model.download_mojo(path=tmpdir)[:-len(".zip")]
+        h2o.download_csv(test, os.path.join(tmpdir, "in.csv"))
+        _, pred_java = pyunit_utils.mojo_predict(model, tmpdir, os.path.basename(mojo_name))
+        pred_java = pred_java.as_data_frame()
+
+        mojo = load_mojo(mojo_name + ".zip")
+        in_csv = pandas.read_csv(os.path.join(tmpdir, "in.csv"))
+        pred_py = mojo.predict(in_csv)
+        print(mojo, "\n", pred_py.head())
+        assert list(pred_py.columns) == mojo.columns
+        assert len(pred_py) == len(pred_java)
+        for i, column in enumerate(mojo.columns):
+            if i == 0 and mojo.response_domain:
+                assert list(pred_py[column].astype(str)) == list(pred_java.iloc[:, 0].astype(str)), \
+                    "Predicted classes differ from PredictCsv"
+            else:
+                diff = (pred_py[column] - pred_java.iloc[:, i]).abs().max()
+                assert diff < 1e-10, "%s: column %s differs from PredictCsv by %g" % (mojo, column, diff)
+
+        # A single row is scored the same as a batch
+        rows = in_csv.head(10).to_dict("records")
+        for r, row in enumerate(rows):
+            pred = mojo.predict_row(row)
+            assert list(pred) == mojo.columns
+            for i, column in enumerate(mojo.columns):
+                if i == 0 and mojo.response_domain:
+                    assert pred[column] == pred_py[column][r]
+                else:
+                    assert abs(pred[column] - pred_py[column][r]) < 1e-12
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(mojo_python_scoring)
+else:
+    mojo_python_scoring()
@@ -38,6 +38,21 @@ def pyunit_as_data_frame():
   assert tail_small_bike_pandas.loc[2][3] == small_bike_pandas.loc[6][3]
   assert head_small_bike_pandas.loc[4][0] == tail_small_bike_pandas.loc[0][0]
 
+  # columnar download should produce the same data as parsing the CSV download
+  import pandas
+  from io import StringIO
+  csv_bike_pandas = pandas.read_csv(StringIO(smallbike.get_frame_data()), low_memory=False)
+  assert list(small_bike_pandas.columns) == list(csv_bike_pandas.columns)
+  for col in csv_bike_pandas.columns:
+    assert small_bike_pandas[col].equals(csv_bike_pandas[col]), "Column %s differs from the CSV download" % col
+
+  # integer columns are downloaded exactly, also beyond the 2**53 precision of doubles
+  big = 2**53 + 1
+  ids = h2o.H2OFrame([[big], [-big], [7]], column_names=["id"])
+  ids_pandas = ids.as_data_frame(use_pandas=True)
+  assert str(ids_pandas["id"].dtype) == "int64"
+  assert ids_pandas["id"].tolist() == [big, -big, 7], ids_pandas["id"].tolist()
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import h2o
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from tests import pyunit_utils
+
+
+def async_api():
+    if sys.version_info < (3, 5):
+        print("The asyncio API requires Python 3.5+")
+        return
+    import asyncio
+    from h2o.backend.async_connection import AsyncH2OConnection
+
+    loop = asyncio.get_event_loop()
+    fr = h2o.import_file(path=pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    fr["CAPSULE"] = fr["CAPSULE"].asfactor()
+
+    # Many models are trained concurrently from a single thread, at most 2 at a time
+    conn = AsyncH2OConnection(max_jobs=2)
+    models = [H2OGradientBoostingEstimator(ntrees=ntrees, seed=1) for ntrees in (1, 2, 3, 4, 5)]
+    trained = loop.run_until_complete(asyncio.gather(*[
+        m.train_async(x=["AGE", "PSA", "GLEASON"], y="CAPSULE", training_frame=fr, conn=conn) for m in models]))
+    assert trained == models
+    assert [m.params["ntrees"]["actual"] for m in models] == [1, 2, 3, 4, 5]
+    sync = H2OGradientBoostingEstimator(ntrees=5, seed=1)
+    sync.train(x=["AGE", "PSA", "GLEASON"], y="CAPSULE", training_frame=fr)
+    assert abs(sync.auc() - models[-1].auc()) < 1e-10
+
+    # Frames are computed and downloaded without blocking the event loop
+    data = loop.run_until_complete((fr["AGE"] * 2).collect(use_pandas=False, conn=conn))
+    assert data[1] == [str(2 * int(fr[0, "AGE"]))]
+
+    # A started job can be awaited as well
+    est = H2OGradientBoostingEstimator(ntrees=3)
+    est.start(x=["AGE", "PSA"], y="CAPSULE", training_frame=fr)
+    job = loop.run_until_complete(est._job.wait())
+    assert job.status == "DONE"
+
+    # The same object can be used from another event loop as well (e.g. in a second asyncio.run())
+    loop2 = asyncio.new_event_loop()
+    try:
+        est = H2OGradientBoostingEstimator(ntrees=2, seed=1)
+        loop2.run_until_complete(est.train_async(x=["AGE", "PSA"], y="CAPSULE", training_frame=fr, conn=conn))
+        assert est.params["ntrees"]["actual"] == 2
+    finally:
+        loop2.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(async_api)
+else:
+    async_api()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""Check that H2OConnection reuses keep-alive sockets between requests."""
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def connection_pool_test():
+    conn = h2o.connection()
+    before = conn.sockets_count
+    for _ in range(20):
+        h2o.api("GET /3/Cloud")
+    after = conn.sockets_count
+    assert set(after) == {"new", "reused"}
+    assert after["new"] - before["new"] <= 1, "Expected at most 1 new socket, got %r" % after
+    assert after["reused"] - before["reused"] >= 19, "Expected sockets to be reused, got %r" % after
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(connection_pool_test)
+else:
+    connection_pool_test()
@@ -0,0 +1,60 @@
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../../")
+import json
+import h2o
+from h2o.backend.tracing import H2ORequestTracer
+from tests import pyunit_utils
+
+
+def connection_stats():
+    tracer = h2o.connection().tracer
+    tracer.reset()
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    for i in range(3):
+        h2o.api("GET /3/Frames/%s/summary" % iris.frame_id)
+    try:
+        h2o.api("GET /3/Frames/no_such_frame")
+    except h2o.exceptions.H2OResponseError:
+        pass
+
+    stats = {s["endpoint"]: s for s in tracer.stats()}
+    summary = stats["GET /3/Frames/*/summary"]
+    assert summary["calls"] == 3 and summary["errors"] == 0, summary
+    assert sum(summary["histogram"]) == 3 and summary["max_ms"] >= summary["p50_ms"] > 0, summary
+    assert summary["bytes_received"] > 0, summary
+    # All three calls come from the same line of this test
+    [(caller, n)] = summary["callers"].items()
+    assert "pyunit_connection_stats" in caller and n == 3, summary["callers"]
+    assert stats["GET /3/Frames/*"]["errors"] >= 1
+
+    table = h2o.connection().stats()
+    assert table.col_header[0] == "endpoint" and len(table.cell_values) == len(stats)
+    events = json.loads(tracer.to_chrome_trace())["traceEvents"]
+    assert len(events) == sum(s["calls"] for s in stats.values())
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    assert json.loads(tracer.to_json())["endpoints"][0]["endpoint"] == table.cell_values[0][0]
+
+    # Keys are masked wherever they appear in the URL
+    pattern = H2ORequestTracer.endpoint_pattern
+    assert pattern("GET /3/Frames/iris.hex/columns/sepal_len/summary") == "GET /3/Frames/*/columns/*/summary"
+    assert pattern("POST /3/Predictions/models/gbm_1/frames/test.hex") == "POST /3/Predictions/models/*/frames/*"
+    assert pattern("POST /4/Predictions/models/gbm_1/frames/test.hex") == "POST /4/Predictions/models/*/frames/*"
+    assert pattern("POST /3/ModelMetrics/models/gbm_1/frames/test.hex?reconstruction_error=true") == \
+        "POST /3/ModelMetrics/models/*/frames/*"
+    assert pattern("POST /3/ModelMetrics/predictions_frame/p.hex/actuals_frame/a.hex") == \
+        "POST /3/ModelMetrics/predictions_frame/*/actuals_frame/*"
+    assert pattern("POST /3/Jobs/job_1/cancel") == "POST /3/Jobs/*/cancel"
+
+    # The number of distinct endpoints is bounded
+    small = H2ORequestTracer(max_endpoints=2)
+    for i in range(5):
+        small.record("GET /3/Resource%d" % i, 0, 0.001, 200)
+    counts = {s["endpoint"]: s["calls"] for s in small.stats()}
+    assert counts == {"GET /3/Resource0": 1, "GET /3/Resource1": 1, H2ORequestTracer.OTHER_ENDPOINTS: 3}, counts
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(connection_stats)
+else:
+    connection_stats()
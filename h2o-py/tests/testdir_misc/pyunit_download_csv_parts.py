@@ -0,0 +1,38 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+import os
+from h2o.frame import _download_csv_parts
+
+
+def download_csv_parts():
+    prostate = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate.csv"))
+    h2o.download_csv(prostate, "prostate_whole.csv")
+    with open("prostate_whole.csv") as f:
+        expected = f.read()
+    assert expected.count("\n") == prostate.nrow + 1
+
+    # Several parts downloaded in parallel, with and without compression, give the same file
+    for compress in [False, True]:
+        _download_csv_parts(prostate.frame_id, prostate.nrow, "prostate_parts.csv", part_rows=70, compress=compress)
+        with open("prostate_parts.csv") as f:
+            assert f.read() == expected
+        assert not any(name.startswith("prostate_parts.csv.part") for name in os.listdir("."))
+
+    # An interrupted download is continued from the last complete row
+    os.remove("prostate_parts.csv")
+    with open("prostate_parts.csv.part0", "w") as f:
+        f.write(expected[:1000])
+    _download_csv_parts(prostate.frame_id, prostate.nrow, "prostate_parts.csv", part_rows=70, resume=True)
+    with open("prostate_parts.csv") as f:
+        assert f.read() == expected
+
+    os.remove("prostate_whole.csv")
+    os.remove("prostate_parts.csv")
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(download_csv_parts)
+else:
+    download_csv_parts()
@@ -1,11 +1,13 @@
 import h2o
 import sys
+import time
 
 sys.path.insert(1, "../../")
 from tests import pyunit_utils
 
 from h2o import H2OFrame
 from h2o.expr import ExprNode
+from h2o.expr_optimizer import optimize_dag
 
 
 def _assert_expr_results_eq(expr_provider, skip_expr_assert=False):
@@ -28,6 +30,22 @@ def _assert_expr_results_eq(expr_provider, skip_expr_assert=False):
         h2o.enable_expr_optimizations(flag)
 
 
+def _assert_eval_results_eq(expr_provider):
+    """Optimizations applied at evaluation time: compare results of evaluation with/without them."""
+    flag = h2o.is_expr_optimizations_enabled()
+    try:
+        h2o.enable_expr_optimizations(True)
+        opt_expr = expr_provider()
+        opt_result = H2OFrame._expr(opt_expr).as_data_frame(use_pandas=False)
+        h2o.enable_expr_optimizations(False)
+        noopt_expr = expr_provider()
+        noopt_result = H2OFrame._expr(noopt_expr).as_data_frame(use_pandas=False)
+        assert opt_result == noopt_result, "Results with/without expression optimization should match!"
+        return opt_expr
+    finally:
+        h2o.enable_expr_optimizations(flag)
+
+
 def test_fold_optimization_append_expr():
     data_dst = single_column_frame()
     data_src = single_column_frame()
@@ -147,6 +165,69 @@ def test_skip_optimization():
     assert data.dim == [w, 6]
 
 
+def test_cse_optimization():
+    data = single_column_frame()
+
+    def get_expr():
+        return ExprNode("+", ExprNode("log", data), ExprNode("*", ExprNode("log", data), 2))
+
+    expr = _assert_eval_results_eq(get_expr)
+    assert expr.arg(0) is expr.arg(1).arg(0), "Both (log data) should be the same node"
+
+
+def test_cse_optimization_disabled():
+    data = single_column_frame()
+    h2o.enable_expr_optimizations(False, "cse")
+    try:
+        assert not h2o.is_expr_optimizations_enabled("cse")
+        expr = _assert_eval_results_eq(lambda: ExprNode("+", ExprNode("log", data), ExprNode("log", data)))
+        assert expr.arg(0) is not expr.arg(1)
+    finally:
+        h2o.enable_expr_optimizations(True, "cse")
+
+
+def test_cse_optimization_deep_dag():
+    data = single_column_frame()
+
+    def squarings(n):
+        expr = data._ex
+        for _ in range(n):
+            expr = ExprNode("*", expr, expr)  # n + 1 nodes, but 2**n paths from the root to the data
+        return expr
+
+    expr = ExprNode("+", squarings(30), squarings(30))
+    start = time.time()
+    optimize_dag(expr)
+    elapsed = time.time() - start
+    assert elapsed < 1, "Optimizing a DAG with shared sub-trees took %.2fs" % elapsed
+    assert expr.arg(0) is expr.arg(1), "Both chains of squarings should be the same node"
+
+
+def test_constants_optimization():
+    data = single_column_frame()
+    expr = _assert_eval_results_eq(lambda: ExprNode("+", data, ExprNode("*", 2, ExprNode("-", 5, 2))))
+    assert expr.arg(1) == 6
+
+
+def test_selections_optimization():
+    data = multi_column_frame()
+    expr = _assert_eval_results_eq(lambda: ExprNode("cols_py", ExprNode("cols_py", data, [1, 2, 3]), [0, 2]))
+    assert expr.arg(0) is data._ex and expr.arg(1) == [1, 3]
+
+    expr = _assert_eval_results_eq(lambda: ExprNode("rows", ExprNode("rows", data, slice(1, 5, 1)), slice(1, 3, 1)))
+    assert expr.arg(0) is data._ex and expr.arg(1) == slice(2, 4, 1)
+
+
+def test_pushdown_optimization():
+    data = multi_column_frame()
+
+    def get_expr():
+        return ExprNode("cols_py", ExprNode("rows", data, ExprNode(">", ExprNode("cols_py", data, 0), 1)), [1, 2])
+
+    expr = _assert_eval_results_eq(get_expr)
+    assert expr._op == "rows" and expr.arg(0)._op == "cols_py" and expr.arg(0).arg(0) is data._ex
+
+
 def _collect_all_ops(e):
     return sum([_collect_all_ops(c) for c in e.args() if isinstance(c, ExprNode)],
                [e._op]) if e.args() else [e._op]
@@ -159,6 +240,10 @@ def single_column_frame():
     return H2OFrame(python_obj=[[1], [2], [3], [4], [5]], column_names=["CA"])
 
 
+def multi_column_frame():
+    return H2OFrame(python_obj=[[i, i * 10, i * 100, i * 1000] for i in range(6)])
+
+
 def square_matrix(w, cell_value=None):
     row = [cell_value] * w if cell_value is not None else range(0, w)
     return H2OFrame(python_obj = [list(row) for i in range(0, w)])
@@ -168,7 +253,10 @@ __TESTS__ = [test_fold_optimization_append_expr, test_fold_optimization_cbind_ex
              test_fold_optimization_append, test_fold_optimization_cbind,
              test_fold_optimization_rbind_expr,
              test_skip_optimization_expr, test_skip_optimization_expr_negative,
-             test_skip_optimization]
+             test_skip_optimization,
+             test_cse_optimization, test_cse_optimization_disabled, test_cse_optimization_deep_dag,
+             test_constants_optimization,
+             test_selections_optimization, test_pushdown_optimization]
 
 if __name__ == "__main__":
     for func in __TESTS__:
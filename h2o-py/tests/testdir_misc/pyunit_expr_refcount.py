@@ -0,0 +1,57 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import h2o
+from tests import pyunit_utils
+
+
+def count_temps(frame):
+    # Note: this marks the expression as evaluated, so the frame cannot be used afterwards
+    return frame._ex._get_ast_str(True).count("(tmp=")
+
+
+def expr_refcount():
+    fr = h2o.H2OFrame({"a": [1, 2, 3]})
+
+    # An expression shared by two parents is cached as a temp, others are inlined
+    x = fr["a"] + 1
+    assert count_temps(x * x) == 2
+    x = fr["a"] + 1
+    y = x * x
+    assert y.as_data_frame(use_pandas=False)[1:] == [["4"], ["9"], ["16"]]
+
+    # ... and so is an expression still held by a frame
+    x = fr["a"] - 1
+    assert count_temps(x / 2) == 2
+    x = fr["a"] - 1
+    x = x / 2
+    assert count_temps(x) == 1
+
+    # Reference counts are released when frames and expressions die
+    a = fr["a"]
+    node = a._ex
+    b = a + 1
+    c = a + 2
+    assert node._nrefs == 3
+    del b, c
+    assert node._nrefs == 1
+    a = None
+    assert node._nrefs == 0
+
+    # In a deep chain every intermediate expression is owned by its parent only, so none of them is cached
+    chain = fr["a"]
+    for i in range(300):
+        chain = chain + 1
+    node, depth = chain._ex._children[0], 0
+    while getattr(node, "_op", None) == "+":
+        assert node._nrefs == 1
+        node, depth = node._children[0], depth + 1
+    assert depth == 299
+    assert chain.as_data_frame(use_pandas=False)[1:] == [["301"], ["302"], ["303"]]
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(expr_refcount)
+else:
+    expr_refcount()
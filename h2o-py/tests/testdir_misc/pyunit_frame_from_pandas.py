@@ -28,6 +28,15 @@ def test_pandas_to_h2oframe():
     compare_frames(h2odf2, pddf, ["A", "B", "C"])
     compare_frames(h2odf3, pddf)
 
+    # column types are taken from the pandas dtypes rather than guessed
+    pddf = pd.DataFrame({"num": [1, 2, 3], "cat": pd.Categorical(["1", "2", "1"]), "flag": [True, False, True],
+                         "when": pd.to_datetime(["2017-01-01", "2017-06-01", "2017-12-31"])},
+                        columns=["num", "cat", "flag", "when"])
+    h2odf4 = h2o.H2OFrame(pddf)
+    assert h2odf4.types == {"num": "int", "cat": "enum", "flag": "enum", "when": "time"}, h2odf4.types
+    h2odf5 = h2o.H2OFrame(pddf, column_types={"cat": "numeric"})
+    assert h2odf5.types["cat"] == "int", h2odf5.types
+
 
 if __name__ == "__main__":
     pyunit_utils.standalone_test(test_pandas_to_h2oframe)
@@ -0,0 +1,40 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import h2o
+from tests import pyunit_utils
+
+
+def frame_meta_cache():
+    iris = h2o.import_file(path=pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    hc = h2o.connection()
+
+    # Appending a scalar column invalidates only the column types
+    iris["one"] = 1
+    rest = hc.requests_count
+    assert iris.names == ["sepal_len", "sepal_wid", "petal_len", "petal_wid", "class", "one"]
+    assert iris.nrows == 150 and iris.ncols == 6
+    assert hc.requests_count == rest, "Cached fields should not be fetched again"
+
+    # ... which are fetched together with the evaluation of the frame, without any rows of data
+    assert iris.types["one"] == "int"
+    assert iris.type("class") == "enum"
+    assert hc.requests_count - rest == 1
+    assert iris._ex._cache.is_empty()
+
+    # Metadata of an already computed frame
+    iris._ex._cache.types = None
+    assert iris.types["sepal_len"] == "real"
+    assert hc.requests_count - rest == 2
+
+    # Data is fetched only for displaying the frame
+    iris.show()
+    assert not iris._ex._cache.is_empty()
+    assert iris.head(rows=3).as_data_frame(use_pandas=False)[1][5] == "1"
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(frame_meta_cache)
+else:
+    frame_meta_cache()
@@ -0,0 +1,56 @@
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../../")
+import json
+import os
+import subprocess
+import h2o
+from tests import pyunit_utils
+
+# Budget for `import h2o` in a fresh interpreter, in seconds (can be overridden for slow test machines)
+IMPORT_TIME_BUDGET = float(os.environ.get("H2O_IMPORT_TIME_BUDGET", "1.0"))
+
+# Modules that must not be loaded by `import h2o` alone
+LAZY_MODULES = ["h2o.estimators", "h2o.grid", "h2o.automl", "h2o.transforms", "tabulate", "webbrowser", "distutils",
+                "numpy", "pandas", "matplotlib"]
+
+SCRIPT = """
+import json, sys, time
+t0 = time.time()
+import h2o
+elapsed = time.time() - t0
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_time():
+    h2o_dir = os.path.dirname(os.path.dirname(os.path.abspath(h2o.__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([h2o_dir, os.environ.get("PYTHONPATH", "")]))
+    # The first run may have to compile the .pyc files, only the best time counts
+    runs = [json.loads(subprocess.check_output([sys.executable, "-c", SCRIPT], env=env).decode().splitlines()[-1])
+            for _ in range(3)]
+    best = min(run["elapsed"] for run in runs)
+    print("import h2o: %.3fs (budget %.3fs)" % (best, IMPORT_TIME_BUDGET))
+
+    loaded = [m for m in runs[-1]["modules"] if any(m == lazy or m.startswith(lazy + ".") for lazy in LAZY_MODULES)]
+    assert not loaded, "Modules loaded by `import h2o`: %r" % loaded
+    assert best < IMPORT_TIME_BUDGET, "`import h2o` took %.3fs, over the budget of %.3fs" % (best, IMPORT_TIME_BUDGET)
+
+    # The lazily loaded names are still available
+    from h2o.estimators import H2OGradientBoostingEstimator
+    from h2o.grid.grid_search import H2OGridSearch
+    assert h2o.estimators.H2OGradientBoostingEstimator is H2OGradientBoostingEstimator
+    assert h2o.estimators.gbm.H2OGradientBoostingEstimator is H2OGradientBoostingEstimator
+    assert h2o.h2o.H2OGradientBoostingEstimator is H2OGradientBoostingEstimator
+    assert h2o.h2o.H2OGridSearch is H2OGridSearch
+    try:
+        h2o.estimators.H2ONoSuchEstimator
+        assert False, "Expected an AttributeError"
+    except AttributeError:
+        pass
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(import_time)
+else:
+    import_time()
@@ -0,0 +1,26 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def pyunit_iter_batches():
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    full = iris.as_data_frame()
+
+    batches = list(iris.iter_batches(batch_rows=40))
+    assert [len(b) for b in batches] == [40, 40, 40, 30]
+    for i, batch in enumerate(batches):
+        expected = full.iloc[i * 40:(i + 1) * 40].reset_index(drop=True)
+        assert batch.equals(expected), "Batch %d differs from as_data_frame()" % i
+
+    batches = list(iris.iter_batches(batch_rows=100, columns=["sepal_len", "class"], use_pandas=False))
+    assert len(batches) == 2
+    assert list(batches[0].keys()) == ["sepal_len", "class"]
+    assert len(batches[0]["sepal_len"]) == 100 and len(batches[1]["class"]) == 50
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(pyunit_iter_batches)
+else:
+    pyunit_iter_batches()
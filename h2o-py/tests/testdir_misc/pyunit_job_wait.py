@@ -0,0 +1,40 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import time
+import h2o
+from h2o.job import H2OJob
+from tests import pyunit_utils
+
+
+def start_gbm(fr):
+    data = {"training_frame": fr.frame_id, "response_column": "CAPSULE", "ntrees": 20}
+    return h2o.api("POST /3/ModelBuilders/gbm", data=data)
+
+
+def job_wait():
+    fr = h2o.import_file(path=pyunit_utils.locate("smalldata/logreg/prostate.csv"))
+    hc = h2o.connection()
+
+    # The server holds the request until the job is done
+    job_key = start_gbm(fr)["job"]["key"]["name"]
+    job = h2o.api("GET /3/Jobs/%s" % job_key, data={"wait_ms": 60000})["jobs"][0]
+    assert job["status"] == "DONE", job["status"]
+
+    # ... so a job is noticed as soon as it finishes, with one request per WAIT_MS
+    job = H2OJob(start_gbm(fr), "GBM")
+    rest = hc.requests_count
+    t0 = time.time()
+    job.poll()
+    elapsed = time.time() - t0
+    print("Job finished after %.3fs" % elapsed)
+    assert job.status == "DONE"
+    assert hc.requests_count - rest <= 1 + int(elapsed * 1000 / H2OJob.WAIT_MS), \
+        "Expected one request per %dms of waiting" % H2OJob.WAIT_MS
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(job_wait)
+else:
+    job_wait()
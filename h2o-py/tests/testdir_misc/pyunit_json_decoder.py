@@ -0,0 +1,72 @@
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../../")
+import json
+import h2o
+from tests import pyunit_utils
+from h2o.backend.connection import H2OLazyResponse
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from h2o.model.metrics_base import H2OBinomialModelMetrics
+from h2o.two_dim_table import H2OTwoDimTable
+
+
+def json_decoder():
+    prostate = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate.csv"))
+    prostate["CAPSULE"] = prostate["CAPSULE"].asfactor()
+    gbm = H2OGradientBoostingEstimator(ntrees=5, nfolds=3, seed=1)
+    gbm.train(x=["AGE", "RACE", "PSA", "VOL", "GLEASON"], y="CAPSULE", training_frame=prostate)
+
+    conn = h2o.connection()
+    endpoint = "GET /3/Models/%s" % gbm.model_id
+    assert conn.json_decoder is None
+    expected = h2o.api(endpoint)["models"][0]["output"]
+    try:
+        # Any decoder returning plain dicts and lists gives the same objects as the default decoding
+        conn.json_decoder = json.loads
+        output = h2o.api(endpoint)["models"][0]["output"]
+    finally:
+        conn.json_decoder = None
+
+    check_same_output(output, expected)
+
+    # Lazily decoded responses give the same objects, built when first accessed
+    try:
+        conn.lazy_responses = True
+        model = h2o.api(endpoint)["models"][0]
+        assert isinstance(model, H2OLazyResponse)
+        assert type(dict.__getitem__(model, "output")) is dict  # not converted yet
+        output = model["output"]
+        assert isinstance(output, H2OLazyResponse)
+        assert output["model_summary"] is output["model_summary"]
+        check_same_output(output, expected)
+        assert h2o.get_model(gbm.model_id).auc(xval=True) == gbm.auc(xval=True)
+    finally:
+        conn.lazy_responses = False
+
+    # Errors are converted into exceptions as usual
+    try:
+        conn.json_decoder = json.loads
+        h2o.api("GET /3/Models/no_such_model")
+        assert False, "Expected an error for a missing model"
+    except h2o.exceptions.H2OResponseError:
+        pass
+    finally:
+        conn.json_decoder = None
+
+
+def check_same_output(output, expected):
+    assert sorted(output) == sorted(expected)
+    for name in ["model_summary", "scoring_history", "variable_importances", "cross_validation_metrics_summary"]:
+        assert isinstance(output[name], H2OTwoDimTable), name
+        assert output[name].col_header == expected[name].col_header
+        assert output[name].as_data_frame().equals(expected[name].as_data_frame()), name
+    for name in ["training_metrics", "cross_validation_metrics"]:
+        assert isinstance(output[name], H2OBinomialModelMetrics), name
+        assert output[name].auc() == expected[name].auc()
+        assert output[name].metric("f1", [0.5]) == expected[name].metric("f1", [0.5])
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(json_decoder)
+else:
+    json_decoder()
@@ -0,0 +1,61 @@
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../../")
+import warnings
+import h2o
+from tests import pyunit_utils
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+from io import StringIO
+
+
+def metric_values():
+    prostate = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate.csv"))
+    prostate["CAPSULE"] = prostate["CAPSULE"].asfactor()
+    gbm = H2OGradientBoostingEstimator(ntrees=10, seed=1)
+    gbm.train(x=["AGE", "RACE", "PSA", "VOL", "GLEASON"], y="CAPSULE", training_frame=prostate)
+    perf = gbm.model_performance(train=True)
+
+    table = perf._metric_json["thresholds_and_metric_scores"]
+    thresholds = [float(row[0]) for row in table.cell_values]
+    for idx, t in enumerate(thresholds):
+        assert thresholds.index(t) == perf.find_idx_by_threshold(t)
+
+    # Thresholds that are not in the table are looked up as the closest ones
+    queries = thresholds + [i / 100.0 for i in range(101)]
+    closest = [min(range(len(thresholds)), key=lambda i: abs(thresholds[i] - t)) for t in queries]
+    assert [perf.find_idx_by_threshold(t) for t in queries] == closest
+    f1 = table["f1"]
+    assert [v for _, v in perf.metric("f1", thresholds=queries)] == [f1[i] for i in closest]
+
+    # The thresholds not in the table are reported with a single warning, instead of a message for each of them
+    stdout = sys.stdout
+    sys.stdout = output = StringIO()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert list(perf.metric_values("f1", queries)) == [f1[i] for i in closest]
+    finally:
+        sys.stdout = stdout
+    assert output.getvalue() == "", output.getvalue()
+    assert len(caught) == 1 and "closest thresholds" in str(caught[0].message), [str(w.message) for w in caught]
+
+    # ... and a single threshold with a warning as well
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        idx = perf.find_idx_by_threshold(0.123456789)
+    assert idx == min(range(len(thresholds)), key=lambda i: abs(thresholds[i] - 0.123456789))
+    assert len(caught) == 1 and "closest threshold found" in str(caught[0].message), [str(w.message) for w in caught]
+
+    max_f1 = perf.find_threshold_by_max_metric("f1")
+    assert perf.metric("f1") == [[max_f1, max(f1)]]
+    try:
+        perf.metric_values("f1", [0.5, 1.5])
+        assert False, "Expected an error for a threshold out of range"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(metric_values)
+else:
+    metric_values()
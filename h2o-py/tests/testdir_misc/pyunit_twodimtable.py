@@ -31,4 +31,44 @@ def test_table():
         pass
 
 
+def test_table_from_server():
+    """Tables received from the server are parsed column-wise, converting the numeric columns."""
+    columns = [{"name": "", "type": "string", "format": "%s"}, {"name": "n", "type": "integer", "format": "%d"},
+               {"name": "x", "type": "double", "format": "%.5f"}, {"name": "y", "type": "double", "format": "%.5f"}]
+    data = [["r%d" % i for i in range(30)], [str(i) for i in range(30)], [i / 4 for i in range(30)],
+            [None if i % 2 else "NaN" for i in range(30)]]
+    tbl = H2OTwoDimTable.make([("name", "Table 3"), ("columns", columns), ("data", data)])
+    assert tbl.col_header == ["", "n", "x", "y"]
+    assert tbl["n"] == list(range(30))
+    assert tbl["x"] == [i / 4 for i in range(30)]
+    assert all(v == "" if i % 2 else v != v for i, v in enumerate(tbl["y"]))
+    assert tbl.cell_values[2][:3] == ("r2", 2, 0.5)
+    assert all(type(v) is int for v in tbl["n"])
+    tbl.show()
+
+    df = tbl.as_data_frame()
+    assert list(df.columns) == tbl.col_header
+    assert df["n"].tolist() == tbl["n"] and df["x"].tolist() == tbl["x"]
+    assert len(tbl[5:10].cell_values) == 5 and tbl["n"] == list(range(5, 10))
+
+
+def test_table_modified():
+    """The columns of the table follow the changes of its rows, and the other way round."""
+    columns = [{"name": "n", "type": "integer", "format": "%d"}, {"name": "x", "type": "double", "format": "%.5f"}]
+    tbl = H2OTwoDimTable.make([("columns", columns), ("data", [["1", "2", "3"], ["0.5", "1.5", "2.5"]])])
+    assert tbl["x"] == [0.5, 1.5, 2.5]
+    tbl.cell_values[1] = (20, 15.0)
+    assert tbl["n"] == [1, 20, 3] and tbl["x"] == [0.5, 15.0, 2.5]
+    assert tbl.as_data_frame()["n"].tolist() == [1, 20, 3]
+
+    tbl["y"] = [7, 8, 9]
+    assert tbl.col_header == ["n", "x", "y"]
+    assert tbl.cell_values == [[1, 0.5, 7], [20, 15.0, 8], [3, 2.5, 9]]
+    tbl.cell_values[0][2] = 70
+    assert tbl["y"] == [70, 8, 9]
+    assert tbl[1:].cell_values == [[20, 15.0, 8], [3, 2.5, 9]] and tbl["n"] == [20, 3]
+
+
 test_table()
+test_table_from_server()
+test_table_modified()
@@ -7,8 +7,9 @@ import math
 
 from h2o import H2OFrame
 from h2o.exceptions import H2OTypeError, H2OValueError
-from h2o.utils.typechecks import (U, I, NOT, Tuple, Dict, numeric, h2oframe, pandas_dataframe, numpy_ndarray,
-                                  assert_is_type, assert_matches, assert_satisfies)
+from h2o.utils import typechecks
+from h2o.utils.typechecks import (U, I, NOT, Tuple, Dict, Enum, BoundInt, numeric, h2oframe, pandas_dataframe,
+                                  numpy_ndarray, assert_is_type, assert_matches, assert_satisfies, is_type, trusted)
 
 
 # noinspection PyUnresolvedReferences,PyClassHasNoInit
@@ -148,5 +149,44 @@ def test_asserts():
         pass
 
 
+def test_compiled_checkers():
+    """Test the caching of compiled checkers, and the trusted mode."""
+    # Types constructed anew on each call are equal, so that they share the compiled checker
+    assert Enum("a", "b") == Enum("a", "b") and hash(Enum("a", "b")) == hash(Enum("a", "b"))
+    assert U(int, None) == U(int, None) and U(int, None) != I(int, None) and Enum("a") != Enum("b")
+    assert BoundInt(1) == BoundInt(1) and BoundInt(1) != BoundInt(1, 5)
+    typechecks._checkers.clear()
+    for i in range(10):
+        assert_is_type("Bernoulli", None, Enum("auto", "bernoulli"))
+        assert_is_type(i, None, BoundInt(0))
+        assert_is_type([i], None, [int])
+        assert_is_type(i, I(int, lambda x: x >= 0))
+    cached = len(typechecks._checkers)
+    assert_is_type(5, None, Enum("auto", "bernoulli"), BoundInt(0))
+    assert len(typechecks._checkers) == cached + 1
+    assert not is_type("poisson", None, Enum("auto", "bernoulli"))
+    assert not is_type(-1, None, BoundInt(0))
+    assert not is_type(["1"], None, [int])
+    assert not is_type(-1, I(int, lambda x: x >= 0))
+
+    # Literals are compared by value, even when equal specs share a checker
+    assert is_type(1, 1) and is_type(True, 1) and is_type(1.0, True) and not is_type(2, 1)
+    assert is_type("a", "b", "a") and not is_type("c", "b", "a")
+
+    # Checks are skipped in trusted mode (but is_type() still works)
+    with trusted():
+        assert_is_type(3, str)
+        with trusted():
+            assert_is_type(3, [str])
+        assert_is_type(3, None)
+        assert not is_type(3, str)
+    try:
+        assert_is_type(3, str)
+        assert False, "Failed to throw an exception"
+    except H2OTypeError:
+        pass
+
+
 # This test doesn't really need a connection to H2O cluster.
 test_asserts()
+test_compiled_checkers()
@@ -0,0 +1,50 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import zlib
+import h2o
+from h2o.exceptions import H2OResponseError
+from h2o.frame import _upload_file_id, _upload_file_parts
+from tests import pyunit_utils
+
+
+def upload_file_parts():
+    path = pyunit_utils.locate("smalldata/logreg/prostate.csv")
+    part_size = 2000
+    nparts = (os.path.getsize(path) + part_size - 1) // part_size
+    expected = h2o.upload_file(path)
+    hc = h2o.connection()
+
+    # Parts are uploaded in parallel, gzip-compressed, and assembled into the same raw data
+    rawkey = _upload_file_parts(path, part_size, nthreads=3, compress=True)
+    fr = h2o.H2OFrame()
+    fr._parse(rawkey)
+    assert fr.names == expected.names
+    pyunit_utils.compare_numeric_frames(fr, expected, prob=1)
+
+    # A part whose content doesn't match its checksum is rejected
+    try:
+        h2o.api("POST /3/PostFilePart?upload_id=bad_upload&part=0&checksum=1234", filename=(b for b in [b"1,2\n"]))
+        assert False, "Expected the part to be rejected"
+    except H2OResponseError as e:
+        assert "Checksum mismatch" in str(e)
+
+    # An interrupted upload is resumed: only the missing parts are sent
+    with open(path, "rb") as f:
+        first_part = f.read(part_size)
+    h2o.api("POST /3/PostFilePart?upload_id=%s&part=0&checksum=%x"
+            % (_upload_file_id(path, part_size), zlib.crc32(first_part) & 0xffffffff),
+            filename=(b for b in [first_part]))
+    rest = hc.requests_count
+    rawkey = _upload_file_parts(path, part_size)
+    assert hc.requests_count - rest == nparts + 1, "Expected %d requests" % (nparts + 1)
+    fr = h2o.H2OFrame()
+    fr._parse(rawkey)
+    pyunit_utils.compare_numeric_frames(fr, expected, prob=1)
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(upload_file_parts)
+else:
+    upload_file_parts()
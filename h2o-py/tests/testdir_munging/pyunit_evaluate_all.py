@@ -0,0 +1,47 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import h2o
+from tests import pyunit_utils
+
+
+def evaluate_all():
+    iris = h2o.import_file(path=pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    hc = h2o.connection()
+
+    derived = [iris["sepal_len"] * i for i in range(10)] + [iris[iris["class"] == "Iris-setosa", :]]
+    rest = hc.requests_count
+    h2o.evaluate_all(derived)
+    assert [fr.nrows for fr in derived] == [150] * 10 + [50]
+    assert [fr.ncols for fr in derived] == [1] * 10 + [5]
+    assert derived[-1].names == iris.names and derived[-1].types == iris.types
+    assert derived[3].types == {"sepal_len": "real"}
+    assert hc.requests_count - rest == 1, "Expected a single request, got %d" % (hc.requests_count - rest)
+    assert derived[2].as_data_frame(use_pandas=False)[1] == ["10.2"]
+
+    # equal expressions are computed once, but each frame gets its own key and metadata
+    a = iris["petal_len"] * 2
+    twins = [a + 1, a + 1]
+    rest = hc.requests_count
+    h2o.evaluate_all(twins)
+    assert hc.requests_count - rest == 1, "Expected a single request, got %d" % (hc.requests_count - rest)
+    assert [fr.nrows for fr in twins] == [150, 150] and twins[0].names == twins[1].names
+    assert twins[0].frame_id != twins[1].frame_id
+    assert hc.requests_count - rest == 1, "Expected no more requests, got %d" % (hc.requests_count - rest - 1)
+    assert twins[0].as_data_frame(use_pandas=False) == twins[1].as_data_frame(use_pandas=False)
+
+    # frames derived within the batch block are computed when it exits
+    with h2o.batch():
+        logs = [iris[col].log() for col in iris.names[:4]]
+        assert all(log._ex._cache._id is None for log in logs)
+    rest = hc.requests_count
+    assert [log.nrows for log in logs] == [150] * 4
+    assert hc.requests_count == rest
+    pyunit_utils.compare_numeric_frames(logs[0], iris["sepal_len"].log(), prob=1)
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(evaluate_all)
+else:
+    evaluate_all()
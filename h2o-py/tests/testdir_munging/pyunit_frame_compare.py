@@ -0,0 +1,27 @@
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def test_frame_compare():
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    diffs = iris.compare(iris)
+    assert [d["column"] for d in diffs] == iris.names
+    assert all(d["mismatches"] == 0 and d["first_mismatch"] is None and d["values"] is None for d in diffs), diffs
+
+    a = h2o.H2OFrame({"x": [1.0, 2.0, 3.0, None], "s": ["a", "b", "c", "d"]}, column_types=["numeric", "string"])
+    b = h2o.H2OFrame({"x": [1.0, 2.0000001, 4.0, 5.0], "s": ["a", "b", "e", "d"]}, column_types=["numeric", "enum"])
+    x, s = a.compare(b, tol=1e-6)
+    assert x["mismatches"] == 2 and x["na_mismatches"] == 1, x
+    assert x["first_mismatch"] == 2 and x["values"] == ("3.0", "4.0"), x
+    assert abs(x["max_abs_error"] - 1.0) < 1e-12 and abs(x["max_rel_error"] - 0.25) < 1e-12, x
+    assert s["mismatches"] == 1 and s["first_mismatch"] == 2 and s["values"] == ("c", "e"), s
+    x, _ = a.compare(b, tol=0)
+    assert x["mismatches"] == 3 and x["first_mismatch"] == 1, x
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(test_frame_compare)
+else:
+    test_frame_compare()
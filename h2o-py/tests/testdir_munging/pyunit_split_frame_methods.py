@@ -0,0 +1,48 @@
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+
+
+def split_frame_methods():
+    iris = h2o.import_file(pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    iris["id"] = h2o.H2OFrame.from_python(list(range(iris.nrow)))
+    nrow = iris.nrow
+
+    def ids(frames):
+        return [[int(row[0]) for row in fr["id"].as_data_frame(use_pandas=False, header=False)] for fr in frames]
+
+    # Random split: a partition of the rows, identical for the same seed, matching the runif() filter
+    train, valid, test = iris.split_frame([0.6, 0.2], seed=1234)
+    parts = ids([train, valid, test])
+    assert sorted(sum(parts, [])) == list(range(nrow))
+    assert ids(iris.split_frame([0.6, 0.2], seed=1234)) == parts
+    r = iris.runif(seed=1234)
+    assert ids([iris[r <= 0.6]]) == parts[:1]
+    assert ids([iris[r > 0.8]]) == parts[2:]
+
+    # Exact split: the sizes of the splits are the ratios times the number of rows
+    splits = iris.split_frame([0.6, 0.2], seed=1234, method="exact")
+    assert [fr.nrow for fr in splits] == [90, 30, 30]
+    assert sorted(sum(ids(splits), [])) == list(range(nrow))
+
+    # Stratified split: every split has the same proportion of each class (50 rows per class)
+    train, test = iris.split_frame([0.8], seed=1234, stratify_by="class", destination_frames=["tr.hex", "te.hex"])
+    assert train.frame_id == "tr.hex" and test.frame_id == "te.hex"
+    assert train["class"].table().as_data_frame(use_pandas=False)[1:] == \
+        [["Iris-setosa", "40"], ["Iris-versicolor", "40"], ["Iris-virginica", "40"]]
+    assert test.nrow == 30
+    assert train.names == iris.names and train.types == iris.types
+
+    try:
+        iris.split_frame([0.5], method="stratified")
+        assert False, "Expected an error for a stratified split without a column"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(split_frame_methods)
+else:
+    split_frame_methods()
@@ -0,0 +1,70 @@
+from __future__ import print_function
+import sys, os
+
+sys.path.insert(1, os.path.join("..", ".."))
+import gc
+import time
+import h2o
+from h2o.expr import ExprNode
+from tests import pyunit_utils
+
+
+def temps_gc():
+    iris = h2o.import_file(path=pyunit_utils.locate("smalldata/iris/iris_wheader.csv"))
+    hc = h2o.connection()
+
+    h2o.set_temps_gc(batch_size=1000, flush_interval=3600)
+    try:
+        tmp_ids = []
+        for i in range(10):
+            tmp = iris["sepal_len"] + i
+            tmp.nrow  # force evaluation, which assigns a temporary key to the frame
+            tmp_ids.append(tmp.frame_id)
+        del tmp
+        gc.collect()
+
+        # the temporaries are only queued for removal, not removed one by one
+        rest = hc.requests_count
+        keys = [f["frame_id"]["name"] for f in h2o.api("GET /3/Frames")["frames"]]
+        assert all(tmp_id in keys for tmp_id in tmp_ids)
+
+        assert h2o.flush_temps() == 10
+        keys = [f["frame_id"]["name"] for f in h2o.api("GET /3/Frames")["frames"]]
+        assert not any(tmp_id in keys for tmp_id in tmp_ids)
+        assert hc.requests_count - rest == 3, "Expected a single removal request"
+        assert h2o.flush_temps() == 0
+
+        # keys of a failed removal stay queued for the next flush
+        rapids = ExprNode.rapids
+        ExprNode.rapids = staticmethod(lambda expr: h2o.api("POST /99/Rapids", data={"ast": "(bogus)"}))
+        try:
+            tmp = iris["sepal_len"] * 2
+            tmp.nrow
+            tmp_id = tmp.frame_id
+            del tmp
+            gc.collect()
+            assert ExprNode._temps.flush(quiet=True) == 0
+            assert len(ExprNode._temps) == 1
+        finally:
+            ExprNode.rapids = rapids
+        assert h2o.flush_temps() == 1
+        assert tmp_id not in [f["frame_id"]["name"] for f in h2o.api("GET /3/Frames")["frames"]]
+
+        # an idle session still removes its temporaries once the flush interval has passed
+        h2o.set_temps_gc(flush_interval=1)
+        tmp = iris["sepal_len"] - 1
+        tmp.nrow
+        tmp_id = tmp.frame_id
+        del tmp
+        gc.collect()
+        time.sleep(3)
+        assert len(ExprNode._temps) == 0
+        assert tmp_id not in [f["frame_id"]["name"] for f in h2o.api("GET /3/Frames")["frames"]]
+    finally:
+        h2o.set_temps_gc(batch_size=100, flush_interval=10.0)
+
+
+if __name__ == "__main__":
+    pyunit_utils.standalone_test(temps_gc)
+else:
+    temps_gc()